@@ -0,0 +1,69 @@
+"""
+City distances benchmark: travel distance of every fixture of a world matchday, per-fixture
+Python haversine against CityDistances (vectorized batch, then cached lookups).
+
+Run from the repository root:
+    python -m benchmarks.city_distances --leagues 200 --teams 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.services.distances import CityDistances
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint, haversine_km
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leagues", type=int, default=200)
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--matchdays", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    teams = args.leagues * args.teams
+    points = {city_id: GeoPoint(float(lat), float(lon)) for city_id, lat, lon in zip(
+        range(1, teams + 1), rng.uniform(-60, 70, teams), rng.uniform(-180, 180, teams)
+    )}
+    city_by_team = {team: team for team in points}
+    matchdays = []
+    for _ in range(args.matchdays):
+        fixtures = []
+        for league in range(args.leagues):
+            order = rng.permutation(args.teams) + league * args.teams + 1
+            fixtures += [Fixture(home_team_id=int(h), away_team_id=int(a)) for h, a in zip(order[::2], order[1::2])]
+        matchdays.append(fixtures)
+    fixtures_count = sum(len(f) for f in matchdays)
+
+    start = time.perf_counter()
+    for fixtures in matchdays:
+        [haversine_km(points[f.home_team_id].latitude, points[f.home_team_id].longitude,
+                      points[f.away_team_id].latitude, points[f.away_team_id].longitude) for f in fixtures]
+    python_time = time.perf_counter() - start
+
+    distances = CityDistances(points)
+    start = time.perf_counter()
+    for fixtures in matchdays:
+        distances.travel_km(fixtures, city_by_team)
+    cold_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for fixtures in matchdays:
+        distances.travel_km(fixtures, city_by_team)
+    warm_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for league in range(args.leagues):
+        distances.matrix(range(league * args.teams + 1, (league + 1) * args.teams + 1))
+    dense_time = time.perf_counter() - start
+
+    print(f"{fixtures_count} fixtures over {args.matchdays} matchdays")
+    print(f"python haversine   {python_time:.3f}s")
+    print(f"vectorized (cold)  {cold_time:.3f}s")
+    print(f"cached lookups     {warm_time:.3f}s")
+    print(f"{args.leagues} dense league matrices in {dense_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Country list benchmark: CountryService.get_by_continent through each projection
+(entities + validated read models, model_construct read models, row tuples).
+
+Run from the repository root:
+    python -m benchmarks.country_projections --countries 20000
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from champyons.adapters.persistence.sqlalchemy.base import Base
+from champyons.adapters.persistence.sqlalchemy.models.continent import Continent
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.repositories.country_repository import SqlAlchemyCountryRepository
+from champyons.core.application.dto.helpers.projection import Projection
+from champyons.core.application.services.country_service import CountryService
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--countries", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Continent), [{"id": 1, "code": "EU", "default_name": "Europe"}])
+        connection.execute(insert(Country), [
+            {"code": f"C{i:06}", "default_name": f"Country {i}", "continent_id": 1} for i in range(args.countries)
+        ])
+
+    for projection in Projection:
+        best = float("inf")
+        for _ in range(args.repeat):
+            with sessionmaker(bind=engine)() as session:
+                service = CountryService(SqlAlchemyCountryRepository(session), translation_service=None)
+                start = time.perf_counter()
+                countries = service.get_by_continent(1, projection=projection)
+                best = min(best, time.perf_counter() - start)
+        print(f"{projection:<11} {len(countries)} countries in {best:.3f}s ({len(countries) / best:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
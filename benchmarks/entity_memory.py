@@ -0,0 +1,65 @@
+"""
+Entity memory benchmark: memory held by N materialized entities of the high-cardinality types,
+slotted dataclasses against dict-backed twins with the same fields (the entities as they were
+before they got __slots__).
+
+Run from the repository root:
+    python -m benchmarks.entity_memory --entities 1000000
+"""
+import argparse
+import dataclasses
+import gc
+import sys
+import time
+import tracemalloc
+
+from champyons.core.domain.entities.geography import City
+from champyons.core.domain.entities.people.player_profile import PlayerProfile
+
+
+def dict_backed(cls):
+    """ Same dataclass (bases, fields, methods, validation) without __slots__ """
+    slots = set(cls.__slots__) | {"__slots__", "__weakref__", "__dict__", "__dataclass_fields__", "__dataclass_params__"}
+    namespace = {name: value for name, value in cls.__dict__.items() if name not in slots}
+    for f in dataclasses.fields(cls):
+        if f.name in cls.__annotations__:
+            namespace[f.name] = dataclasses.field(default=f.default, default_factory=f.default_factory, init=f.init, repr=f.repr, compare=f.compare)
+    return dataclasses.dataclass(type(f"DictBacked{cls.__name__}", cls.__bases__, namespace))
+
+
+def instance_size(entity) -> int:
+    """ Bytes of the instance itself (its __dict__ included), not of the values it holds """
+    return sys.getsizeof(entity) + (sys.getsizeof(entity.__dict__) if hasattr(entity, "__dict__") else 0)
+
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities = [build(i) for i in range(1, count + 1)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, instance_size(entities[0])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases = [
+        (City, lambda cls: lambda i: cls(id=i, name="City", country_id=1, altitude=i, latitude=40.4, longitude=-3.7)),
+        (PlayerProfile, lambda cls: lambda i: cls(id=i, person_id=i)),
+    ]
+    print(f"{args.entities} entities per type")
+    for cls, factory in cases:
+        before, before_time, before_instance = measure(factory(dict_backed(cls)), args.entities)
+        after, after_time, after_instance = measure(factory(cls), args.entities)
+        print(f"{cls.__name__:<14} dict {before / 2**20:8.1f} MiB ({before_time:.2f}s, {before_instance} B instance)  "
+              f"slots {after / 2**20:8.1f} MiB ({after_time:.2f}s, {after_instance} B instance)  "
+              f"-{1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
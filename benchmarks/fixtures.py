@@ -0,0 +1,50 @@
+"""
+Fixture generation benchmark: season start across N double round robin leagues (the whole world
+at once), with cold caches (first run: pairing patterns and matchday dates computed) and warm ones.
+
+Run from the repository root:
+    python -m benchmarks.fixtures --leagues 3000
+"""
+import argparse
+import time
+from datetime import date
+
+from champyons.core.domain.entities.competitions import CompetitionEdition, CompetitionStage, CompetitionTemplate
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.enums.competition import StageFormat
+from champyons.core.domain.services.fixtures import FixtureGenerator, matchday_dates, round_robin_pattern
+
+SEASON = Season(start_date=date(2025, 7, 1), end_date=date(2026, 6, 30))
+
+
+def make_editions(leagues: int, sizes: list[int]) -> list[CompetitionEdition]:
+    stage = CompetitionStage(name="League", format=StageFormat.ROUND_ROBIN, start_day=30, end_day=320)
+    template = CompetitionTemplate(name="League", stages=[stage])
+    editions = []
+    for i in range(leagues):
+        teams = sizes[i % len(sizes)]
+        editions.append(CompetitionEdition(id=i + 1, template=template, season=SEASON, team_ids=list(range(i * 100, i * 100 + teams))))
+    return editions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leagues", type=int, default=3000)
+    parser.add_argument("--teams", type=int, nargs="+", default=[18, 20, 22], help="league sizes, cycled over the leagues")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    round_robin_pattern.cache_clear()
+    matchday_dates.cache_clear()
+    generator = FixtureGenerator()
+    for run in range(args.repeat):
+        editions = make_editions(args.leagues, args.teams)
+        start = time.perf_counter()
+        fixtures = generator.generate_all(editions)
+        elapsed = time.perf_counter() - start
+        label = "cold" if run == 0 else "warm"
+        print(f"{label} {args.leagues} leagues, {fixtures:,} fixtures in {elapsed:.3f}s ({fixtures / elapsed:,.0f} fixtures/s)")
+
+
+if __name__ == "__main__":
+    main()
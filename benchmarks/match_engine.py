@@ -0,0 +1,41 @@
+"""
+Match engine benchmark: simulates a world week of background matches.
+
+Run from the repository root:
+    python -m benchmarks.match_engine --matches 50000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.services.match_engine import MatchEngine
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    teams = 2 * args.matches
+    strengths = {
+        team_id: TeamStrength(attack=float(a), defense=float(d))
+        for team_id, (a, d) in enumerate(np.clip(rng.normal(10, 3, size=(teams, 2)), 0, 20))
+    }
+    fixtures = [Fixture(id=i, home_team_id=2 * i, away_team_id=2 * i + 1) for i in range(args.matches)]
+    engine = MatchEngine()
+
+    for with_events in (False, True):
+        start = time.perf_counter()
+        engine.simulate(fixtures, strengths, rng=args.seed, with_events=with_events)
+        elapsed = time.perf_counter() - start
+        label = "with events" if with_events else "scores only"
+        print(f"{label:<12} {args.matches} matches in {elapsed:.3f}s ({args.matches / elapsed:,.0f} matches/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Sharded simulation benchmark: one world matchday, simulated with 1 and N worker processes.
+
+Run from the repository root:
+    python -m benchmarks.sharded_simulation --nations 200 --teams 20 --workers 4
+"""
+import argparse
+from datetime import date
+import os
+import time
+
+import numpy as np
+
+from champyons.core.application.services.sharded_simulation import ShardedSimulation
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nations", type=int, default=200)
+    parser.add_argument("--teams", type=int, default=20, help="teams per nation")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--days", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    day = date(2025, 8, 16)
+    fixtures, nationality_by_edition = [], {}
+    for nation in range(args.nations):
+        nationality_by_edition[nation] = nation
+        teams = nation * args.teams + rng.permutation(args.teams)
+        fixtures += [
+            Fixture(id=len(fixtures) + i, edition_id=nation, home_team_id=int(teams[2 * i]), away_team_id=int(teams[2 * i + 1]), match_date=day)
+            for i in range(args.teams // 2)
+        ]
+    strengths = {
+        team_id: TeamStrength(attack=float(a), defense=float(d))
+        for team_id, (a, d) in enumerate(np.clip(rng.normal(10, 3, size=(args.nations * args.teams, 2)), 0, 20))
+    }
+
+    for workers in sorted({1, args.workers}):
+        with ShardedSimulation(nationality_by_edition, strengths, workers=workers) as simulation:
+            simulation.simulate_day(day, fixtures) # warm up the pool
+            start = time.perf_counter()
+            for _ in range(args.days):
+                simulation.simulate_day(day, fixtures)
+            elapsed = (time.perf_counter() - start) / args.days
+        print(f"{workers:>2} workers: {len(fixtures)} matches in {elapsed:.3f}s per day")
+
+
+if __name__ == "__main__":
+    main()
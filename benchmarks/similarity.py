@@ -0,0 +1,63 @@
+"""
+Player similarity benchmark: exact brute-force index vs IVF index (recall@k and query latency).
+
+Run from the repository root:
+    python -m benchmarks.similarity --players 200000 --queries 200
+"""
+import argparse
+import time
+
+import numpy as np
+
+from champyons.core.domain.services.similarity import BruteForceSimilarityIndex, IVFSimilarityIndex
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+POSITIONS = [PositionSet.from_positions([code]) for code in ("GK", "CB", "LB", "DM", "LM", "AM", "ST")]
+
+
+def make_players(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    values = np.clip(rng.normal(10, 4, size=(n, 5)), 0, 20)
+    return [(i, PlayerSkills(*row), POSITIONS[i % len(POSITIONS)]) for i, row in enumerate(values)]
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    players = make_players(args.players, args.seed)
+    query_ids = np.random.default_rng(args.seed + 1).choice(args.players, size=args.queries, replace=False)
+
+    brute = BruteForceSimilarityIndex()
+    timed("brute force build", lambda: [brute.upsert(*player) for player in players])
+    ivf = timed("ivf build (train + insert)", lambda: IVFSimilarityIndex.from_players(players, n_lists=args.lists))
+
+    start = time.perf_counter()
+    exact = {int(i): {m.profile_id for m in brute.similar_to(int(i), k=args.k)} for i in query_ids}
+    brute_latency = (time.perf_counter() - start) / args.queries
+    print(f"brute force: {brute_latency * 1000:.3f} ms/query, recall@{args.k} 1.000")
+
+    for nprobe in (1, 4, 8, 16, 32):
+        ivf.nprobe = nprobe
+        start = time.perf_counter()
+        found = {int(i): {m.profile_id for m in ivf.similar_to(int(i), k=args.k)} for i in query_ids}
+        latency = (time.perf_counter() - start) / args.queries
+        recall = np.mean([len(found[i] & exact[i]) / len(exact[i]) for i in exact])
+        print(f"ivf nprobe={nprobe:<3}: {latency * 1000:.3f} ms/query, recall@{args.k} {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Save-game snapshots
+
+Binary, compressed and columnar save files. Each table is stored column by column in chunks of rows,
+so loading a snapshot maps the file and only decodes the chunks that are actually read.
+
+Modules:
+--------
+- format: generic snapshot file format (writer, reader, lazy tables)
+- game_snapshot: mapping of game entities to snapshot tables
+- journal: append-only log of daily changes
+- autosave: incremental saves (base snapshot + journal) of dirty-tracked entities
+"""
+
+from .format import Column, ColumnKind, SnapshotFormatError, SnapshotReader, SnapshotTable, SnapshotWriter
+from .game_snapshot import GameSnapshot, GameSnapshotData, write_game_snapshot
+from .journal import ChangeJournal, ChangeOp, JournalChange, JournalRecord
+from .autosave import Autosave
+
+__all__ = [
+    "Column",
+    "ColumnKind",
+    "SnapshotFormatError",
+    "SnapshotReader",
+    "SnapshotTable",
+    "SnapshotWriter",
+    "GameSnapshot",
+    "GameSnapshotData",
+    "write_game_snapshot",
+    "ChangeJournal",
+    "ChangeOp",
+    "JournalChange",
+    "JournalRecord",
+    "Autosave",
+]
@@ -0,0 +1,163 @@
+"""
+Incremental autosave
+
+A save slot made of a base snapshot and a change journal. Entities are tracked with
+DirtyTrackingMixin: each autosave journals only the entities modified (or added/removed) since
+the previous one, so its cost follows the day's changes instead of the size of the world. Every
+`compact_every` days the journal is folded into a new base snapshot.
+
+Usage:
+------
+    autosave = Autosave(save_dir)
+    autosave.save_full(data)                    # base snapshot; starts tracking data's entities
+    ... simulate a day ...
+    autosave.add(new_profile)                   # entities created during the day
+    autosave.save_day(game_state.sim_date)      # journals what changed
+
+    data = Autosave(save_dir).load()            # later: replays the journal and loads the world
+"""
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from champyons.core.domain.entities.game.game_state import GameState
+
+from .format import SnapshotReader, SnapshotWriter, DEFAULT_CHUNK_ROWS, decode_row, encode_row
+from .game_snapshot import GameSnapshot, GameSnapshotData, TABLES_BY_ENTITY, entity_tables, write_game_snapshot
+from .journal import ChangeJournal, ChangeOp, JournalChange
+
+GAME_STATE_TABLE = TABLES_BY_ENTITY[GameState].name
+GAME_STATE_KEY = 0 # journal key of the singleton GameState row, whose id is often unset
+
+
+def _journal_key(entity: Any) -> int:
+    if isinstance(entity, GameState):
+        return GAME_STATE_KEY
+    if entity.id is None:
+        raise ValueError(f"{type(entity).__name__} must have an id before being saved")
+    return entity.id
+
+
+class Autosave:
+    SNAPSHOT_NAME = "world.snap"
+    JOURNAL_NAME = "world.journal"
+
+    def __init__(self, directory: str | Path, compact_every: int = 30, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        if compact_every < 1:
+            raise ValueError("Compaction interval must be at least one day")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+        self.chunk_rows = chunk_rows
+        self.journal = ChangeJournal(self.journal_path)
+        self._data: Optional[GameSnapshotData] = None
+        self._dirty: Dict[int, Any] = {} # id(entity) -> entity
+        self._removed: List[JournalChange] = []
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / self.SNAPSHOT_NAME
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / self.JOURNAL_NAME
+
+    @property
+    def pending(self) -> int:
+        """ Changes waiting for the next autosave """
+        return len(self._dirty) + len(self._removed)
+
+    def track(self, data: GameSnapshotData) -> None:
+        """ Marks every entity of the game as saved and starts collecting the ones that change """
+        self._data = data
+        self._dirty.clear()
+        self._removed.clear()
+        for _, entities in entity_tables(data):
+            for entity in entities:
+                entity.mark_clean(self._on_dirty)
+
+    def add(self, entity: Any) -> None:
+        """ Registers an entity created since the last save """
+        table = TABLES_BY_ENTITY[type(entity)].name
+        self._removed = [c for c in self._removed if (c.table, c.key) != (table, entity.id)]
+        self._dirty[id(entity)] = entity
+
+    def remove(self, entity: Any) -> None:
+        """ Registers an entity deleted since the last save """
+        self._dirty.pop(id(entity), None)
+        self._removed.append(JournalChange(TABLES_BY_ENTITY[type(entity)].name, ChangeOp.DELETE, entity.id))
+
+    def save_full(self, data: GameSnapshotData) -> None:
+        """ Writes a new base snapshot and empties the journal """
+        write_game_snapshot(self.snapshot_path, data, self.chunk_rows)
+        self.journal.reset()
+        self.track(data)
+
+    def save_day(self, day: date) -> int:
+        """ Journals the changes since the last save. Returns the number of changed rows """
+        if self._data is None:
+            raise ValueError("Nothing is tracked: save or load a full game first")
+        if self._data.game_state.is_simulation_running:
+            raise ValueError("Game must be paused before saving")
+
+        changes: List[JournalChange] = []
+        for entity in self._dirty.values():
+            spec = TABLES_BY_ENTITY[type(entity)]
+            changes.append(JournalChange(spec.name, ChangeOp.UPSERT, _journal_key(entity), encode_row(spec.columns, spec.row(entity))))
+        changes.extend(self._removed)
+
+        self.journal.append(day, changes)
+        for entity in self._dirty.values():
+            entity.mark_clean(self._on_dirty)
+        self._dirty.clear()
+        self._removed.clear()
+
+        if len(self.journal) >= self.compact_every:
+            self.compact()
+        return len(changes)
+
+    def compact(self) -> None:
+        """
+        Applies the journal to the base snapshot. Tables that changed are decoded and rewritten, the
+        others are copied chunk by chunk without decompressing them
+        """
+        if not self.snapshot_path.exists():
+            raise ValueError(f"No base snapshot in {self.directory}")
+        if not len(self.journal):
+            return
+
+        changes: Dict[str, List[JournalChange]] = {}
+        for record in self.journal.records():
+            for change in record.changes:
+                changes.setdefault(change.table, []).append(change)
+
+        # The reader is closed before the writer replaces the snapshot file
+        with SnapshotWriter(self.snapshot_path, chunk_rows=self.chunk_rows) as writer:
+            with SnapshotReader(self.snapshot_path) as reader:
+                writer.metadata.update(reader.metadata)
+                for name in reader.table_names:
+                    table = reader.table(name)
+                    if name not in changes:
+                        writer.copy_table(table)
+                        continue
+                    rows = {GAME_STATE_KEY if name == GAME_STATE_TABLE else row["id"]: row for row in table.rows()}
+                    for change in changes[name]:
+                        if change.op == ChangeOp.DELETE:
+                            rows.pop(change.key, None)
+                        else:
+                            rows[change.key] = decode_row(table.columns, change.values)
+                    if name == GAME_STATE_TABLE:
+                        writer.metadata["sim_date"] = next(iter(rows.values()))["sim_date"].isoformat()
+                    writer.add_table(name, table.columns, {c.name: [row[c.name] for row in rows.values()] for c in table.columns})
+        self.journal.reset()
+
+    def load(self) -> GameSnapshotData:
+        """ Loads the game (compacting a pending journal first) and starts tracking it """
+        self.compact()
+        with GameSnapshot(self.snapshot_path) as snapshot:
+            data = snapshot.load()
+        self.track(data)
+        return data
+
+    def _on_dirty(self, entity: Any) -> None:
+        self._dirty[id(entity)] = entity
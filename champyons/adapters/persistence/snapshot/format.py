@@ -0,0 +1,352 @@
+"""
+Snapshot container format
+
+A snapshot file stores named tables in columnar form. Each table is split into row chunks and
+every column of a chunk is compressed independently (zlib), so a reader only decompresses the
+columns and chunks it actually touches.
+
+Layout:
+-------
+    MAGIC
+    column chunk blobs...
+    table of contents (zlib-compressed JSON): tables, columns, chunk offsets and metadata
+    footer: TOC offset (u64), TOC length (u64), MAGIC
+
+Files are read through mmap; decoding is lazy and per chunk. Writes go to a temporary file that
+replaces the target once complete, so a crash never leaves a half-written snapshot behind.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, UTC
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"CHSNAP01"
+FORMAT_VERSION = 1
+DEFAULT_CHUNK_ROWS = 65_536
+
+_FOOTER = struct.Struct("<QQ8s")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class SnapshotFormatError(ValueError):
+    """ The file is not a snapshot or is corrupted """
+
+
+class ColumnKind(StrEnum):
+    INT = "int"
+    FLOAT = "float"
+    BOOL = "bool"
+    STR = "str"
+    DATE = "date"
+    DATETIME = "datetime" # stored as UTC microseconds, loaded as aware UTC datetimes
+    JSON = "json" # any JSON-serializable value
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    kind: ColumnKind
+
+
+# --------------------
+# Column encoding
+# --------------------
+_NUMPY_DTYPES = {
+    ColumnKind.INT: np.int64,
+    ColumnKind.FLOAT: np.float64,
+    ColumnKind.BOOL: np.bool_,
+    ColumnKind.DATE: np.int64,
+    ColumnKind.DATETIME: np.int64,
+}
+
+
+def _to_storage(kind: ColumnKind, value: Any) -> Any:
+    if kind == ColumnKind.DATE:
+        return value.toordinal()
+    if kind == ColumnKind.DATETIME:
+        delta = (value if value.tzinfo else value.replace(tzinfo=UTC)) - _EPOCH
+        return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return value
+
+
+def _from_storage(kind: ColumnKind, value: Any) -> Any:
+    if kind == ColumnKind.DATE:
+        return date.fromordinal(value)
+    if kind == ColumnKind.DATETIME:
+        return _EPOCH + timedelta(microseconds=value)
+    return value
+
+
+def encode_row(columns: Sequence[Column], row: Mapping[str, Any]) -> List[Any]:
+    """ JSON-serializable values of a row, in column order """
+    return [None if row[c.name] is None else _to_storage(c.kind, row[c.name]) for c in columns]
+
+
+def decode_row(columns: Sequence[Column], values: Sequence[Any]) -> Dict[str, Any]:
+    return {c.name: None if v is None else _from_storage(c.kind, v) for c, v in zip(columns, values)}
+
+
+def _encode_values(kind: ColumnKind, values: Sequence[Any]) -> tuple[bytes, Optional[bytes]]:
+    """ Returns (values blob, null mask blob or None) """
+    nulls = np.fromiter((v is None for v in values), dtype=np.bool_, count=len(values))
+    mask = nulls.tobytes() if nulls.any() else None
+
+    if kind in _NUMPY_DTYPES:
+        if isinstance(values, np.ndarray) and mask is None and kind in (ColumnKind.INT, ColumnKind.FLOAT, ColumnKind.BOOL):
+            return np.ascontiguousarray(values, dtype=_NUMPY_DTYPES[kind]).tobytes(), None
+        array = np.array([0 if v is None else _to_storage(kind, v) for v in values], dtype=_NUMPY_DTYPES[kind])
+        return array.tobytes(), mask
+
+    texts = [
+        b"" if v is None else (v if kind == ColumnKind.STR else json.dumps(v, ensure_ascii=False, separators=(",", ":"))).encode("utf-8")
+        for v in values
+    ]
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(t) for t in texts], out=offsets[1:])
+    return offsets.tobytes() + b"".join(texts), mask
+
+
+def _decode_values(kind: ColumnKind, rows: int, blob: bytes, mask: Optional[np.ndarray]) -> Sequence[Any]:
+    if kind in (ColumnKind.INT, ColumnKind.FLOAT, ColumnKind.BOOL):
+        array = np.frombuffer(blob, dtype=_NUMPY_DTYPES[kind], count=rows)
+        if mask is None:
+            return array
+        values = array.tolist()
+        return [None if null else v for v, null in zip(values, mask.tolist())]
+
+    if kind == ColumnKind.DATE:
+        ordinals = np.frombuffer(blob, dtype=np.int64, count=rows).tolist()
+        return [date.fromordinal(o) for o in ordinals] if mask is None else [None if null else date.fromordinal(o) for o, null in zip(ordinals, mask.tolist())]
+
+    if kind == ColumnKind.DATETIME:
+        micros = np.frombuffer(blob, dtype=np.int64, count=rows).tolist()
+        convert = lambda us: _EPOCH + timedelta(microseconds=us)
+        return [convert(us) for us in micros] if mask is None else [None if null else convert(us) for us, null in zip(micros, mask.tolist())]
+
+    offsets = np.frombuffer(blob, dtype=np.int64, count=rows + 1).tolist()
+    data = memoryview(blob)[(rows + 1) * 8:]
+    texts = [bytes(data[offsets[i]:offsets[i + 1]]).decode("utf-8") for i in range(rows)]
+    values: List[Any] = texts if kind == ColumnKind.STR else [json.loads(t) if t else None for t in texts]
+    if mask is not None:
+        values = [None if null else v for v, null in zip(values, mask.tolist())]
+    return values
+
+
+# --------------------
+# Writer
+# --------------------
+class SnapshotWriter:
+    """
+    Usage:
+    ------
+        with SnapshotWriter(path, metadata={"sim_date": "2025-07-01"}) as writer:
+            writer.add_table("city", [Column("id", ColumnKind.INT), ...], {"id": ids, ...})
+    """
+    def __init__(self, path: str | Path, metadata: Optional[Mapping[str, Any]] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS, compression_level: int = 6):
+        if chunk_rows < 1:
+            raise ValueError("Chunk rows must be a positive integer")
+        self.path = Path(path)
+        self.chunk_rows = chunk_rows
+        self.compression_level = compression_level
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(MAGIC)
+        self._toc: Dict[str, Any] = {"version": FORMAT_VERSION, "metadata": dict(metadata or {}), "tables": {}}
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """ Metadata stored in the table of contents. Can be updated until the writer is closed """
+        return self._toc["metadata"]
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def add_table(self, name: str, columns: Sequence[Column], data: Mapping[str, Sequence[Any]]) -> None:
+        if name in self._toc["tables"]:
+            raise ValueError(f"Table {name} already written")
+        lengths = {len(data[c.name]) for c in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of table {name} have different lengths")
+        rows = lengths.pop() if lengths else 0
+
+        chunks = []
+        for start in range(0, rows, self.chunk_rows):
+            stop = min(start + self.chunk_rows, rows)
+            chunk: Dict[str, Any] = {"rows": stop - start, "columns": {}}
+            for column in columns:
+                values, mask = _encode_values(column.kind, data[column.name][start:stop])
+                entry = {"values": self._write_blob(values)}
+                if mask is not None:
+                    entry["nulls"] = self._write_blob(mask)
+                chunk["columns"][column.name] = entry
+            chunks.append(chunk)
+
+        self._toc["tables"][name] = {
+            "rows": rows,
+            "columns": [{"name": c.name, "kind": str(c.kind)} for c in columns],
+            "chunks": chunks,
+        }
+
+    def copy_table(self, table: "SnapshotTable") -> None:
+        """ Copies a table of another snapshot as it is stored: compressed chunks are not decoded """
+        if table.name in self._toc["tables"]:
+            raise ValueError(f"Table {table.name} already written")
+        chunks = []
+        for chunk in table._chunks:
+            columns = {}
+            for name, entry in chunk["columns"].items():
+                columns[name] = {key: self._write_raw(table.reader._read_raw(location)) for key, location in entry.items()}
+            chunks.append({"rows": chunk["rows"], "columns": columns})
+        self._toc["tables"][table.name] = {
+            "rows": len(table),
+            "columns": [{"name": c.name, "kind": str(c.kind)} for c in table.columns],
+            "chunks": chunks,
+        }
+
+    def close(self) -> None:
+        toc = zlib.compress(json.dumps(self._toc).encode("utf-8"), self.compression_level)
+        toc_offset = self._file.tell()
+        self._file.write(toc)
+        self._file.write(_FOOTER.pack(toc_offset, len(toc), MAGIC))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def _write_blob(self, blob: bytes) -> tuple[int, int]:
+        return self._write_raw(zlib.compress(blob, self.compression_level))
+
+    def _write_raw(self, compressed: bytes) -> tuple[int, int]:
+        offset = self._file.tell()
+        self._file.write(compressed)
+        return offset, len(compressed)
+
+
+# --------------------
+# Reader
+# --------------------
+class SnapshotTable:
+    """ Lazy view over a table: chunks are decompressed on first access to each column """
+    def __init__(self, reader: "SnapshotReader", name: str, info: Mapping[str, Any]):
+        self.reader = reader
+        self.name = name
+        self.columns = [Column(c["name"], ColumnKind(c["kind"])) for c in info["columns"]]
+        self._kinds = {c.name: c.kind for c in self.columns}
+        self._chunks = info["chunks"]
+        self._rows = info["rows"]
+        self._cache: Dict[tuple[str, int], Sequence[Any]] = {}
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def chunk(self, column: str, index: int) -> Sequence[Any]:
+        """ Values of a column in a chunk. Numeric columns without nulls are numpy arrays over the decoded buffer """
+        key = (column, index)
+        if key not in self._cache:
+            if column not in self._kinds:
+                raise KeyError(f"Table {self.name} has no column {column}")
+            chunk = self._chunks[index]
+            entry = chunk["columns"][column]
+            mask = None
+            if "nulls" in entry:
+                mask = np.frombuffer(self.reader._read_blob(entry["nulls"]), dtype=np.bool_, count=chunk["rows"])
+            self._cache[key] = _decode_values(self._kinds[column], chunk["rows"], self.reader._read_blob(entry["values"]), mask)
+        return self._cache[key]
+
+    def column(self, name: str) -> Sequence[Any]:
+        """ Whole column. Numeric columns without nulls are returned as a single numpy array """
+        parts = [self.chunk(name, i) for i in range(self.chunk_count)]
+        if parts and all(isinstance(p, np.ndarray) for p in parts):
+            return np.concatenate(parts)
+        return [v for part in parts for v in (part.tolist() if isinstance(part, np.ndarray) else part)]
+
+    def rows(self, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """ Iterates rows as dicts, decoding one chunk at a time """
+        names = list(columns) if columns is not None else [c.name for c in self.columns]
+        for index in range(self.chunk_count):
+            values = [self.chunk(name, index) for name in names]
+            values = [v.tolist() if isinstance(v, np.ndarray) else v for v in values]
+            for row in zip(*values):
+                yield dict(zip(names, row))
+            for name in names:
+                self._cache.pop((name, index), None)
+
+
+class SnapshotReader:
+    """ Opens a snapshot through mmap. Only the table of contents is decoded on open """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e: # empty file
+            self._file.close()
+            raise SnapshotFormatError(f"{self.path} is not a snapshot") from e
+
+        if len(self._mmap) < len(MAGIC) + _FOOTER.size or self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise SnapshotFormatError(f"{self.path} is not a snapshot")
+        toc_offset, toc_length, magic = _FOOTER.unpack(self._mmap[-_FOOTER.size:])
+        if magic != MAGIC:
+            self.close()
+            raise SnapshotFormatError(f"{self.path} is truncated")
+
+        toc = json.loads(zlib.decompress(self._mmap[toc_offset:toc_offset + toc_length]))
+        if toc["version"] > FORMAT_VERSION:
+            self.close()
+            raise SnapshotFormatError(f"Unsupported snapshot version {toc['version']}")
+        self.metadata: Dict[str, Any] = toc["metadata"]
+        self._tables = {name: SnapshotTable(self, name, info) for name, info in toc["tables"].items()}
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def table_names(self) -> List[str]:
+        return list(self._tables)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tables
+
+    def table(self, name: str) -> SnapshotTable:
+        if name not in self._tables:
+            raise KeyError(f"Snapshot has no table {name}")
+        return self._tables[name]
+
+    def close(self) -> None:
+        mapped = getattr(self, "_mmap", None)
+        if mapped is not None and not mapped.closed:
+            mapped.close()
+        self._file.close()
+
+    def _read_blob(self, location: Sequence[int]) -> bytes:
+        return zlib.decompress(self._read_raw(location))
+
+    def _read_raw(self, location: Sequence[int]) -> bytes:
+        offset, length = location
+        return self._mmap[offset:offset + length]
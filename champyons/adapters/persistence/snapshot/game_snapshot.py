@@ -0,0 +1,301 @@
+"""
+Game snapshots
+
+Maps a game (GameState, seasons, geography and player profiles) to the columnar snapshot format and
+back. Writing requires the game to be paused, so the snapshot is a consistent point in time.
+
+Loading is lazy: opening a snapshot only reads its table of contents, and each accessor decodes
+just the tables it needs. Bulk consumers can skip entities entirely and read numpy columns through
+`GameSnapshot.table(...)` (e.g. every player's skills as arrays).
+"""
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.entities.geography import City, Continent, Country, LocalRegion, Nationality, Region
+from champyons.core.domain.entities.people import PlayerProfile
+from champyons.core.domain.enums.city import CityPopulationRange
+from champyons.core.domain.enums.nationality import NationalityEntityType
+from champyons.core.domain.enums.region import RegionTypeEnum
+from champyons.core.domain.value_objects.football.federation_rules import FederationRules
+from champyons.core.domain.value_objects.game.game_settings import GameSettings
+from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
+from champyons.core.domain.value_objects.geography.citizenship_rules import CitizenshipRules
+from champyons.core.domain.value_objects.geography.culture import Culture, CultureDistribution
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+from .format import Column, ColumnKind, SnapshotReader, SnapshotTable, SnapshotWriter, DEFAULT_CHUNK_ROWS
+
+INT, FLOAT, BOOL, STR, DATE, DATETIME, JSON = (
+    ColumnKind.INT, ColumnKind.FLOAT, ColumnKind.BOOL, ColumnKind.STR, ColumnKind.DATE, ColumnKind.DATETIME, ColumnKind.JSON
+)
+
+_TIMESTAMPS = [Column("created_at", DATETIME), Column("updated_at", DATETIME)]
+_ACTIVE = [Column("active", BOOL)]
+_GEONAMES = [Column("geonames_id", INT)]
+_SKILLS = tuple(PlayerSkills.__dataclass_fields__)
+
+
+@dataclass
+class GameSnapshotData:
+    """ Everything stored in a game snapshot """
+    game_state: GameState
+    seasons: List[Season] = field(default_factory=list)
+    continents: List[Continent] = field(default_factory=list)
+    regions: List[Region] = field(default_factory=list)
+    countries: List[Country] = field(default_factory=list)
+    local_regions: List[LocalRegion] = field(default_factory=list)
+    cities: List[City] = field(default_factory=list)
+    nationalities: List[Nationality] = field(default_factory=list)
+    player_profiles: List[PlayerProfile] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _TableSpec:
+    """ How an entity maps to a snapshot table. Columns are read with getattr unless an encoder is given """
+    name: str
+    columns: Sequence[Column]
+    encoders: Mapping[str, Callable[[Any], Any]] = field(default_factory=dict)
+
+    def row(self, entity: Any) -> Dict[str, Any]:
+        return {
+            column.name: self.encoders[column.name](entity) if column.name in self.encoders else getattr(entity, column.name)
+            for column in self.columns
+        }
+
+    def encode(self, entities: Sequence[Any]) -> Dict[str, List[Any]]:
+        data: Dict[str, List[Any]] = {}
+        for column in self.columns:
+            encoder = self.encoders.get(column.name)
+            data[column.name] = [encoder(e) if encoder else getattr(e, column.name) for e in entities]
+        return data
+
+
+def _optional_dict(value: Any) -> Optional[Dict[str, Any]]:
+    return asdict(value) if value is not None else None
+
+
+def _transfer_window(data: Optional[Mapping[str, Any]]) -> Optional[TransferWindow]:
+    if data is None:
+        return None
+    return TransferWindow(date.fromisoformat(data["start_date"]), date.fromisoformat(data["end_date"]), data["time_offset"])
+
+
+def _window_dict(window: Optional[TransferWindow]) -> Optional[Dict[str, Any]]:
+    if window is None:
+        return None
+    return {"start_date": window.start_date.isoformat(), "end_date": window.end_date.isoformat(), "time_offset": window.time_offset}
+
+
+_GAME_STATE = _TableSpec("game_state", [
+    Column("id", INT), Column("sim_date", DATE), Column("start_sim_date", DATE), Column("current_season_id", INT), *_TIMESTAMPS,
+])
+_SEASON = _TableSpec("season", [
+    Column("id", INT), Column("start_date", DATE), Column("end_date", DATE), Column("name_fmt", STR), Column("index", INT),
+    Column("competition_editions_ids", JSON), Column("default_transfer_window_1", JSON), Column("default_transfer_window_2", JSON),
+    Column("settings", JSON), *_ACTIVE, *_TIMESTAMPS,
+], encoders={
+    "default_transfer_window_1": lambda s: _window_dict(s.default_transfer_window_1),
+    "default_transfer_window_2": lambda s: _window_dict(s.default_transfer_window_2),
+    "settings": lambda s: asdict(s.settings),
+})
+_CONTINENT = _TableSpec("continent", [Column("id", INT), Column("code", STR), Column("name", STR), *_GEONAMES, *_ACTIVE, *_TIMESTAMPS])
+_REGION = _TableSpec("region", [Column("id", INT), Column("name", STR), Column("type", INT), *_GEONAMES, *_ACTIVE, *_TIMESTAMPS])
+_COUNTRY = _TableSpec("country", [
+    Column("id", INT), Column("name", STR), Column("code", STR), Column("continent_id", INT), Column("parent_id", INT),
+    Column("region_ids", JSON), *_GEONAMES, *_ACTIVE, *_TIMESTAMPS,
+], encoders={"region_ids": lambda c: [region.id for region in c.regions]})
+_LOCAL_REGION = _TableSpec("local_region", [
+    Column("id", INT), Column("name", STR), Column("code", STR), Column("country_id", INT), Column("parent_local_region_id", INT),
+    *_GEONAMES, *_ACTIVE, *_TIMESTAMPS,
+])
+_CITY = _TableSpec("city", [
+    Column("id", INT), Column("name", STR), Column("population_range", INT), Column("latitude", FLOAT), Column("longitude", FLOAT),
+    Column("altitude", INT), Column("country_id", INT), Column("local_region_id", INT),
+    Column("created_by_id", INT), Column("updated_by_id", INT), *_GEONAMES, *_ACTIVE, *_TIMESTAMPS,
+])
+_NATIONALITY = _TableSpec("nationality", [
+    Column("id", INT), Column("entity_type", STR), Column("entity_id", INT), Column("is_club_nation_base", BOOL),
+    Column("is_world_federation_member", BOOL), Column("is_confederation_member", BOOL),
+    Column("federation_rules", JSON), Column("citizenship_rules", JSON), Column("culture_distribution", JSON),
+    Column("immigration_rate", FLOAT), Column("foreign_nationalities_id", JSON), *_ACTIVE, *_TIMESTAMPS,
+], encoders={
+    "federation_rules": lambda n: _optional_dict(n.federation_rules),
+    "citizenship_rules": lambda n: _optional_dict(n.citizenship_rules),
+    "culture_distribution": lambda n: None if n.culture_distribution is None else [
+        [culture.to_dict(), weight] for culture, weight in n.culture_distribution.distributions.items()
+    ],
+})
+_PLAYER_PROFILE = _TableSpec("player_profile", [
+    Column("id", INT), Column("person_id", INT), *(Column(name, FLOAT) for name in _SKILLS), Column("positions", INT),
+    *_ACTIVE, *_TIMESTAMPS,
+], encoders={
+    **{name: (lambda p, name=name: getattr(p.skills, name)) for name in _SKILLS},
+    "positions": lambda p: p.positions.mask,
+})
+
+
+# Entity type -> table, in writing order
+TABLES_BY_ENTITY: Dict[type, _TableSpec] = {
+    GameState: _GAME_STATE,
+    Season: _SEASON,
+    Continent: _CONTINENT,
+    Region: _REGION,
+    Country: _COUNTRY,
+    LocalRegion: _LOCAL_REGION,
+    City: _CITY,
+    Nationality: _NATIONALITY,
+    PlayerProfile: _PLAYER_PROFILE,
+}
+
+
+def entity_tables(data: GameSnapshotData) -> List[tuple[_TableSpec, Sequence[Any]]]:
+    """ (table, entities) pairs of a game """
+    return [
+        (_GAME_STATE, [data.game_state]),
+        (_SEASON, data.seasons),
+        (_CONTINENT, data.continents),
+        (_REGION, data.regions),
+        (_COUNTRY, data.countries),
+        (_LOCAL_REGION, data.local_regions),
+        (_CITY, data.cities),
+        (_NATIONALITY, data.nationalities),
+        (_PLAYER_PROFILE, data.player_profiles),
+    ]
+
+
+def write_game_snapshot(path: str | Path, data: GameSnapshotData, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    """ Writes a snapshot of a paused game """
+    if data.game_state.is_simulation_running:
+        raise ValueError("Game must be paused before writing a snapshot")
+
+    metadata = {"sim_date": data.game_state.sim_date.isoformat()}
+    with SnapshotWriter(path, metadata=metadata, chunk_rows=chunk_rows) as writer:
+        for spec, entities in entity_tables(data):
+            writer.add_table(spec.name, spec.columns, spec.encode(entities))
+
+
+class GameSnapshot:
+    """
+    Read access to a game snapshot. Each accessor decodes its table on first use and caches the result.
+
+    Usage:
+    ------
+        with GameSnapshot(path) as snapshot:
+            state = snapshot.game_state()
+            skills = snapshot.table("player_profile").column("passing")   # numpy array, no entities built
+    """
+    def __init__(self, path: str | Path):
+        self.reader = SnapshotReader(path)
+        self._cache: Dict[str, Any] = {}
+
+    def __enter__(self) -> "GameSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.reader.close()
+
+    @property
+    def sim_date(self) -> date:
+        return date.fromisoformat(self.reader.metadata["sim_date"])
+
+    def table(self, name: str) -> SnapshotTable:
+        return self.reader.table(name)
+
+    def game_state(self) -> GameState:
+        row = next(self.table(_GAME_STATE.name).rows())
+        return GameState(**row)
+
+    def seasons(self) -> List[Season]:
+        return self._load(_SEASON.name, lambda row: Season(**{
+            **row,
+            "default_transfer_window_1": _transfer_window(row["default_transfer_window_1"]),
+            "default_transfer_window_2": _transfer_window(row["default_transfer_window_2"]),
+            "settings": GameSettings(**row["settings"]),
+        }))
+
+    def continents(self) -> List[Continent]:
+        return self._load(_CONTINENT.name, lambda row: Continent(**row))
+
+    def regions(self) -> List[Region]:
+        return self._load(_REGION.name, lambda row: Region(**{**row, "type": RegionTypeEnum(row["type"])}))
+
+    def countries(self) -> List[Country]:
+        """ Countries with their regions linked """
+        regions = {region.id: region for region in self.regions()}
+
+        def build(row: Dict[str, Any]) -> Country:
+            region_ids = row.pop("region_ids")
+            country = Country(**row, regions=[regions[region_id] for region_id in region_ids])
+            for region in country.regions:
+                region.countries.append(country)
+            return country
+
+        return self._load(_COUNTRY.name, build)
+
+    def local_regions(self) -> List[LocalRegion]:
+        return self._load(_LOCAL_REGION.name, lambda row: LocalRegion(**row))
+
+    def cities(self) -> List[City]:
+        return self._load(_CITY.name, lambda row: City(**{**row, "population_range": CityPopulationRange(row["population_range"])}))
+
+    def nationalities(self) -> List[Nationality]:
+        """ Nationalities with their country or local region attached (required by Nationality) """
+        countries = {country.id: country for country in self.countries()}
+        local_regions = {local_region.id: local_region for local_region in self.local_regions()}
+
+        def build(row: Dict[str, Any]) -> Nationality:
+            entity_type = NationalityEntityType(row["entity_type"])
+            entity = (countries if entity_type == NationalityEntityType.COUNTRY else local_regions)[row["entity_id"]]
+            distribution = row["culture_distribution"]
+            return Nationality(**{
+                **row,
+                "entity_type": entity_type,
+                "entity": entity,
+                "federation_rules": FederationRules(**row["federation_rules"]) if row["federation_rules"] else None,
+                "citizenship_rules": CitizenshipRules(**row["citizenship_rules"]) if row["citizenship_rules"] else None,
+                "culture_distribution": None if distribution is None else CultureDistribution(
+                    distributions={Culture.from_json(culture): weight for culture, weight in distribution}
+                ),
+            })
+
+        return self._load(_NATIONALITY.name, build)
+
+    def player_profiles(self) -> List[PlayerProfile]:
+        def build(row: Dict[str, Any]) -> PlayerProfile:
+            return PlayerProfile(
+                id=row["id"],
+                person_id=row["person_id"],
+                skills=PlayerSkills(**{name: row[name] for name in _SKILLS}),
+                positions=PositionSet(row["positions"]),
+                active=row["active"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+        return self._load(_PLAYER_PROFILE.name, build)
+
+    def load(self) -> GameSnapshotData:
+        """ Decodes the whole snapshot """
+        return GameSnapshotData(
+            game_state=self.game_state(),
+            seasons=self.seasons(),
+            continents=self.continents(),
+            regions=self.regions(),
+            countries=self.countries(),
+            local_regions=self.local_regions(),
+            cities=self.cities(),
+            nationalities=self.nationalities(),
+            player_profiles=self.player_profiles(),
+        )
+
+    def _load(self, name: str, build: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        if name not in self._cache:
+            self._cache[name] = [build(row) for row in self.table(name).rows()]
+        return self._cache[name]
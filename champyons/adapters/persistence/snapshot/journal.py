@@ -0,0 +1,132 @@
+"""
+Change journal
+
+Append-only log of the rows changed on each sim day. Autosaves append one record per day with
+only the modified entities, and the journal is periodically compacted into a full snapshot.
+
+Layout:
+-------
+    JOURNAL_MAGIC
+    records: payload length (u32), crc32 (u32), zlib-compressed JSON payload
+
+Payload: {"day": "2025-08-01", "changes": [[table, op, key, values], ...]}, with values encoded
+as in snapshot rows (see format.encode_row). A torn last record, left by a crash while
+appending, fails its checksum and is dropped when the journal is opened.
+"""
+from dataclasses import dataclass
+from datetime import date
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+import json
+import os
+import struct
+import zlib
+
+from .format import SnapshotFormatError
+
+JOURNAL_MAGIC = b"CHJRNL01"
+
+_HEADER = struct.Struct("<II")
+
+
+class ChangeOp(StrEnum):
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class JournalChange:
+    table: str
+    op: ChangeOp
+    key: int
+    values: Optional[List[Any]] = None # encoded row, in table column order. None for deletes
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    day: date
+    changes: tuple[JournalChange, ...]
+
+
+class ChangeJournal:
+    """
+    Usage:
+    ------
+        journal = ChangeJournal(path)
+        journal.append(sim_date, [JournalChange("city", ChangeOp.UPSERT, 1, [...])])
+        for record in journal.records():
+            ...
+    """
+    def __init__(self, path: str | Path, compression_level: int = 6):
+        self.path = Path(path)
+        self.compression_level = compression_level
+        self._count = 0
+        self._recover()
+
+    def __len__(self) -> int:
+        """ Number of records (days) in the journal """
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """ Bytes on disk """
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def append(self, day: date, changes: Sequence[JournalChange]) -> int:
+        """ Appends and syncs a record. Returns the bytes written """
+        payload = {"day": day.isoformat(), "changes": [[c.table, str(c.op), c.key, c.values] for c in changes]}
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), self.compression_level)
+        with open(self.path, "ab") as f:
+            if f.tell() == 0:
+                f.write(JOURNAL_MAGIC)
+            f.write(_HEADER.pack(len(blob), zlib.crc32(blob)))
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        self._count += 1
+        return _HEADER.size + len(blob)
+
+    def records(self) -> Iterator[JournalRecord]:
+        for blob in self._blobs():
+            payload = json.loads(zlib.decompress(blob))
+            yield JournalRecord(
+                day=date.fromisoformat(payload["day"]),
+                changes=tuple(JournalChange(table, ChangeOp(op), key, values) for table, op, key, values in payload["changes"]),
+            )
+
+    def reset(self) -> None:
+        """ Empties the journal (after its changes were compacted into a snapshot) """
+        self.path.unlink(missing_ok=True)
+        self._count = 0
+
+    def _blobs(self) -> Iterator[bytes]:
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            if f.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+                raise SnapshotFormatError(f"{self.path} is not a change journal")
+            while True:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                length, checksum = _HEADER.unpack(header)
+                blob = f.read(length)
+                if len(blob) < length or zlib.crc32(blob) != checksum:
+                    return
+                yield blob
+
+    def _recover(self) -> None:
+        """ Counts valid records and truncates a torn tail """
+        if not self.path.exists():
+            return
+        if self.path.stat().st_size < len(JOURNAL_MAGIC): # crashed while creating the file
+            self.path.unlink()
+            return
+        valid = len(JOURNAL_MAGIC)
+        for blob in self._blobs():
+            valid += _HEADER.size + len(blob)
+            self._count += 1
+        if self.path.stat().st_size > valid:
+            with open(self.path, "r+b") as f:
+                f.truncate(valid)
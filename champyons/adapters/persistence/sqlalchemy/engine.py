@@ -1,7 +1,15 @@
-from sqlalchemy import create_engine
+from pathlib import Path
+
+from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker
 
 from champyons.core.config import config
 
-engine = create_engine(config.db_url, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+def create_sqlite_engine(url: str | Path) -> Engine:
+    """ Engine for a SQLite database url, or a path to a database file """
+    if isinstance(url, Path):
+        url = f"sqlite:///{url}"
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+engine = create_sqlite_engine(config.db_url)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,96 @@
+"""
+Entity identity map
+
+Repository reads within a unit of work (a Session transaction) share their domain entities: one
+entity per (entity type, id), whatever the number of repository calls or the number of rows
+pointing to it. Listing 250 countries with their continent builds one Continent entity per
+continent instead of one per country, and entity identity (`is`) can stand in for equality.
+
+The map lives in `session.info` and is cleared when the outermost transaction ends (commit,
+rollback or close), so reads after a save, or in a later unit of work, see the current rows. Like
+the ORM's own identity map it holds entities weakly: an entity nobody references any more is
+dropped, so streaming reads (iter_all) stay bounded. Relations are filled in as load plans ask for
+them: an entity first read without relations gets them on a later read whose plan includes them,
+and keeps them afterwards.
+
+Scalar fields are copied from the row only when the entity is built: a later read in the same
+transaction returns the cached entity as it is (with any unsaved change made to it), and does not
+see changes made to the ORM model directly. Within a unit of work, change entities and save them
+through repositories rather than updating models.
+
+Models use it through `materialize` in their to_entity:
+
+    def to_entity(self, plan: LoadPlan = NO_RELATIONS) -> CountryEntity:
+        return materialize(self, CountryEntity, plan, lambda: CountryEntity(...), {
+            "continent": lambda p: self.continent.to_entity(p) if self.continent else None,
+        })
+"""
+from typing import Any, Callable, Mapping, Optional, Tuple, TypeVar
+from weakref import WeakValueDictionary
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+
+from champyons.core.ports.repositories.load_plan import LoadPlan
+
+IDENTITY_MAP_KEY = "entity_identity_map"
+
+T = TypeVar("T")
+
+RelationLoader = Callable[[LoadPlan], Any]
+
+
+class EntityIdentityMap:
+    def __init__(self):
+        self._entities: WeakValueDictionary[Tuple[type, Any], Any] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get(self, entity_type: type, entity_id: Any) -> Optional[Any]:
+        return self._entities.get((entity_type, entity_id))
+
+    def add(self, entity: Any) -> None:
+        self._entities[(type(entity), entity.id)] = entity
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+
+def identity_map(session: Session) -> EntityIdentityMap:
+    """ Identity map of the session's current unit of work """
+    entities = session.info.get(IDENTITY_MAP_KEY)
+    if entities is None:
+        entities = session.info[IDENTITY_MAP_KEY] = EntityIdentityMap()
+    return entities
+
+
+def materialize(model: Any, entity_type: type[T], plan: LoadPlan, build: Callable[[], T], relations: Mapping[str, RelationLoader]) -> T:
+    """
+    Domain entity of a model row, shared through the session's identity map (detached models get a
+    fresh entity). build() creates the entity without relations; relations[name](plan) loads the
+    relation of the plan called name
+    """
+    session = object_session(model)
+    if session is None:
+        entity = build()
+    else:
+        entities = identity_map(session)
+        entity = entities.get(entity_type, model.id)
+        if entity is None:
+            entity = build()
+            # registered before its relations are loaded, so cycles (country -> continent -> countries) end here
+            entities.add(entity)
+    for name, related_plan in plan:
+        # bypasses dirty tracking: loading a relation does not modify the entity
+        object.__setattr__(entity, name, relations[name](related_plan))
+    return entity
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _end_of_unit_of_work(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None: # savepoints and subtransactions end inside the unit of work
+        return
+    entities = session.info.get(IDENTITY_MAP_KEY)
+    if entities is not None:
+        entities.clear()
@@ -0,0 +1,39 @@
+"""
+Load plans
+
+Translates a LoadPlan (core port) into SQLAlchemy loader options:
+
+- many-to-one relations (country -> continent, parent...) are joined into the same query (joinedload)
+- collections (regions, children, cities...) are loaded with one extra IN query per relation (selectinload)
+- everything else raises if touched (raiseload), so a missing relation shows up as an error
+  instead of a hidden query per row
+
+The number of queries is fixed by the plan: one, plus one per collection in it, however many rows are read.
+"""
+from typing import List
+
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import MANYTOONE, LoaderOption
+
+from champyons.core.ports.repositories.load_plan import LoadPlan
+
+
+def loader_options(model: type, plan: LoadPlan) -> List[LoaderOption]:
+    """ Loader options of a query on model that load exactly the relations of the plan """
+    relationships = inspect(model).relationships
+    options: List[LoaderOption] = []
+    for name, related_plan in plan:
+        if name not in relationships:
+            raise ValueError(f"{model.__name__} has no relation {name}")
+        relation = relationships[name]
+        attribute = getattr(model, name)
+        loader = joinedload(attribute) if relation.direction is MANYTOONE else selectinload(attribute)
+        options.append(loader.options(*loader_options(relation.mapper.class_, related_plan)))
+    options.append(raiseload("*"))
+    return options
+
+
+def planned_select(model: type, plan: LoadPlan) -> Select:
+    """ SELECT of model loading the relations of the plan """
+    return select(model).options(*loader_options(model, plan))
@@ -1,7 +1,6 @@
 from sqlalchemy import Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
-from champyons.core.timezone.api import now_server
 
 class ActiveMixin:
     """Add an active flag to a model."""
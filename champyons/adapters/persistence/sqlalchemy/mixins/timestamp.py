@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
-from champyons.core.timezone.api import now_server
+from champyons.core.domain.entities.mixins.timestamp import now_server
 from ..types import UTCDateTime
 
 class TimestampMixin:
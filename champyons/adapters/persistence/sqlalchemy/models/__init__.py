@@ -1,5 +1,11 @@
 
 from .continent import Continent
-from .country import Nation
+from .country import Country
 from .region import Region
+from .person import Person, ManagerProfile
+from .player import PlayerProfile
 from .translation import Translation
+from .geonames_registry import GeonamesRegistryEntry
+from . import city_spatial # noqa: F401 (city R-tree DDL and listeners)
+from .city_distance import city_distance_table
+from .geography_closure import GeographyClosure
@@ -27,7 +27,7 @@ class City(Base, ActiveMixin, GeographyMixin, TimestampMixin):
     local_region_id: Mapped[int] = mapped_column(sa.ForeignKey("local_region.id"))
 
     # Relationships
-    country: Mapped["Country"] = relationship("Nation", back_populates="cities", lazy="joined")
+    country: Mapped["Country"] = relationship("Country", back_populates="cities", lazy="joined")
     local_region: Mapped["LocalRegion"] = relationship("LocalRegion", back_populates="cities", lazy="joined")
 
 
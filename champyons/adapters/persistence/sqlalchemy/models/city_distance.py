@@ -0,0 +1,27 @@
+from sqlalchemy import Table, Column, Float, ForeignKey, CheckConstraint, Delete, event, inspect, or_
+from champyons.adapters.persistence.sqlalchemy.base import Base
+
+from .city import City
+
+# Cached great-circle distances between cities (see CityDistances). Each pair is stored once, lower id first
+city_distance_table = Table(
+    "city_distance",
+    Base.metadata,
+    Column("city_a_id", ForeignKey("city.id", ondelete="CASCADE"), primary_key=True),
+    Column("city_b_id", ForeignKey("city.id", ondelete="CASCADE"), primary_key=True),
+    Column("distance_km", Float, nullable=False),
+    CheckConstraint("city_a_id <= city_b_id", name="ck_city_distance_ordered_pair"),
+)
+
+
+def delete_city_distances(city_id: int) -> Delete:
+    c = city_distance_table.c
+    return city_distance_table.delete().where(or_(c.city_a_id == city_id, c.city_b_id == city_id))
+
+
+@event.listens_for(City, "after_update")
+def _drop_distances_of_moved_city(mapper, connection, target: City) -> None:
+    """ Persisted distances of a city are stale once its coordinates change """
+    state = inspect(target)
+    if state.attrs.latitude.history.has_changes() or state.attrs.longitude.history.has_changes():
+        connection.execute(delete_city_distances(target.id))
@@ -0,0 +1,51 @@
+"""
+R-tree over city coordinates (SQLite rtree module)
+
+`city_rtree` is a virtual table holding one degenerate box (latitude, latitude, longitude,
+longitude) per city with coordinates. It is created and dropped along with the city table on
+SQLite, and kept in sync on flush by the listeners below. Queries live in SqliteCitySpatialIndex.
+"""
+import sqlalchemy as sa
+from sqlalchemy import event, inspect
+
+from .city import City
+
+RTREE_TABLE = "city_rtree"
+
+_city = City.__table__
+
+event.listen(_city, "after_create", sa.DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {RTREE_TABLE} USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+).execute_if(dialect="sqlite"))
+event.listen(_city, "before_drop", sa.DDL(f"DROP TABLE IF EXISTS {RTREE_TABLE}").execute_if(dialect="sqlite"))
+
+_INSERT = sa.text(f"INSERT INTO {RTREE_TABLE} VALUES (:id, :latitude, :latitude, :longitude, :longitude)")
+_DELETE = sa.text(f"DELETE FROM {RTREE_TABLE} WHERE id = :id")
+
+
+def _index(connection, target: City) -> None:
+    if target.latitude is not None and target.longitude is not None:
+        connection.execute(_INSERT, {"id": target.id, "latitude": target.latitude, "longitude": target.longitude})
+
+
+@event.listens_for(City, "after_insert")
+def _after_insert(mapper, connection, target: City) -> None:
+    if connection.dialect.name == "sqlite":
+        _index(connection, target)
+
+
+@event.listens_for(City, "after_update")
+def _after_update(mapper, connection, target: City) -> None:
+    state = inspect(target)
+    if connection.dialect.name != "sqlite" or not (
+        state.attrs.latitude.history.has_changes() or state.attrs.longitude.history.has_changes()
+    ):
+        return
+    connection.execute(_DELETE, {"id": target.id})
+    _index(connection, target)
+
+
+@event.listens_for(City, "after_delete")
+def _after_delete(mapper, connection, target: City) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.execute(_DELETE, {"id": target.id})
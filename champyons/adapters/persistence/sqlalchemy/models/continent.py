@@ -1,6 +1,8 @@
 from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship      
 from champyons.core.domain.entities.geography.continent import Continent as ContinentEntity
+from champyons.core.ports.repositories.load_plan import LoadPlan, NO_RELATIONS
+from ..identity_map import materialize
 from ..base import Base
 from ..mixins import ActiveMixin, GeographyMixin, TimestampMixin
 from .translation import Translation
@@ -19,7 +21,7 @@ class Continent(Base, GeographyMixin, TimestampMixin, ActiveMixin):
     default_name: Mapped[str] = mapped_column(String, index=True, info={"translatable": True})
 
     # Relationships
-    countries: Mapped[list["Country"]] = relationship("Nation", back_populates="continent")
+    countries: Mapped[list["Country"]] = relationship("Country", back_populates="continent")
 
     @classmethod
     def from_entity(cls, entity: ContinentEntity) -> "Continent":
@@ -39,8 +41,8 @@ class Continent(Base, GeographyMixin, TimestampMixin, ActiveMixin):
         self.active = entity.active
         self.geonames_id = entity.geonames_id
         
-    def to_entity(self, *, include_countrys = False) -> ContinentEntity:
-        return ContinentEntity(
+    def to_entity(self, plan: LoadPlan = NO_RELATIONS) -> ContinentEntity:
+        return materialize(self, ContinentEntity, plan, lambda: ContinentEntity(
             id=self.id,
             code=self.code,
             name=self.default_name,
@@ -48,7 +50,8 @@ class Continent(Base, GeographyMixin, TimestampMixin, ActiveMixin):
             created_at=self.created_at,
             updated_at=self.updated_at,
             active=self.active,
-            countrys=[country.to_entity() for country in self.countrys] if include_countrys else []
-        )
+        ), {
+            "countries": lambda p: [country.to_entity(p) for country in self.countries],
+        })
 
 
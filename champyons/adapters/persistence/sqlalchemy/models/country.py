@@ -5,6 +5,8 @@ from ..base import Base
 from ..mixins import GeographyMixin, TimestampMixin, ActiveMixin
 
 from champyons.core.domain.entities.geography.country import Country as CountryEntity
+from champyons.core.ports.repositories.load_plan import LoadPlan, NO_RELATIONS
+from ..identity_map import materialize
 
 from .continent import Continent
 from .region import Region
@@ -30,12 +32,12 @@ class Country(Base, ActiveMixin, GeographyMixin, TimestampMixin):
     parent_id: Mapped[Optional[int]] = mapped_column(ForeignKey("country.id"), index=True, nullable=True, default=None)
 
     # Relationships
-    continent: Mapped[Optional[Continent]] = relationship("Continent", back_populates="countrys", lazy="joined")
+    # Loaded on demand: repositories pick relations and strategies through load plans
+    continent: Mapped[Optional[Continent]] = relationship("Continent", back_populates="countries")
     regions: Mapped[list["Region"]] = relationship(
         "Region",
         secondary=country_region_table,
-        back_populates="countrys",
-        lazy="selectin",
+        back_populates="countries",
     )
     cities: Mapped[List[City]] = relationship("City", back_populates="country")
     local_regions: Mapped[List[LocalRegion]] = relationship("LocalRegion", back_populates="country", foreign_keys="LocalRegion.country_id")
@@ -64,8 +66,9 @@ class Country(Base, ActiveMixin, GeographyMixin, TimestampMixin):
         self.active =  entity.active
         self.geonames_id = entity.geonames_id
     
-    def to_entity(self, *, include_continent: bool = True, include_regions: bool = True, include_parent: bool = True,  include_children: bool = False) -> CountryEntity:
-        return CountryEntity(
+    def to_entity(self, plan: LoadPlan = NO_RELATIONS) -> CountryEntity:
+        """ Relations outside the plan are left empty (unless loaded earlier in the same unit of work) """
+        return materialize(self, CountryEntity, plan, lambda: CountryEntity(
             id=self.id,
             code=self.code,
             name=self.default_name,
@@ -75,9 +78,9 @@ class Country(Base, ActiveMixin, GeographyMixin, TimestampMixin):
             created_at=self.created_at,
             updated_at=self.updated_at,
             geonames_id=self.geonames_id,
-
-            continent=self.continent.to_entity() if include_continent and self.continent else None,
-            regions=[region.to_entity() for region in self.regions] if include_regions else [],
-            parent=self.parent.to_entity() if include_parent and self.parent else None,
-            children=[child.to_entity() for child in self.children] if include_children else [],
-        )
+        ), {
+            "continent": lambda p: self.continent.to_entity(p) if self.continent else None,
+            "regions": lambda p: [region.to_entity(p) for region in self.regions],
+            "parent": lambda p: self.parent.to_entity(p) if self.parent else None,
+            "children": lambda p: [child.to_entity(p) for child in self.children],
+        })
@@ -0,0 +1,130 @@
+"""
+Geography closure table
+
+One row per (ancestor, descendant) pair of the country > local region > city hierarchy, plus a
+depth 0 row per node, so "every city under Andalusia" or "every ancestor of this city" is a single
+indexed lookup instead of a walk up or down the parent links.
+
+Parent of each node:
+- Country: its parent country (e.g. England -> United Kingdom), if any
+- LocalRegion: its parent local region, else its country
+- City: its local region, else its country
+
+Rows are maintained on flush by the listeners below for every city, local region and country
+written through the ORM (hence through their repositories), including moves of whole subtrees.
+Bulk loads that bypass the ORM are followed by SqlAlchemyGeographyHierarchy.rebuild().
+"""
+from typing import Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+from .city import City
+from .country import Country
+from .local_region import LocalRegion
+from champyons.core.domain.enums.geography import GeographyType
+
+Node = Tuple[GeographyType, int]
+
+
+class GeographyClosure(Base):
+    __tablename__ = "geography_closure"
+    __table_args__ = (
+        sa.Index("ix_geography_closure_descendant", "descendant_type", "descendant_id", "depth"),
+    )
+
+    # Columns
+    ancestor_type: Mapped[int] = mapped_column(sa.SmallInteger, primary_key=True)
+    ancestor_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    descendant_type: Mapped[int] = mapped_column(sa.SmallInteger, primary_key=True)
+    descendant_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    depth: Mapped[int] = mapped_column(sa.SmallInteger, nullable=False)
+
+
+_closure = GeographyClosure.__table__
+
+_TYPE_BY_MODEL = {
+    City: GeographyType.CITY,
+    LocalRegion: GeographyType.LOCAL_REGION,
+    Country: GeographyType.COUNTRY,
+}
+
+
+def parent_node(target) -> Optional[Node]:
+    """ Parent of a city, local region or country in the hierarchy """
+    if isinstance(target, Country):
+        return (GeographyType.COUNTRY, target.parent_id) if target.parent_id is not None else None
+    if isinstance(target, LocalRegion) and target.parent_local_region_id is not None:
+        return GeographyType.LOCAL_REGION, target.parent_local_region_id
+    if isinstance(target, City) and target.local_region_id is not None:
+        return GeographyType.LOCAL_REGION, target.local_region_id
+    return (GeographyType.COUNTRY, target.country_id) if target.country_id is not None else None
+
+
+def _is_ancestor(node: Node):
+    return sa.and_(_closure.c.ancestor_type == node[0], _closure.c.ancestor_id == node[1])
+
+
+def _is_descendant(node: Node):
+    return sa.and_(_closure.c.descendant_type == node[0], _closure.c.descendant_id == node[1])
+
+
+def _attach(connection, node: Node, parent: Optional[Node]) -> None:
+    """ Paths from the ancestors of parent (and parent itself) to every node of node's subtree """
+    if parent is None:
+        return
+    above = _closure.alias("above")
+    below = _closure.alias("below")
+    connection.execute(_closure.insert().from_select(
+        ["ancestor_type", "ancestor_id", "descendant_type", "descendant_id", "depth"],
+        sa.select(above.c.ancestor_type, above.c.ancestor_id, below.c.descendant_type, below.c.descendant_id, above.c.depth + below.c.depth + 1)
+        .select_from(above.join(below, sa.true())) # every ancestor x every subtree node
+        .where(above.c.descendant_type == parent[0], above.c.descendant_id == parent[1])
+        .where(below.c.ancestor_type == node[0], below.c.ancestor_id == node[1]),
+    ))
+
+
+def _detach(connection, node: Node) -> None:
+    """ Deletes the paths entering node's subtree from above it """
+    subtree = sa.select(_closure.c.descendant_type, _closure.c.descendant_id).where(_is_ancestor(node))
+    connection.execute(_closure.delete().where(
+        sa.tuple_(_closure.c.descendant_type, _closure.c.descendant_id).in_(subtree),
+        sa.tuple_(_closure.c.ancestor_type, _closure.c.ancestor_id).not_in(subtree),
+    ))
+
+
+@event.listens_for(City, "after_insert")
+@event.listens_for(LocalRegion, "after_insert")
+@event.listens_for(Country, "after_insert")
+def _after_insert(mapper, connection, target) -> None:
+    node = (_TYPE_BY_MODEL[type(target)], target.id)
+    connection.execute(_closure.insert().values(
+        ancestor_type=node[0], ancestor_id=node[1], descendant_type=node[0], descendant_id=node[1], depth=0,
+    ))
+    _attach(connection, node, parent_node(target))
+
+
+@event.listens_for(City, "after_update")
+@event.listens_for(LocalRegion, "after_update")
+@event.listens_for(Country, "after_update")
+def _after_update(mapper, connection, target) -> None:
+    node = (_TYPE_BY_MODEL[type(target)], target.id)
+    parent = parent_node(target)
+    current = connection.execute(
+        sa.select(_closure.c.ancestor_type, _closure.c.ancestor_id).where(_is_descendant(node), _closure.c.depth == 1)
+    ).first()
+    if (tuple(current) if current else None) == parent:
+        return
+    _detach(connection, node)
+    _attach(connection, node, parent)
+
+
+@event.listens_for(City, "after_delete")
+@event.listens_for(LocalRegion, "after_delete")
+@event.listens_for(Country, "after_delete")
+def _after_delete(mapper, connection, target) -> None:
+    node = (_TYPE_BY_MODEL[type(target)], target.id)
+    _detach(connection, node) # what is left below becomes a root
+    connection.execute(_closure.delete().where(sa.or_(_is_ancestor(node), _is_descendant(node))))
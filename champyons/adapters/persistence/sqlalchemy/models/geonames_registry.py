@@ -0,0 +1,74 @@
+import sqlalchemy as sa
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+from ..mixins import GeographyMixin
+from .city import City
+from .continent import Continent
+from .country import Country
+from .local_region import LocalRegion
+from .region import Region
+from champyons.core.domain.enums.geography import GeographyType
+
+GEOGRAPHY_MODELS: dict[GeographyType, type] = {
+    GeographyType.CITY: City,
+    GeographyType.LOCAL_REGION: LocalRegion,
+    GeographyType.COUNTRY: Country,
+    GeographyType.REGION: Region,
+    GeographyType.CONTINENT: Continent,
+}
+
+_TYPE_BY_MODEL = {model: geography_type for geography_type, model in GEOGRAPHY_MODELS.items()}
+
+
+class GeonamesRegistryEntry(Base):
+    """ Geonames id of a geography entity. Kept in sync on flush by the listeners below """
+    __tablename__ = "geonames_registry"
+    __table_args__ = (
+        sa.UniqueConstraint("geography_type", "geonames_id"),
+    )
+
+    # Columns
+    geography_type: Mapped[int] = mapped_column(sa.SmallInteger, primary_key=True)
+    entity_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    geonames_id: Mapped[int] = mapped_column(sa.BigInteger, index=True, nullable=False)
+
+
+_registry = GeonamesRegistryEntry.__table__
+
+
+def _unregister(connection, geography_type: GeographyType, entity_id: int) -> None:
+    connection.execute(
+        _registry.delete().where(_registry.c.geography_type == geography_type, _registry.c.entity_id == entity_id)
+    )
+
+
+def _register(connection, geography_type: GeographyType, entity_id: int, geonames_id: int) -> None:
+    connection.execute(
+        _registry.insert().values(geography_type=geography_type, entity_id=entity_id, geonames_id=geonames_id)
+    )
+
+
+@event.listens_for(GeographyMixin, "after_insert", propagate=True)
+def _after_insert(mapper, connection, target) -> None:
+    geography_type = _TYPE_BY_MODEL.get(type(target))
+    if geography_type is not None and target.geonames_id is not None:
+        _register(connection, geography_type, target.id, target.geonames_id)
+
+
+@event.listens_for(GeographyMixin, "after_update", propagate=True)
+def _after_update(mapper, connection, target) -> None:
+    geography_type = _TYPE_BY_MODEL.get(type(target))
+    if geography_type is None or not inspect(target).attrs.geonames_id.history.has_changes():
+        return
+    _unregister(connection, geography_type, target.id)
+    if target.geonames_id is not None:
+        _register(connection, geography_type, target.id, target.geonames_id)
+
+
+@event.listens_for(GeographyMixin, "after_delete", propagate=True)
+def _after_delete(mapper, connection, target) -> None:
+    geography_type = _TYPE_BY_MODEL.get(type(target))
+    if geography_type is not None:
+        _unregister(connection, geography_type, target.id)
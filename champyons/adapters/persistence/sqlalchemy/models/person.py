@@ -1,5 +1,5 @@
 from sqlalchemy import ForeignKey, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from enum import Enum
 from datetime import datetime
@@ -12,6 +12,7 @@ from typing import Optional, Literal, TYPE_CHECKING
 if TYPE_CHECKING:
     from .country import Country
     from .city import City
+    from .player import PlayerProfile
 
 class PersonNationality(Base, TimestampMixin):
     __tablename__ = "person_countryality"
@@ -46,9 +47,14 @@ class Person(Base, ActiveMixin, TimestampMixin):
         lazy="joined"
     )
 
-    # Relación a perfiles
-    profiles: Mapped[list["Profile"]] = relationship(
-        "Profile",
+    # Relación a perfiles (one collection per concrete profile table, see Profile.person)
+    player_profiles: Mapped[list["PlayerProfile"]] = relationship(
+        "PlayerProfile",
+        back_populates="person",
+        cascade="all, delete-orphan"
+    )
+    manager_profiles: Mapped[list["ManagerProfile"]] = relationship(
+        "ManagerProfile",
         back_populates="person",
         cascade="all, delete-orphan"
     )
@@ -106,7 +112,11 @@ class Profile(ActiveMixin, TimestampMixin, Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     person_id: Mapped[int] = mapped_column(ForeignKey('person.id'))
-    person: Mapped[Person] = relationship("Person", back_populates="profiles")
+
+    # Relationships on an abstract base must be declared per concrete subclass
+    @declared_attr
+    def person(cls) -> Mapped[Person]:
+        return relationship("Person", back_populates=f"{cls.__tablename__}s")
 
 class ManagerProfile(Profile):
     __tablename__ = 'manager_profile'
@@ -1,18 +1,76 @@
-from sqlalchemy import ForeignKey, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Float
+from sqlalchemy.orm import Mapped, mapped_column, InstrumentedAttribute
 
-from ..types import JSONEncodedDict, JSONEncodedList
+from champyons.core.domain.entities.people.player_profile import PlayerProfile as PlayerProfileEntity
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+from ..types import PositionSetType
 
 from .person import Profile
 
+from dataclasses import fields
+
+SKILL_NAMES = tuple(f.name for f in fields(PlayerSkills))
 
 class PlayerProfile(Profile):
     __tablename__ = 'player_profile'
 
-    skills: Mapped[dict[str, float]] = mapped_column(JSONEncodedDict, nullable=False, default=dict)
-    positions: Mapped[list[str]] = mapped_column(JSONEncodedList, nullable=False, default=list)
+    # Skills. One indexed column per PlayerSkills field, so skill filters and rankings run in SQL
+    shooting: Mapped[float] = mapped_column(Float, nullable=False, default=10.0, index=True)
+    passing: Mapped[float] = mapped_column(Float, nullable=False, default=10.0, index=True)
+    dribbling: Mapped[float] = mapped_column(Float, nullable=False, default=10.0, index=True)
+    stamina: Mapped[float] = mapped_column(Float, nullable=False, default=10.0, index=True)
+    strength: Mapped[float] = mapped_column(Float, nullable=False, default=10.0, index=True)
+
+    positions: Mapped[PositionSet] = mapped_column(PositionSetType, nullable=False, default=PositionSet)
 
     __mapper_args__ = {
         "polymorphic_identity": "player",
         "concrete": True
-    }
\ No newline at end of file
+    }
+
+    @classmethod
+    def skill_column(cls, skill: str) -> InstrumentedAttribute[float]:
+        if skill not in SKILL_NAMES:
+            raise ValueError(f"Unknown skill: {skill}")
+        return getattr(cls, skill)
+
+    @property
+    def skills(self) -> PlayerSkills:
+        return PlayerSkills(**{name: getattr(self, name) for name in SKILL_NAMES})
+
+    @skills.setter
+    def skills(self, skills: PlayerSkills) -> None:
+        for name in SKILL_NAMES:
+            setattr(self, name, getattr(skills, name))
+
+    @classmethod
+    def from_entity(cls, entity: PlayerProfileEntity) -> "PlayerProfile":
+        model = cls(
+            id=entity.id,
+            person_id=entity.person_id,
+            positions=entity.positions,
+            active=entity.active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+        model.skills = entity.skills
+        return model
+
+    def update_from_entity(self, entity: PlayerProfileEntity) -> None:
+        self.person_id = entity.person_id
+        self.positions = entity.positions
+        self.active = entity.active
+        self.skills = entity.skills
+
+    def to_entity(self) -> PlayerProfileEntity:
+        return PlayerProfileEntity(
+            id=self.id,
+            person_id=self.person_id,
+            skills=self.skills,
+            positions=self.positions,
+            active=self.active,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
@@ -2,6 +2,8 @@ from sqlalchemy import Integer, String, SmallInteger
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from champyons.core.domain.entities.geography.region import Region as RegionEntity, RegionTypeEnum
+from champyons.core.ports.repositories.load_plan import LoadPlan, NO_RELATIONS
+from ..identity_map import materialize
 
 from ..base import Base
 from ..mixins import ActiveMixin, GeographyMixin, TimestampMixin
@@ -27,7 +29,6 @@ class Region(Base, ActiveMixin, GeographyMixin, TimestampMixin):
         "Country",
         secondary=country_region_table,
         back_populates="regions",
-        lazy="selectin",
     )
 
 
@@ -49,8 +50,8 @@ class Region(Base, ActiveMixin, GeographyMixin, TimestampMixin):
         self.geonames_id = entity.geonames_id
         self.active = entity.active
 
-    def to_entity(self, *, include_countries = False) -> RegionEntity:
-        return RegionEntity(
+    def to_entity(self, plan: LoadPlan = NO_RELATIONS) -> RegionEntity:
+        return materialize(self, RegionEntity, plan, lambda: RegionEntity(
             id=self.id,
             type=RegionTypeEnum(self.type),
             name=self.default_name,
@@ -58,8 +59,9 @@ class Region(Base, ActiveMixin, GeographyMixin, TimestampMixin):
             created_at=self.created_at,
             updated_at=self.updated_at,
             active=self.active,
-            countries=[country.to_entity() for country in self.countries] if include_countries else []
-        )
+        ), {
+            "countries": lambda p: [country.to_entity(p) for country in self.countries],
+        })
     
     
 
@@ -0,0 +1,37 @@
+from typing import Iterable, List
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.models.city_distance import city_distance_table, delete_city_distances
+from champyons.core.ports.repositories.city_distance import CityDistanceRepository, DistanceRow
+
+_table = city_distance_table
+
+class SqlAlchemyCityDistanceRepository(CityDistanceRepository):
+    """SQLAlchemy (Core) implementation of CityDistanceRepository, for SQLite saves."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_all(self) -> List[DistanceRow]:
+        stmt = sa.select(_table.c.city_a_id, _table.c.city_b_id, _table.c.distance_km)
+        return [tuple(row) for row in self.session.execute(stmt)]
+
+    def save_many(self, rows: Iterable[DistanceRow]) -> int:
+        values = [
+            {"city_a_id": min(a, b), "city_b_id": max(a, b), "distance_km": km}
+            for a, b, km in rows
+        ]
+        if not values:
+            return 0
+        stmt = sqlite_insert(_table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_table.c.city_a_id, _table.c.city_b_id],
+            set_={"distance_km": stmt.excluded.distance_km},
+        )
+        self.session.execute(stmt, values)
+        self.session.commit()
+        return len(values)
+
+    def delete_for_city(self, city_id: int) -> None:
+        self.session.execute(delete_city_distances(city_id))
+        self.session.commit()
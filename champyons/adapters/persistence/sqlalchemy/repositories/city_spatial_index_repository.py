@@ -0,0 +1,61 @@
+from typing import List, Optional
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.models.city_spatial import RTREE_TABLE
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint, MAX_DISTANCE_KM, haversine_km
+from champyons.core.ports.repositories.city_spatial_index import CityDistance, CitySpatialIndex
+
+# first radius tried by nearest(), grown fourfold until enough cities are found
+_INITIAL_SEARCH_KM = 50.0
+
+_BOX_QUERY = (
+    f"SELECT c.id, c.latitude, c.longitude FROM {RTREE_TABLE} r JOIN city c ON c.id = r.id "
+    "WHERE r.max_lat >= :min_lat_{i} AND r.min_lat <= :max_lat_{i} AND r.max_lon >= :min_lon_{i} AND r.min_lon <= :max_lon_{i}"
+)
+
+class SqliteCitySpatialIndex(CitySpatialIndex):
+    """
+    CitySpatialIndex on SQLite's rtree module. The R-tree narrows a query down to the cities inside
+    the bounding box of the search circle; exact great-circle distances are only computed for those.
+    """
+    def __init__(self, session: Session):
+        self.session = session
+
+    def within_radius(self, point: GeoPoint, radius_km: float, limit: Optional[int] = None) -> List[CityDistance]:
+        if limit is not None and limit < 1:
+            raise ValueError("Limit must be a positive integer")
+        boxes = point.bounding_boxes(radius_km)
+        params = {}
+        for i, (min_lat, max_lat, min_lon, max_lon) in enumerate(boxes):
+            params.update({f"min_lat_{i}": min_lat, f"max_lat_{i}": max_lat, f"min_lon_{i}": min_lon, f"max_lon_{i}": max_lon})
+        query = " UNION ".join(_BOX_QUERY.format(i=i) for i in range(len(boxes)))
+
+        matches = []
+        for city_id, latitude, longitude in self.session.execute(sa.text(query), params):
+            distance = haversine_km(point.latitude, point.longitude, latitude, longitude)
+            if distance <= radius_km:
+                matches.append(CityDistance(city_id, distance))
+        matches.sort(key=lambda m: (m.distance_km, m.city_id))
+        return matches[:limit] if limit is not None else matches
+
+    def nearest(self, point: GeoPoint, k: int = 1, max_distance_km: Optional[float] = None) -> List[CityDistance]:
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        limit = MAX_DISTANCE_KM if max_distance_km is None else min(max_distance_km, MAX_DISTANCE_KM)
+        radius = min(_INITIAL_SEARCH_KM, limit)
+        while True:
+            # every city within radius has been seen, so the k nearest of them are the k nearest overall
+            matches = self.within_radius(point, radius, limit=k)
+            if len(matches) == k or radius >= limit:
+                return matches
+            radius = min(radius * 4, limit)
+
+    def rebuild(self) -> int:
+        self.session.execute(sa.text(f"DELETE FROM {RTREE_TABLE}"))
+        self.session.execute(sa.text(
+            f"INSERT INTO {RTREE_TABLE} (id, min_lat, max_lat, min_lon, max_lon) "
+            "SELECT id, latitude, latitude, longitude, longitude FROM city "
+            "WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+        ))
+        self.session.commit()
+        return self.session.execute(sa.text(f"SELECT COUNT(*) FROM {RTREE_TABLE}")).scalar_one()
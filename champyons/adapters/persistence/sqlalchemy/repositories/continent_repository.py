@@ -1,29 +1,32 @@
-from typing import List
+from typing import List, Optional
 import sqlalchemy as sa
 from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.load_plans import planned_select
 from champyons.adapters.persistence.sqlalchemy.models.continent import Continent as ContinentModel
+from champyons.adapters.persistence.sqlalchemy.streaming import StreamingRepositoryMixin
 from champyons.core.domain.entities.geography.continent import Continent as ContinentEntity
 from champyons.core.ports.repositories.continent import ContinentRepository
+from champyons.core.ports.repositories.load_plan import LoadPlan
 
-class SqlAlchemyContinentRepository(ContinentRepository):
+class SqlAlchemyContinentRepository(StreamingRepositoryMixin, ContinentRepository):
     """SQLAlchemy implementation of ContinentRepository."""
+    model = ContinentModel
+    field_map = {"name": "default_name"}
+    default_plan = LoadPlan.of("countries")
+
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_id(self, entity_id: int) -> ContinentEntity | None:
-        stmt = sa.select(ContinentModel).filter(ContinentModel.id == entity_id)
-        result = self.session.execute(stmt).scalar_one_or_none()
-        return result.to_entity(include_nations=True) if result else None
+    def get_by_id(self, entity_id: int, plan: Optional[LoadPlan] = None) -> ContinentEntity | None:
+        return self._get_one(ContinentModel.id == entity_id, plan)
     
-    def get_by_code(self, code: str) -> ContinentEntity | None:
-        stmt = sa.select(ContinentModel).filter(ContinentModel.code == code)
-        result = self.session.execute(stmt).scalar_one_or_none()
-        return result.to_entity(include_nations=True) if result else None
+    def get_by_code(self, code: str, plan: Optional[LoadPlan] = None) -> ContinentEntity | None:
+        return self._get_one(ContinentModel.code == code, plan)
 
-    def get_all(self) -> List[ContinentEntity]:
-        stmt = sa.select(ContinentModel)
-        results = self.session.execute(stmt).scalars().all()
-        return [n.to_entity(include_nations=True) for n in results]
+    def get_all(self, plan: Optional[LoadPlan] = None) -> List[ContinentEntity]:
+        plan = self.default_plan if plan is None else plan
+        results = self.session.execute(planned_select(ContinentModel, plan)).unique().scalars().all()
+        return [n.to_entity(plan) for n in results]
 
     def save(self, entity: ContinentEntity) -> ContinentEntity:
         if entity.id is None:
@@ -39,9 +42,7 @@ class SqlAlchemyContinentRepository(ContinentRepository):
             model.update_from_entity(entity)
 
         self.session.commit()
-        self.session.refresh(model)
-
-        return model.to_entity(include_nations=True)
+        return self.get_by_id(model.id)
 
     def delete(self, entity: ContinentEntity) -> None:
         stmt = sa.select(ContinentModel).filter(ContinentModel.id == entity.id)
@@ -50,3 +51,10 @@ class SqlAlchemyContinentRepository(ContinentRepository):
             self.session.delete(result)
             self.session.commit()
 
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> ContinentEntity | None:
+        return self._get_one(ContinentModel.geonames_id == geonames_id, plan)
+
+    def _get_one(self, condition, plan: Optional[LoadPlan]) -> ContinentEntity | None:
+        plan = self.default_plan if plan is None else plan
+        result = self.session.execute(planned_select(ContinentModel, plan).filter(condition)).unique().scalar_one_or_none()
+        return result.to_entity(plan) if result else None
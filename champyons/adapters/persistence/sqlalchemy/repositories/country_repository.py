@@ -0,0 +1,99 @@
+from typing import List, Optional
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.load_plans import planned_select
+from champyons.adapters.persistence.sqlalchemy.models.country import Country as CountryModel
+from champyons.adapters.persistence.sqlalchemy.models.country_region import country_region_table
+from champyons.adapters.persistence.sqlalchemy.streaming import StreamingRepositoryMixin
+from champyons.core.domain.entities.geography.country import Country as CountryEntity
+from champyons.core.ports.repositories.country import CountryRepository, CountryRow
+from champyons.core.ports.repositories.load_plan import LoadPlan
+
+_country = CountryModel.__table__
+
+# Core columns of CountryRow, in field order
+_ROW_COLUMNS = (
+    _country.c.id,
+    _country.c.code,
+    _country.c.default_name.label("name"),
+    _country.c.continent_id,
+    _country.c.parent_id,
+    _country.c.geonames_id,
+    _country.c.active,
+    _country.c.created_at,
+    _country.c.updated_at,
+    # region ids folded into one "1,4" string per country by the GROUP BY of get_rows
+    sa.func.aggregate_strings(sa.cast(country_region_table.c.region_id, sa.String), ",").label("region_ids"),
+)
+
+def _to_row(result) -> CountryRow:
+    *columns, region_ids = result
+    return CountryRow(*columns, tuple(sorted(map(int, region_ids.split(",")))) if region_ids else ())
+
+class SqlAlchemyCountryRepository(StreamingRepositoryMixin, CountryRepository):
+    """SQLAlchemy implementation of CountryRepository."""
+    model = CountryModel
+    field_map = {"name": "default_name"}
+    default_plan = LoadPlan.of("continent", "regions", "parent", "children")
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_id(self, entity_id: int, plan: Optional[LoadPlan] = None) -> CountryEntity | None:
+        return self._get_one(CountryModel.id == entity_id, plan)
+
+    def get_all(self, plan: Optional[LoadPlan] = None) -> List[CountryEntity]:
+        plan = self.default_plan if plan is None else plan
+        results = self.session.execute(planned_select(CountryModel, plan)).unique().scalars().all()
+        return [n.to_entity(plan) for n in results]
+
+    def save(self, entity: CountryEntity) -> CountryEntity:
+        if entity.id is None:
+            # CREATE
+            model = CountryModel.from_entity(entity)
+            self.session.add(model)
+        else:
+            # UPDATE
+            model = self.session.get(CountryModel, entity.id)
+            if model is None:
+                raise ValueError(f"Country {entity.id} not found")
+
+            model.update_from_entity(entity)
+
+        self.session.commit()
+        return self.get_by_id(model.id)
+
+    def delete(self, entity: CountryEntity) -> None:
+        model = self.session.get(CountryModel, entity.id)
+        if model:
+            self.session.delete(model)
+            self.session.commit()
+
+    def get_by_code(self, code: str, plan: Optional[LoadPlan] = None) -> CountryEntity | None:
+        return self._get_one(CountryModel.code == code, plan)
+
+    def get_by_continent_id(self, continent_id: int, plan: Optional[LoadPlan] = None) -> List[CountryEntity]:
+        plan = self.default_plan if plan is None else plan
+        stmt = planned_select(CountryModel, plan).filter(CountryModel.continent_id == continent_id)
+        results = self.session.execute(stmt).unique().scalars().all()
+        return [n.to_entity(plan) for n in results]
+
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> CountryEntity | None:
+        return self._get_one(CountryModel.geonames_id == geonames_id, plan)
+
+    def get_rows(self, continent_id: Optional[int] = None) -> List[CountryRow]:
+        """ One grouped Core SELECT straight into tuples: no ORM identity map, no entities """
+        stmt = (
+            sa.select(*_ROW_COLUMNS)
+            .outerjoin(country_region_table, country_region_table.c.country_id == _country.c.id)
+            .group_by(_country.c.id)
+            .order_by(_country.c.id)
+        )
+        if continent_id is not None:
+            stmt = stmt.where(_country.c.continent_id == continent_id)
+        return list(map(_to_row, self.session.execute(stmt)))
+
+    def _get_one(self, condition, plan: Optional[LoadPlan]) -> CountryEntity | None:
+        plan = self.default_plan if plan is None else plan
+        result = self.session.execute(planned_select(CountryModel, plan).filter(condition)).unique().scalar_one_or_none()
+        return result.to_entity(plan) if result else None
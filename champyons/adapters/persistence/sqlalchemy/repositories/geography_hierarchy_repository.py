@@ -0,0 +1,91 @@
+from typing import List, Optional
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.models.city import City as CityModel
+from champyons.adapters.persistence.sqlalchemy.models.country import Country as CountryModel
+from champyons.adapters.persistence.sqlalchemy.models.geography_closure import GeographyClosure
+from champyons.adapters.persistence.sqlalchemy.models.local_region import LocalRegion as LocalRegionModel
+from champyons.core.domain.enums.geography import GeographyType
+from champyons.core.ports.repositories.geography_hierarchy import GeographyHierarchy, GeographyNode
+
+_closure = GeographyClosure.__table__
+
+_COLUMNS = ["ancestor_type", "ancestor_id", "descendant_type", "descendant_id", "depth"]
+
+class SqlAlchemyGeographyHierarchy(GeographyHierarchy):
+    """SQLAlchemy implementation of GeographyHierarchy, backed by the geography_closure table."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def ancestors(self, geography_type: GeographyType, entity_id: int) -> List[GeographyNode]:
+        stmt = (
+            sa.select(_closure.c.ancestor_type, _closure.c.ancestor_id, _closure.c.depth)
+            .where(_closure.c.descendant_type == geography_type, _closure.c.descendant_id == entity_id, _closure.c.depth > 0)
+            .order_by(_closure.c.depth)
+        )
+        return [GeographyNode(GeographyType(t), i, d) for t, i, d in self.session.execute(stmt)]
+
+    def descendants(
+        self,
+        geography_type: GeographyType,
+        entity_id: int,
+        of_type: Optional[GeographyType] = None,
+        max_depth: Optional[int] = None,
+    ) -> List[GeographyNode]:
+        stmt = (
+            sa.select(_closure.c.descendant_type, _closure.c.descendant_id, _closure.c.depth)
+            .where(_closure.c.ancestor_type == geography_type, _closure.c.ancestor_id == entity_id, _closure.c.depth > 0)
+            .order_by(_closure.c.depth, _closure.c.descendant_type, _closure.c.descendant_id)
+        )
+        if of_type is not None:
+            stmt = stmt.where(_closure.c.descendant_type == of_type)
+        if max_depth is not None:
+            stmt = stmt.where(_closure.c.depth <= max_depth)
+        return [GeographyNode(GeographyType(t), i, d) for t, i, d in self.session.execute(stmt)]
+
+    def rebuild(self) -> int:
+        """ One recursive INSERT ... SELECT walking the parent links down from every node """
+        self.session.execute(_closure.delete())
+        paths = sa.select(_nodes().subquery("nodes")).cte("paths", recursive=True)
+        edges = _edges().subquery("edges")
+        paths = paths.union_all(
+            sa.select(paths.c.ancestor_type, paths.c.ancestor_id, edges.c.child_type, edges.c.child_id, paths.c.depth + 1)
+            .where(edges.c.parent_type == paths.c.descendant_type, edges.c.parent_id == paths.c.descendant_id)
+        )
+        self.session.execute(_closure.insert().from_select(_COLUMNS, sa.select(paths)))
+        self.session.commit()
+        return self.session.execute(sa.select(sa.func.count()).select_from(_closure)).scalar_one()
+
+
+def _nodes() -> sa.CompoundSelect:
+    """ Depth 0 path of every node """
+    return sa.union_all(*(
+        sa.select(
+            sa.literal(int(t)).label("ancestor_type"), model.id.label("ancestor_id"),
+            sa.literal(int(t)).label("descendant_type"), model.id.label("descendant_id"), sa.literal(0).label("depth"),
+        )
+        for t, model in ((GeographyType.COUNTRY, CountryModel), (GeographyType.LOCAL_REGION, LocalRegionModel), (GeographyType.CITY, CityModel))
+    ))
+
+
+def _edges() -> sa.CompoundSelect:
+    """ (child, parent) link of every node that has a parent, as in geography_closure.parent_node """
+    def parent_of(local_region_id, country_id):
+        return (
+            sa.case((local_region_id.is_not(None), sa.literal(int(GeographyType.LOCAL_REGION))), else_=sa.literal(int(GeographyType.COUNTRY))),
+            sa.func.coalesce(local_region_id, country_id),
+        )
+    return sa.union_all(
+        sa.select(
+            sa.literal(int(GeographyType.COUNTRY)).label("child_type"), CountryModel.id.label("child_id"),
+            sa.literal(int(GeographyType.COUNTRY)).label("parent_type"), CountryModel.parent_id.label("parent_id"),
+        ).where(CountryModel.parent_id.is_not(None)),
+        sa.select(
+            sa.literal(int(GeographyType.LOCAL_REGION)), LocalRegionModel.id,
+            *parent_of(LocalRegionModel.parent_local_region_id, LocalRegionModel.country_id),
+        ),
+        sa.select(
+            sa.literal(int(GeographyType.CITY)), CityModel.id,
+            *parent_of(CityModel.local_region_id, CityModel.country_id),
+        ),
+    )
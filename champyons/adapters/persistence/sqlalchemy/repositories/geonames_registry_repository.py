@@ -0,0 +1,44 @@
+from typing import Dict, Iterable, Optional
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.models.geonames_registry import GEOGRAPHY_MODELS, GeonamesRegistryEntry
+from champyons.core.domain.enums.geography import GeographyType
+from champyons.core.ports.repositories.geonames_registry import GeonamesRef, GeonamesRegistry
+
+_registry = GeonamesRegistryEntry.__table__
+
+# ids per IN query, well below the bound parameter limit of every backend
+_BATCH_SIZE = 1000
+
+class SqlAlchemyGeonamesRegistry(GeonamesRegistry):
+    """SQLAlchemy implementation of GeonamesRegistry, backed by the geonames_registry table."""
+    def __init__(self, session: Session):
+        self.session = session
+
+    def resolve(self, geonames_id: int) -> Optional[GeonamesRef]:
+        return self.resolve_many([geonames_id]).get(geonames_id)
+
+    def resolve_many(self, geonames_ids: Iterable[int]) -> Dict[int, GeonamesRef]:
+        ids = list(dict.fromkeys(geonames_ids))
+        resolved: Dict[int, GeonamesRef] = {}
+        for start in range(0, len(ids), _BATCH_SIZE):
+            stmt = (
+                sa.select(_registry.c.geonames_id, _registry.c.geography_type, _registry.c.entity_id)
+                .where(_registry.c.geonames_id.in_(ids[start:start + _BATCH_SIZE]))
+                .order_by(_registry.c.geography_type.desc())
+            )
+            # highest priority last, so it overwrites the others
+            for geonames_id, geography_type, entity_id in self.session.execute(stmt):
+                resolved[geonames_id] = GeonamesRef(geonames_id, GeographyType(geography_type), entity_id)
+        return resolved
+
+    def rebuild(self) -> int:
+        self.session.execute(_registry.delete())
+        for geography_type, model in GEOGRAPHY_MODELS.items():
+            table = model.__table__
+            self.session.execute(_registry.insert().from_select(
+                ["geography_type", "entity_id", "geonames_id"],
+                sa.select(sa.literal(int(geography_type)), table.c.id, table.c.geonames_id).where(table.c.geonames_id.is_not(None)),
+            ))
+        self.session.commit()
+        return self.session.execute(sa.select(sa.func.count()).select_from(_registry)).scalar_one()
@@ -0,0 +1,90 @@
+from typing import List
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.models.player import PlayerProfile as PlayerProfileModel
+from champyons.adapters.persistence.sqlalchemy.streaming import StreamingRepositoryMixin
+from champyons.core.domain.entities.people.player_profile import PlayerProfile as PlayerProfileEntity
+from champyons.core.ports.repositories.player_profile import PlayerProfileRepository, PlayerProfileSearch
+
+class SqlAlchemyPlayerProfileRepository(StreamingRepositoryMixin, PlayerProfileRepository):
+    """SQLAlchemy implementation of PlayerProfileRepository."""
+    model = PlayerProfileModel
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_id(self, entity_id: int) -> PlayerProfileEntity | None:
+        stmt = sa.select(PlayerProfileModel).filter(PlayerProfileModel.id == entity_id)
+        result = self.session.execute(stmt).scalar_one_or_none()
+        return result.to_entity() if result else None
+
+    def get_by_person_id(self, person_id: int) -> PlayerProfileEntity | None:
+        stmt = sa.select(PlayerProfileModel).filter(PlayerProfileModel.person_id == person_id)
+        result = self.session.execute(stmt).scalar_one_or_none()
+        return result.to_entity() if result else None
+
+    def get_all(self) -> List[PlayerProfileEntity]:
+        stmt = sa.select(PlayerProfileModel)
+        results = self.session.execute(stmt).scalars().all()
+        return [p.to_entity() for p in results]
+
+    def search(self, query: PlayerProfileSearch) -> List[PlayerProfileEntity]:
+        stmt = self._build_search_statement(query)
+        results = self.session.execute(stmt).scalars().all()
+        return [p.to_entity() for p in results]
+
+    def save(self, entity: PlayerProfileEntity) -> PlayerProfileEntity:
+        if entity.id is None:
+            # CREATE
+            model = PlayerProfileModel.from_entity(entity)
+            self.session.add(model)
+        else:
+            # UPDATE
+            model = self.session.get(PlayerProfileModel, entity.id)
+            if model is None:
+                raise ValueError(f"Player profile {entity.id} not found")
+
+            model.update_from_entity(entity)
+
+        self.session.commit()
+        self.session.refresh(model)
+
+        return model.to_entity()
+
+    def delete(self, entity: PlayerProfileEntity) -> None:
+        stmt = sa.select(PlayerProfileModel).filter(PlayerProfileModel.id == entity.id)
+        result = self.session.execute(stmt).scalar_one_or_none()
+        if result:
+            self.session.delete(result)
+            self.session.commit()
+
+    @staticmethod
+    def _build_search_statement(query: PlayerProfileSearch) -> sa.Select:
+        """ Translates a scouting query into a single SELECT: filters, ranking and limit run in the database """
+        stmt = sa.select(PlayerProfileModel)
+
+        if query.active_only:
+            stmt = stmt.where(PlayerProfileModel.active.is_(True))
+
+        for skill, value in query.min_skills.items():
+            stmt = stmt.where(PlayerProfileModel.skill_column(skill) >= value)
+
+        for skill, value in query.max_skills.items():
+            stmt = stmt.where(PlayerProfileModel.skill_column(skill) <= value)
+
+        if query.positions is not None:
+            stmt = stmt.where(PlayerProfileModel.positions.intersects(query.positions))
+
+        if query.order_by_weights:
+            score = sum(
+                (PlayerProfileModel.skill_column(skill) * weight for skill, weight in query.order_by_weights.items()),
+                sa.literal(0.0)
+            )
+            stmt = stmt.order_by(score.desc(), PlayerProfileModel.id)
+        else:
+            stmt = stmt.order_by(PlayerProfileModel.id)
+
+        if query.limit is not None:
+            stmt = stmt.limit(query.limit)
+
+        return stmt
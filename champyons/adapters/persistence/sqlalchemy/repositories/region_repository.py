@@ -1,24 +1,29 @@
-from typing import List
+from typing import List, Optional
 import sqlalchemy as sa
 from sqlalchemy.orm import Session
+from champyons.adapters.persistence.sqlalchemy.load_plans import planned_select
 from champyons.adapters.persistence.sqlalchemy.models.region import Region as RegionModel
+from champyons.adapters.persistence.sqlalchemy.streaming import StreamingRepositoryMixin
 from champyons.core.domain.entities.geography.region import Region as RegionEntity
 from champyons.core.ports.repositories.region import RegionRepository
+from champyons.core.ports.repositories.load_plan import LoadPlan
 
-class SqlAlchemyRegionRepository(RegionRepository):
+class SqlAlchemyRegionRepository(StreamingRepositoryMixin, RegionRepository):
     """SQLAlchemy implementation of RegionRepository."""
+    model = RegionModel
+    field_map = {"name": "default_name"}
+    default_plan = LoadPlan.of("countries")
+
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_id(self, entity_id: int) -> RegionEntity | None:
-        stmt = sa.select(RegionModel).filter(RegionModel.id == entity_id)
-        result = self.session.execute(stmt).scalar_one_or_none()
-        return result.to_entity(include_nations=True) if result else None
+    def get_by_id(self, entity_id: int, plan: Optional[LoadPlan] = None) -> RegionEntity | None:
+        return self._get_one(RegionModel.id == entity_id, plan)
 
-    def get_all(self) -> List[RegionEntity]:
-        stmt = sa.select(RegionModel)
-        results = self.session.execute(stmt).scalars().all()
-        return [n.to_entity(include_nations=True) for n in results]
+    def get_all(self, plan: Optional[LoadPlan] = None) -> List[RegionEntity]:
+        plan = self.default_plan if plan is None else plan
+        results = self.session.execute(planned_select(RegionModel, plan)).unique().scalars().all()
+        return [n.to_entity(plan) for n in results]
 
     def save(self, entity: RegionEntity) -> RegionEntity:
         if entity.id is None:
@@ -34,9 +39,7 @@ class SqlAlchemyRegionRepository(RegionRepository):
             model.update_from_entity(entity)
 
         self.session.commit()
-        self.session.refresh(model)
-
-        return model.to_entity(include_nations=True)
+        return self.get_by_id(model.id)
 
     def delete(self, entity: RegionEntity) -> None:
         stmt = sa.select(RegionModel).filter(RegionModel.id == entity.id)
@@ -45,3 +48,10 @@ class SqlAlchemyRegionRepository(RegionRepository):
             self.session.delete(result)
             self.session.commit()
 
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> RegionEntity | None:
+        return self._get_one(RegionModel.geonames_id == geonames_id, plan)
+
+    def _get_one(self, condition, plan: Optional[LoadPlan]) -> RegionEntity | None:
+        plan = self.default_plan if plan is None else plan
+        result = self.session.execute(planned_select(RegionModel, plan).filter(condition)).unique().scalar_one_or_none()
+        return result.to_entity(plan) if result else None
@@ -0,0 +1,228 @@
+"""
+Save branches
+
+Forks of the game database ("what-if" branches for AI testing, earlier saves to load back).
+Forking uses SQLite's online backup API, which copies database pages inside SQLite: no rows go
+through Python or the ORM, so branching a large save is bound by disk I/O. The source can stay
+open (and even be written) while it is copied.
+
+Every branch is a database file in the saves directory. Branch metadata (parent and fork time)
+lives in a sidecar index, `branches.json`, next to them, so the game databases only hold the game
+schema. Branches are compared table by table inside SQLite (ATTACH + EXCEPT).
+
+Usage:
+------
+    saves = SaveManager(config.saves_path)
+    saves.fork("before-derby", source=engine)       # branch the running game
+    saves.fork("derby-ai-test", source="before-derby")
+    for diff in saves.diff("before-derby", "derby-ai-test"):
+        print(diff.table, diff.added, diff.removed)
+    session = sessionmaker(bind=saves.engine("derby-ai-test"))()
+"""
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import json
+import os
+import re
+import sqlite3
+
+from sqlalchemy import Engine
+
+from champyons.adapters.persistence.sqlalchemy.engine import create_sqlite_engine
+
+SAVE_SUFFIX = ".db"
+INDEX_NAME = "branches.json"
+
+_NAME_PATTERN = re.compile(r"^[\w.-]+$")
+
+ProgressCallback = Callable[[int, int], None] # (remaining pages, total pages)
+
+
+@dataclass(frozen=True)
+class SaveBranch:
+    name: str
+    path: Path
+    parent: Optional[str]
+    forked_at: Optional[datetime]
+    size: int # bytes
+
+
+@dataclass(frozen=True)
+class TableDiff:
+    """ Row-level differences of a table between two branches. Updated rows count as removed + added """
+    table: str
+    rows_a: int
+    rows_b: int
+    removed: int # rows of a missing from b
+    added: int # rows of b missing from a
+    schema_changed: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return self.schema_changed or self.removed > 0 or self.added > 0
+
+
+class SaveManager:
+    """
+    Args:
+        directory: folder holding the branches
+        pages_per_step: pages copied per backup step. Smaller steps release the source lock more
+            often, so the game can keep writing while it is forked. -1 copies everything at once
+    """
+    def __init__(self, directory: str | Path, pages_per_step: int = 4096):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.pages_per_step = pages_per_step
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / INDEX_NAME
+
+    def path(self, name: str) -> Path:
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid save name: {name!r}")
+        return self.directory / f"{name}{SAVE_SUFFIX}"
+
+    def exists(self, name: str) -> bool:
+        return self.path(name).exists()
+
+    def engine(self, name: str) -> Engine:
+        if not self.exists(name):
+            raise ValueError(f"Save {name} does not exist")
+        return create_sqlite_engine(self.path(name))
+
+    def fork(self, name: str, source: str | Path | Engine, progress: Optional[ProgressCallback] = None) -> SaveBranch:
+        """
+        Copies a database into a new branch. Source may be a branch name (str), a database file
+        (Path: strings are always read as branch names) or an engine of a SQLite database (e.g. the
+        running game)
+        """
+        target = self.path(name)
+        if target.exists():
+            raise ValueError(f"Save {name} already exists")
+        forked_at = datetime.now(UTC)
+
+        parent: Optional[str] = None
+        if isinstance(source, Engine):
+            if source.dialect.name != "sqlite":
+                raise ValueError("Only SQLite databases can be forked")
+            raw = source.raw_connection()
+            try:
+                self._backup(raw.driver_connection, target, progress)
+            finally:
+                raw.close()
+        else:
+            if isinstance(source, str):
+                if not _NAME_PATTERN.match(source):
+                    raise ValueError(f"Invalid save name: {source!r} (pass database files as a Path)")
+                if not self.exists(source):
+                    raise ValueError(f"Save {source} does not exist")
+                parent, source = source, self.path(source)
+            elif not source.exists():
+                raise ValueError(f"Database {source} does not exist")
+            connection = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+            try:
+                self._backup(connection, target, progress)
+            finally:
+                connection.close()
+
+        index = self._read_index()
+        index[name] = {"parent": parent, "forked_at": forked_at.isoformat()}
+        self._write_index(index)
+        return self.get(name)
+
+    def get(self, name: str) -> SaveBranch:
+        path = self.path(name)
+        if not path.exists():
+            raise ValueError(f"Save {name} does not exist")
+        # Databases copied into the folder by hand have no entry
+        entry = self._read_index().get(name, {})
+        forked_at = datetime.fromisoformat(entry["forked_at"]) if entry.get("forked_at") else None
+        return SaveBranch(name=name, path=path, parent=entry.get("parent"), forked_at=forked_at, size=path.stat().st_size)
+
+    def list(self) -> List[SaveBranch]:
+        """ Branches, oldest fork first """
+        branches = [self.get(path.stem) for path in self.directory.glob(f"*{SAVE_SUFFIX}") if _NAME_PATTERN.match(path.stem)]
+        return sorted(branches, key=lambda b: (b.forked_at or datetime.min.replace(tzinfo=UTC), b.name))
+
+    def delete(self, name: str) -> None:
+        path = self.path(name)
+        if not path.exists():
+            raise ValueError(f"Save {name} does not exist")
+        path.unlink()
+        index = self._read_index()
+        if index.pop(name, None) is not None:
+            self._write_index(index)
+
+    def diff(self, a: str, b: str) -> List[TableDiff]:
+        """ Table level differences between two branches, computed inside SQLite """
+        for name in (a, b):
+            if not self.exists(name):
+                raise ValueError(f"Save {name} does not exist")
+        connection = sqlite3.connect(f"file:{self.path(a)}?mode=ro", uri=True)
+        try:
+            connection.execute("ATTACH DATABASE ? AS other", (f"file:{self.path(b)}?mode=ro",))
+            tables_a, tables_b = _tables(connection, "main"), _tables(connection, "other")
+            diffs = []
+            for table in sorted(tables_a | tables_b):
+                rows_a = _count(connection, "main", table) if table in tables_a else 0
+                rows_b = _count(connection, "other", table) if table in tables_b else 0
+                if table not in tables_a or table not in tables_b:
+                    diffs.append(TableDiff(table, rows_a, rows_b, removed=rows_a, added=rows_b, schema_changed=True))
+                    continue
+                columns_a, columns_b = _columns(connection, "main", table), _columns(connection, "other", table)
+                columns = ", ".join(f'"{c}"' for c in columns_a if c in columns_b)
+                removed = _count_query(connection, f'SELECT {columns} FROM main."{table}" EXCEPT SELECT {columns} FROM other."{table}"')
+                added = _count_query(connection, f'SELECT {columns} FROM other."{table}" EXCEPT SELECT {columns} FROM main."{table}"')
+                diffs.append(TableDiff(table, rows_a, rows_b, removed, added, schema_changed=columns_a != columns_b))
+            return diffs
+        finally:
+            connection.close()
+
+    def _backup(self, source: sqlite3.Connection, target: Path, progress: Optional[ProgressCallback]) -> None:
+        """ Page-level copy into a temporary file, which replaces the target once complete """
+        tmp_path = target.with_name(target.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        destination = sqlite3.connect(tmp_path)
+        try:
+            source.backup(
+                destination,
+                pages=self.pages_per_step,
+                progress=(lambda status, remaining, total: progress(remaining, total)) if progress else None,
+            )
+        except BaseException:
+            destination.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        destination.close()
+        os.replace(tmp_path, target)
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        return json.loads(self.index_path.read_text(encoding="utf-8"))
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        # Written aside and swapped in, so a crash never leaves a truncated index
+        tmp_path = self.index_path.with_name(INDEX_NAME + ".tmp")
+        tmp_path.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+
+def _tables(connection: sqlite3.Connection, schema: str) -> set[str]:
+    rows = connection.execute(f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+    return {row[0] for row in rows}
+
+
+def _columns(connection: sqlite3.Connection, schema: str, table: str) -> List[str]:
+    return [row[1] for row in connection.execute(f'PRAGMA {schema}.table_info("{table}")')]
+
+
+def _count(connection: sqlite3.Connection, schema: str, table: str) -> int:
+    return connection.execute(f'SELECT COUNT(*) FROM {schema}."{table}"').fetchone()[0]
+
+
+def _count_query(connection: sqlite3.Connection, query: str) -> int:
+    return connection.execute(f"SELECT COUNT(*) FROM ({query})").fetchone()[0]
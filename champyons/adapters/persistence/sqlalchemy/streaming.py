@@ -0,0 +1,72 @@
+"""
+Streaming reads
+
+`iter_all` and `page` of the repository ports for any model with an integer `id` primary key:
+
+- iter_all runs a single SELECT with yield_per: rows are fetched batch_size at a time (on a
+  server-side cursor where the driver has one) and turned into entities as they arrive, so memory
+  stays bounded by one batch whatever the size of the table
+- page is keyset pagination (WHERE id > :after_id ORDER BY id LIMIT :limit): every page costs the
+  same, unlike OFFSET, which re-reads all the skipped rows
+
+Relations are never loaded by these reads (entities come with their relations empty, as with
+NO_RELATIONS). Do not commit through the same session while iter_all is being consumed.
+
+Usage:
+------
+    class SqlAlchemyCountryRepository(StreamingRepositoryMixin, CountryRepository):
+        model = CountryModel
+        field_map = {"name": "default_name"}
+
+    for country in repository.iter_all(batch_size=500, where={"continent_id": 3}):
+        ...
+"""
+from typing import Any, Iterator, List, Mapping, Optional
+
+from sqlalchemy import Select, inspect
+from sqlalchemy.orm import Session
+
+from champyons.adapters.persistence.sqlalchemy.load_plans import planned_select
+from champyons.core.ports.repositories.load_plan import NO_RELATIONS
+
+
+class StreamingRepositoryMixin:
+    """ Implements iter_all and page. Needs `session` and `model`; `field_map` maps entity fields to model attributes where names differ """
+    session: Session
+    model: type
+    field_map: Mapping[str, str] = {}
+
+    def iter_all(self, batch_size: int = 1000, where: Optional[Mapping[str, Any]] = None) -> Iterator[Any]:
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer")
+        stmt = self._streaming_select(where).order_by(self.model.id).execution_options(yield_per=batch_size)
+        result = self.session.execute(stmt).scalars()
+        try:
+            for batch in result.partitions():
+                for model in batch:
+                    yield self._to_entity(model)
+        finally:
+            result.close()
+
+    def page(self, after_id: Optional[int] = None, limit: int = 100, where: Optional[Mapping[str, Any]] = None) -> List[Any]:
+        if limit < 1:
+            raise ValueError("Limit must be a positive integer")
+        stmt = self._streaming_select(where)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        results = self.session.execute(stmt.order_by(self.model.id).limit(limit)).scalars()
+        return [self._to_entity(model) for model in results]
+
+    def _to_entity(self, model: Any) -> Any:
+        return model.to_entity()
+
+    def _streaming_select(self, where: Optional[Mapping[str, Any]]) -> Select:
+        stmt = planned_select(self.model, NO_RELATIONS)
+        columns = inspect(self.model).columns
+        for name, value in (where or {}).items():
+            key = self.field_map.get(name, name)
+            if key not in columns:
+                raise ValueError(f"{self.model.__name__} cannot be filtered by {name}")
+            column = columns[key]
+            stmt = stmt.where(column.is_(None) if value is None else column == value)
+        return stmt
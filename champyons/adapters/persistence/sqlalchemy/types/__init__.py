@@ -1,9 +1,11 @@
 from .dicts import JSONEncodedDict
 from .datetime import UTCDateTime
 from .lists import JSONEncodedList
+from .positions import PositionSetType
 
 __all__ = [
     "JSONEncodedDict",
     "UTCDateTime",
-    "JSONEncodedList"
+    "JSONEncodedList",
+    "PositionSetType",
 ]
\ No newline at end of file
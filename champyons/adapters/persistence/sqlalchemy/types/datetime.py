@@ -6,6 +6,7 @@ class UTCDateTime(TypeDecorator):
     """Ensures datetime is stored in the server timezone."""
 
     impl = DateTime
+    cache_ok = True
 
     def process_bind_param(self, value: Optional[datetime], dialect):
         if value is None:
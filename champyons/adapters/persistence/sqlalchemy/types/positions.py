@@ -0,0 +1,35 @@
+from sqlalchemy import type_coerce
+from sqlalchemy.types import TypeDecorator, Integer
+from typing import Optional
+
+from champyons.core.domain.enums.player_positions import Position
+from champyons.core.domain.value_objects.player.player_positions import PositionSet, POSITION_BITS
+
+class PositionSetType(TypeDecorator):
+    """
+    Stores a PositionSet as its integer bitmask.
+    - Accepts PositionSet or any iterable of positions/position codes
+    - Deserializes back to PositionSet on load
+    - Adds SQL-side helpers, e.g. select(PlayerProfile).where(PlayerProfile.positions.can_play(Position.LB))
+    """
+    impl = Integer
+    cache_ok = True
+
+    class comparator_factory(Integer.Comparator):
+        def can_play(self, position: Position | str):
+            return type_coerce(self.expr, Integer).op("&")(POSITION_BITS[Position(position)]) != 0
+
+        def intersects(self, positions: PositionSet):
+            return type_coerce(self.expr, Integer).op("&")(positions.mask) != 0
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return 0
+        if isinstance(value, int):
+            value = PositionSet(value)
+        elif not isinstance(value, PositionSet):
+            value = PositionSet.from_positions(value)
+        return value.mask
+
+    def process_result_value(self, value: Optional[int], dialect):
+        return PositionSet(value or 0)
@@ -1,8 +1,8 @@
 from .region import RegionRead
 from .continent import ContinentRead
-from .country import NationRead
+from .country import CountryRead
 
 RegionRead.model_rebuild()
-NationRead.model_rebuild()
+CountryRead.model_rebuild()
 ContinentRead.model_rebuild()
 
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from .city import CityRead
     from .local_region import LocalRegionRead
     from champyons.core.domain.entities.geography.country import Country as CountryEntity
+    from champyons.core.ports.repositories.country import CountryRow
 
 class CountryBase(BaseModel):
     default_name: str
@@ -174,6 +175,34 @@ class CountryRead(CountryBase):
         return self
     
    
+    @classmethod
+    def from_row(cls, row: "CountryRow") -> "CountryRead":
+        """
+        Builds the read model from a trusted database row, skipping validation. Relations are left empty,
+        region_ids come from the row.
+        Every field is passed explicitly: resolving default factories is the slow part of model_construct
+        """
+        return cls.model_construct(
+            id=row.id,
+            default_name=row.name,
+            name=row.name,
+            code=row.code,
+            continent_id=row.continent_id,
+            parent_id=row.parent_id,
+            geonames_id=row.geonames_id,
+            active=row.active,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            region_ids=list(row.region_ids),
+            denonyms=[],
+            name_translations={},
+            denonyms_translations={},
+            continent=None,
+            regions=[],
+            parent=None,
+            children=[],
+        )
+
     @classmethod
     def from_entity(cls, entity: "CountryEntity", *, include_continent: bool = True, include_region: bool = True, include_parent: bool = True, include_children: bool = False) -> "CountryRead":
         if not entity.id:
@@ -194,6 +223,7 @@ class CountryRead(CountryBase):
             created_at=entity.created_at,
             updated_at=entity.updated_at,
             active=entity.active,
+            region_ids=[region.id for region in entity.regions],
             continent=continent,
             region=regions,
             parent=parent,
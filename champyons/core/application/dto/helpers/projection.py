@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+class Projection(StrEnum):
+    """
+    How a service list method materializes its results.
+
+    - ENTITY: domain entities mapped to validated read models, relations included (default)
+    - READ_MODEL: flat rows copied into read models without validation (model_construct), no relations
+    - ROW: flat rows as named tuples, the cheapest option for large lists
+    """
+    ENTITY = "entity"
+    READ_MODEL = "read_model"
+    ROW = "row"
@@ -3,7 +3,6 @@ from pydantic import BaseModel, field_validator, PositiveInt
 from datetime import datetime
 
 from champyons.core.application.dto.country import CountryRead
-from champyons.core.application.dto.city import CityRead
 
 ForeignKey = PositiveInt
 
@@ -2,6 +2,8 @@ from champyons.core.ports.repositories.country import CountryRepository
 from champyons.core.application.services.translation_service import TranslationService
 from champyons.core.domain.entities.geography.country import Country as CountryEntity
 from champyons.core.application.dto.country import CountryCreate, CountryUpdate, CountryRead
+from champyons.core.application.dto.helpers.projection import Projection
+from champyons.core.ports.repositories.country import CountryRow
 
 class CountryService:
     def __init__(self, country_repository: CountryRepository, translation_service: TranslationService):
@@ -74,9 +76,16 @@ class CountryService:
         
         return self._to_read_model(entity)
 
-    def get_by_continent(self, continent_id: int) -> list[CountryRead]:
-        countries = self.country_repo.get_by_continent_id(continent_id)
-        return [self._to_read_model(n) for n in countries]
+    def get_by_continent(self, continent_id: int, projection: Projection = Projection.ENTITY) -> list[CountryRead] | list[CountryRow]:
+        """ Countries of a continent. READ_MODEL and ROW projections skip entities and relations (see Projection) """
+        if projection == Projection.ENTITY:
+            countries = self.country_repo.get_by_continent_id(continent_id)
+            return [self._to_read_model(n) for n in countries]
+
+        rows = self.country_repo.get_rows(continent_id)
+        if projection == Projection.ROW:
+            return rows
+        return [CountryRead.from_row(row) for row in rows]
 
     # --------------------
     # Delete
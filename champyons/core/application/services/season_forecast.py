@@ -0,0 +1,217 @@
+"""
+Season forecast
+
+Monte Carlo forecast of final league positions: the remaining fixtures of a group are simulated
+thousands of times from the current standings, and finishing positions are counted.
+
+Simulations run in batches. Each batch is fully vectorized (all simulations x all remaining
+fixtures at once) and gets its own child of a numpy SeedSequence, so results only depend on the
+seed, not on which worker ran which batch. Batches are spread over a process pool in waves, and
+their results are added in seed order. Convergence is checked every `check_every` batches (a fixed
+number, so where the forecast stops does not depend on the number of workers either): it stops
+early once position probabilities change less than `tolerance` between checks, or when the
+simulation budget is spent. A time budget, when given, is only checked between waves.
+
+Forecasts rank teams by points, goal difference and goals scored; head-to-head tiebreakers are not
+simulated.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence
+import time
+
+import numpy as np
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.services.match_engine import MatchEngine
+from champyons.core.domain.services.standings import GroupStandings
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+
+@dataclass(frozen=True, eq=False)
+class ForecastProblem:
+    """ Current state of a group and its remaining fixtures, as arrays indexed by team position in team_ids """
+    team_ids: np.ndarray
+    points: np.ndarray
+    goal_difference: np.ndarray
+    goals_for: np.ndarray
+    home: np.ndarray # team index of each remaining fixture
+    away: np.ndarray
+    attack: np.ndarray
+    defense: np.ndarray
+    points_win: int = 3
+    points_draw: int = 1
+    points_loss: int = 0
+    engine: MatchEngine = MatchEngine()
+
+    @classmethod
+    def from_standings(
+        cls,
+        standings: GroupStandings,
+        remaining: Sequence[Fixture],
+        strengths: Mapping[int, TeamStrength],
+        engine: Optional[MatchEngine] = None,
+    ) -> "ForecastProblem":
+        rows = standings.table()
+        index = {row.team_id: i for i, row in enumerate(rows)}
+        default = TeamStrength()
+        return cls(
+            team_ids=np.array([row.team_id for row in rows], dtype=np.int64),
+            points=np.array([row.points for row in rows], dtype=np.int64),
+            goal_difference=np.array([row.goal_difference for row in rows], dtype=np.int64),
+            goals_for=np.array([row.goals_for for row in rows], dtype=np.int64),
+            home=np.array([index[f.home_team_id] for f in remaining], dtype=np.int64),
+            away=np.array([index[f.away_team_id] for f in remaining], dtype=np.int64),
+            attack=np.array([strengths.get(row.team_id, default).attack for row in rows]),
+            defense=np.array([strengths.get(row.team_id, default).defense for row in rows]),
+            points_win=standings.rules.points_win,
+            points_draw=standings.rules.points_draw,
+            points_loss=standings.rules.points_loss,
+            engine=engine or MatchEngine(),
+        )
+
+    @property
+    def n_teams(self) -> int:
+        return len(self.team_ids)
+
+
+def simulate_positions(problem: ForecastProblem, simulations: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """ Runs a batch of simulations. Returns counts of shape (teams, positions) """
+    rng = np.random.default_rng(seed)
+    n, teams = simulations, problem.n_teams
+    engine = problem.engine
+
+    home_xg = engine.expected_goals(problem.attack[problem.home], problem.defense[problem.away], home=True)
+    away_xg = engine.expected_goals(problem.attack[problem.away], problem.defense[problem.home], home=False)
+    home_goals = rng.poisson(home_xg, size=(n, len(problem.home)))
+    away_goals = rng.poisson(away_xg, size=(n, len(problem.away)))
+
+    home_points = np.where(home_goals > away_goals, problem.points_win, np.where(home_goals == away_goals, problem.points_draw, problem.points_loss))
+    away_points = np.where(away_goals > home_goals, problem.points_win, np.where(home_goals == away_goals, problem.points_draw, problem.points_loss))
+
+    # Fixture -> team incidence matrices turn per-fixture results into per-team totals with a product
+    home_incidence = np.zeros((len(problem.home), teams))
+    home_incidence[np.arange(len(problem.home)), problem.home] = 1
+    away_incidence = np.zeros((len(problem.away), teams))
+    away_incidence[np.arange(len(problem.away)), problem.away] = 1
+
+    points = problem.points + home_points @ home_incidence + away_points @ away_incidence
+    goal_difference = problem.goal_difference + (home_goals - away_goals) @ home_incidence + (away_goals - home_goals) @ away_incidence
+    goals_for = problem.goals_for + home_goals @ home_incidence + away_goals @ away_incidence
+
+    # Current table order breaks remaining ties
+    order = np.lexsort((np.broadcast_to(np.arange(teams), (n, teams)), -goals_for, -goal_difference, -points), axis=-1)
+    positions = np.broadcast_to(np.arange(teams), (n, teams))
+    return np.bincount((order * teams + positions).ravel(), minlength=teams * teams).reshape(teams, teams)
+
+
+@dataclass(frozen=True)
+class SeasonForecast:
+    team_ids: tuple[int, ...]
+    probabilities: np.ndarray # (teams, positions). probabilities[i, p] = P(team_ids[i] finishes in position p + 1)
+    simulations: int
+    converged: bool
+
+    def position_probabilities(self, team_id: int) -> Dict[int, float]:
+        """ Probability of each 1-based final position """
+        row = self.probabilities[self.team_ids.index(team_id)]
+        return {position: float(p) for position, p in enumerate(row, start=1) if p > 0}
+
+    def most_likely_positions(self, team_id: int, count: int = 2) -> List[int]:
+        row = self.probabilities[self.team_ids.index(team_id)]
+        return [int(p) + 1 for p in np.argsort(-row, kind="stable")[:count]]
+
+    def expected_position(self, team_id: int) -> float:
+        row = self.probabilities[self.team_ids.index(team_id)]
+        return float(row @ np.arange(1, len(row) + 1))
+
+
+class SeasonForecaster:
+    """
+    Args:
+        workers: processes in the pool. 1 runs every batch in the current process
+        batch_size: simulations per batch (one task)
+        max_simulations: simulation budget of each forecast
+        tolerance: stop when no probability moves more than this between convergence checks
+        check_every: batches between convergence checks
+        time_budget: seconds available for a forecast (forecast_all splits it between groups)
+    """
+    def __init__(
+        self,
+        workers: int = 1,
+        batch_size: int = 2_000,
+        max_simulations: int = 100_000,
+        min_simulations: int = 10_000,
+        tolerance: float = 0.002,
+        check_every: int = 4,
+        time_budget: Optional[float] = None,
+        seed: int = 0,
+    ):
+        if workers < 1 or batch_size < 1 or check_every < 1:
+            raise ValueError("Workers, batch size and check_every must be positive integers")
+        if min_simulations > max_simulations:
+            raise ValueError("Min simulations cannot exceed max simulations")
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_simulations = max_simulations
+        self.min_simulations = min_simulations
+        self.tolerance = tolerance
+        self.check_every = check_every
+        self.time_budget = time_budget
+        self.seed = seed
+
+    def forecast(self, problem: ForecastProblem, executor: Optional[Executor] = None) -> SeasonForecast:
+        if executor is None and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                return self._forecast(problem, pool, self.time_budget)
+        return self._forecast(problem, executor, self.time_budget)
+
+    def forecast_all(self, problems: Mapping[Hashable, ForecastProblem]) -> Dict[Hashable, SeasonForecast]:
+        """ Forecasts several groups (e.g. every league at night) sharing one pool and the time budget """
+        budget = self.time_budget / len(problems) if self.time_budget and problems else self.time_budget
+        if self.workers == 1:
+            return {key: self._forecast(problem, None, budget) for key, problem in problems.items()}
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return {key: self._forecast(problem, pool, budget) for key, problem in problems.items()}
+
+    def _forecast(self, problem: ForecastProblem, executor: Optional[Executor], time_budget: Optional[float]) -> SeasonForecast:
+        teams = problem.n_teams
+        counts = np.zeros((teams, teams), dtype=np.int64)
+        simulations = 0
+        done = 0 # batches added to counts
+        converged = False
+        previous: Optional[np.ndarray] = None
+        # Whole checkpoints per wave, with at least one batch per worker
+        wave_size = self.check_every * -(-self.workers // self.check_every)
+        batches = iter(np.random.SeedSequence(self.seed).spawn(-(-self.max_simulations // self.batch_size)))
+        start = time.perf_counter()
+
+        while simulations < self.max_simulations and not converged:
+            seeds = [seed for _, seed in zip(range(wave_size), batches)]
+            sizes = [min(self.batch_size, self.max_simulations - simulations - i * self.batch_size) for i in range(len(seeds))]
+            if executor is None:
+                results = [simulate_positions(problem, n, s) for n, s in zip(sizes, seeds)]
+            else:
+                results = list(executor.map(simulate_positions, [problem] * len(seeds), sizes, seeds))
+
+            for size, result in zip(sizes, results):
+                counts += result
+                simulations += size
+                done += 1
+                if done % self.check_every:
+                    continue
+                probabilities = counts / simulations
+                if previous is not None and simulations >= self.min_simulations and np.abs(probabilities - previous).max() < self.tolerance:
+                    converged = True
+                    break # later batches of the wave are dropped
+                previous = probabilities
+
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+
+        return SeasonForecast(
+            team_ids=tuple(int(t) for t in problem.team_ids),
+            probabilities=counts / max(simulations, 1),
+            simulations=simulations,
+            converged=converged,
+        )
@@ -0,0 +1,221 @@
+"""
+Sharded simulation
+
+Runs the daily domestic work of the world (today: league and national cup matches) on several
+worker processes, partitioned by nation, while GameState keeps a single writer.
+
+Domestic competitions of different nations do not interact during a day, so each nation is
+simulated independently: nations are packed into one shard per worker (balanced by number of
+fixtures) and every nation draws from its own random stream, seeded by (seed, day, nationality).
+Results are therefore identical whatever the number of workers or the order in which shards
+finish, and they are merged back by nationality id.
+
+Everything that crosses nations (continental cups, transfers...) goes through a serialized phase
+in the main process once the domestic results are merged: cross-nation fixtures are simulated
+there, then serialized phases registered with `register_serialized` run in registration order.
+
+Usage:
+------
+    with ShardedSimulation(nationality_by_edition, strengths, workers=8, seed=game_seed) as simulation:
+        simulation.register_serialized(update_standings)
+        simulation.attach(scheduler, fixtures)      # one MATCHDAY event per fixture date
+        scheduler.advance_days(7)
+"""
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+import heapq
+import time
+
+import numpy as np
+
+from champyons.core.application.services.simulation_scheduler import SimulationEvent, SimulationScheduler
+from champyons.core.domain.entities.matches import Fixture, Match
+from champyons.core.domain.enums.simulation import SimulationEventType
+from champyons.core.domain.services.match_engine import MatchEngine
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+CROSS_NATION = -1 # random stream key of the serialized phase
+
+
+@dataclass(frozen=True)
+class NationDay:
+    """ Domestic work of a nation for one day, as sent to a worker """
+    nationality_id: int
+    fixtures: tuple[Fixture, ...]
+    strengths: Mapping[int, TeamStrength]
+
+
+@dataclass(frozen=True)
+class _ShardTask:
+    day: date
+    seed: int
+    engine: MatchEngine
+    with_events: bool
+    nations: tuple[NationDay, ...]
+
+
+@dataclass
+class DayResult:
+    """ Merged outcome of a simulated day. Matches are ordered by nationality id, then fixture order """
+    day: date
+    matches_by_nation: Dict[int, List[Match]] = field(default_factory=dict)
+    cross_nation_matches: List[Match] = field(default_factory=list)
+    phase_timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def matches(self) -> List[Match]:
+        return [m for nation in self.matches_by_nation.values() for m in nation] + self.cross_nation_matches
+
+
+def day_rng(seed: int, day: date, key: int) -> np.random.Generator:
+    """ Random stream of a nation (or CROSS_NATION) on a given day """
+    return np.random.default_rng(np.random.SeedSequence([seed, day.toordinal(), key + 1]))
+
+
+def _simulate_shard(task: _ShardTask) -> List[tuple[int, List[Match]]]:
+    return [
+        (nation.nationality_id, task.engine.simulate(
+            nation.fixtures, nation.strengths, rng=day_rng(task.seed, task.day, nation.nationality_id), with_events=task.with_events,
+        ))
+        for nation in task.nations
+    ]
+
+
+def plan_shards(loads: Mapping[int, int], shards: int) -> List[List[int]]:
+    """
+    Packs nations (nationality id -> amount of work) into at most `shards` balanced shards:
+    heaviest nations first, each into the lightest shard. Deterministic for equal loads
+    """
+    heap = [(0, i) for i in range(min(shards, len(loads)))]
+    result: List[List[int]] = [[] for _ in heap]
+    for nationality_id in sorted(loads, key=lambda n: (-loads[n], n)):
+        load, i = heapq.heappop(heap)
+        result[i].append(nationality_id)
+        heapq.heappush(heap, (load + loads[nationality_id], i))
+    return [sorted(shard) for shard in result if shard]
+
+
+SerializedPhase = Callable[[DayResult], None]
+
+
+class ShardedSimulation:
+    """
+    Args:
+        nationality_by_edition: competition edition id -> organizing nationality id (None for
+            international competitions, which are simulated in the serialized phase)
+        strengths: team id -> TeamStrength. Can be updated between days
+        workers: worker processes. 1 runs everything in the current process
+        seed: game seed. Same seed, same results, regardless of workers
+    """
+    def __init__(
+        self,
+        nationality_by_edition: Mapping[int, Optional[int]],
+        strengths: Mapping[int, TeamStrength],
+        engine: Optional[MatchEngine] = None,
+        workers: int = 1,
+        seed: int = 0,
+        with_events: bool = True,
+    ):
+        if workers < 1:
+            raise ValueError("Workers must be a positive integer")
+        self.nationality_by_edition = nationality_by_edition
+        self.strengths = strengths
+        self.engine = engine or MatchEngine()
+        self.workers = workers
+        self.seed = seed
+        self.with_events = with_events
+        self._fixtures_by_date: Dict[date, List[Fixture]] = defaultdict(list)
+        self._serialized: List[SerializedPhase] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ShardedSimulation":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def register_serialized(self, phase: SerializedPhase) -> None:
+        """ Adds a phase run in the main process after each day's domestic results are merged """
+        self._serialized.append(phase)
+
+    # --------------------
+    # Scheduling
+    # --------------------
+    def add_fixtures(self, fixtures: Iterable[Fixture]) -> List[date]:
+        """ Queues fixtures by match date. Returns the dates that got new fixtures """
+        dates = set()
+        for fixture in fixtures:
+            if fixture.match_date is None:
+                raise ValueError(f"Fixture {fixture.id} has no date")
+            self._fixtures_by_date[fixture.match_date].append(fixture)
+            dates.add(fixture.match_date)
+        return sorted(dates)
+
+    def attach(self, scheduler: SimulationScheduler, fixtures: Iterable[Fixture] = ()) -> None:
+        """ Handles the scheduler's MATCHDAY events and schedules one for every date of the given fixtures """
+        scheduler.register(SimulationEventType.MATCHDAY, self.handle_matchday)
+        for matchday in self.add_fixtures(fixtures):
+            scheduler.schedule(matchday, SimulationEventType.MATCHDAY)
+
+    def handle_matchday(self, event: SimulationEvent, scheduler: SimulationScheduler) -> None:
+        if event.date in self._fixtures_by_date:
+            self.simulate_day(event.date)
+
+    # --------------------
+    # Simulation
+    # --------------------
+    def simulate_day(self, day: date, fixtures: Optional[Sequence[Fixture]] = None) -> DayResult:
+        """ Simulates the given fixtures, or the queued fixtures of the day """
+        if fixtures is None:
+            fixtures = self._fixtures_by_date.pop(day, [])
+        result = DayResult(day=day)
+
+        domestic: Dict[int, List[Fixture]] = defaultdict(list)
+        cross_nation: List[Fixture] = []
+        for fixture in fixtures:
+            nationality_id = self.nationality_by_edition.get(fixture.edition_id)
+            (cross_nation if nationality_id is None else domestic[nationality_id]).append(fixture)
+
+        start = time.perf_counter()
+        for nationality_id, matches in sorted(self._run_domestic(day, domestic)):
+            result.matches_by_nation[nationality_id] = matches
+        result.phase_timings["domestic"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if cross_nation:
+            result.cross_nation_matches = self.engine.simulate(
+                cross_nation, self.strengths, rng=day_rng(self.seed, day, CROSS_NATION), with_events=self.with_events,
+            )
+        for phase in self._serialized:
+            phase(result)
+        result.phase_timings["serialized"] = time.perf_counter() - start
+        return result
+
+    def _run_domestic(self, day: date, domestic: Mapping[int, List[Fixture]]) -> List[tuple[int, List[Match]]]:
+        shards = plan_shards({n: len(f) for n, f in domestic.items()}, self.workers)
+        tasks = [
+            _ShardTask(day, self.seed, self.engine, self.with_events, tuple(self._nation_day(n, domestic[n]) for n in shard))
+            for shard in shards
+        ]
+        if self.workers == 1 or len(tasks) < 2:
+            return [nation for task in tasks for nation in _simulate_shard(task)]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return [nation for shard in self._pool.map(_simulate_shard, tasks) for nation in shard]
+
+    def _nation_day(self, nationality_id: int, fixtures: List[Fixture]) -> NationDay:
+        """ Ships only the strengths of the teams playing, not the whole world's """
+        team_ids = {t for f in fixtures for t in (f.home_team_id, f.away_team_id)}
+        return NationDay(
+            nationality_id=nationality_id,
+            fixtures=tuple(fixtures),
+            strengths={t: self.strengths[t] for t in team_ids if t in self.strengths},
+        )
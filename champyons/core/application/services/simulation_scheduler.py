@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Mapping, Optional
+import heapq
+import itertools
+import time
+import warnings
+
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.enums.simulation import SimulationEventType
+from champyons.core.domain.value_objects.game.game_settings import GameSettings
+
+
+@dataclass(frozen=True)
+class SimulationEvent:
+    """ Something that must happen on a given in-game date (e.g. a matchday or a transfer window closing) """
+    date: date
+    type: SimulationEventType
+    payload: Mapping[str, Any] = field(default_factory=dict)
+    id: int = field(default=0, compare=False)
+
+
+@dataclass
+class TickReport:
+    """ Outcome of one scheduler tick: the date reached, events processed and time spent per phase (seconds) """
+    date: date
+    days_advanced: int
+    events: List[SimulationEvent] = field(default_factory=list)
+    phase_timings: Dict[SimulationEventType, float] = field(default_factory=dict)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phase_timings.values())
+
+
+EventHandler = Callable[[SimulationEvent, "SimulationScheduler"], None]
+
+
+class SimulationScheduler:
+    """
+    Moves GameState.sim_date from event to event.
+
+    Events are kept in a priority queue ordered by (date, event type priority, insertion order), so
+    advancing the simulation jumps straight to the next date with something to do: the cost is
+    O(events log events), no matter how many idle days are skipped.
+
+    A tick processes every event of the next event date, grouped by event type (phase) in
+    SimulationEventType order. Handlers may schedule new events (e.g. season end scheduling the
+    next season); events scheduled for the date being processed run in the same tick.
+    """
+    def __init__(self, game_state: GameState, settings: Optional[GameSettings] = None):
+        self.game_state = game_state
+        self.settings = settings or GameSettings.default()
+        self._queue: List[tuple[date, int, int, SimulationEvent]] = []
+        self._pending: set[int] = set()
+        self._cancelled: set[int] = set()
+        self._handlers: Dict[SimulationEventType, List[EventHandler]] = {}
+        self._ids = itertools.count(1)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # --------------------
+    # Events and handlers
+    # --------------------
+    def register(self, event_type: SimulationEventType, handler: EventHandler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def schedule(self, event_date: date, event_type: SimulationEventType, **payload: Any) -> SimulationEvent:
+        if event_date < self.game_state.sim_date:
+            raise ValueError(f"Cannot schedule an event in the past ({event_date} < {self.game_state.sim_date})")
+        event = SimulationEvent(date=event_date, type=SimulationEventType(event_type), payload=payload, id=next(self._ids))
+        heapq.heappush(self._queue, (event.date, event.type.priority, event.id, event))
+        self._pending.add(event.id)
+        return event
+
+    def cancel(self, event: SimulationEvent) -> None:
+        """ Cancels a pending event. Cancelled events are dropped lazily when they reach the top of the queue """
+        if event.id in self._pending:
+            self._pending.discard(event.id)
+            self._cancelled.add(event.id)
+
+    @property
+    def next_event_date(self) -> date | None:
+        self._drop_cancelled()
+        return self._queue[0][0] if self._queue else None
+
+    def real_time_until_next_event(self) -> timedelta | None:
+        """ Real-life time left before the next event date, given the simulation speed """
+        next_date = self.next_event_date
+        if next_date is None:
+            return None
+        return self.settings.simulation_interval * (next_date - self.game_state.sim_date).days
+
+    # --------------------
+    # Simulation
+    # --------------------
+    def tick(self) -> TickReport | None:
+        """ Jumps to the next event date and processes its events. Returns None if there are no events """
+        next_date = self.next_event_date
+        if next_date is None or not self._ensure_running():
+            return None
+
+        days = (next_date - self.game_state.sim_date).days
+        self.game_state.advance_to_date(next_date)
+        report = TickReport(date=next_date, days_advanced=days)
+
+        while self._queue and self._queue[0][0] == next_date:
+            phase = self._queue[0][3].type
+            events = self._pop_phase(next_date, phase)
+            start = time.perf_counter()
+            for event in events:
+                for handler in self._handlers.get(phase, []):
+                    handler(event, self)
+            report.phase_timings[phase] = report.phase_timings.get(phase, 0.0) + time.perf_counter() - start
+            report.events.extend(events)
+            self._drop_cancelled()
+
+        return report
+
+    def advance_to(self, target_date: date) -> List[TickReport]:
+        """ Processes every event up to target_date (included) and leaves sim_date at target_date """
+        if target_date < self.game_state.sim_date:
+            raise ValueError(f"Cannot go back in time ({target_date} < {self.game_state.sim_date})")
+        if not self._ensure_running():
+            return []
+
+        reports: List[TickReport] = []
+        while (next_date := self.next_event_date) is not None and next_date <= target_date:
+            reports.append(self.tick())
+        self.game_state.advance_to_date(target_date)
+        return reports
+
+    def advance_days(self, days: int) -> List[TickReport]:
+        return self.advance_to(self.game_state.sim_date + timedelta(days=days))
+
+    def _pop_phase(self, event_date: date, phase: SimulationEventType) -> List[SimulationEvent]:
+        events: List[SimulationEvent] = []
+        while self._queue and self._queue[0][0] == event_date and self._queue[0][3].type == phase:
+            *_, event = heapq.heappop(self._queue)
+            if event.id in self._cancelled:
+                self._cancelled.discard(event.id)
+            else:
+                self._pending.discard(event.id)
+                events.append(event)
+        return events
+
+    def _drop_cancelled(self) -> None:
+        while self._queue and self._queue[0][2] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._queue)[2])
+
+    def _ensure_running(self) -> bool:
+        if not self.game_state.is_simulation_running:
+            warnings.warn("Game is currently paused")
+            return False
+        return True
@@ -1,8 +1,8 @@
-from champyons.core.repositories.translations import TranslationRepository, TranslatedFields, TranslationKey
-from champyons.core.i18n.context import get_lang
+from champyons.core.ports.repositories.translations import TranslationRepository, TranslatedFields, TranslationKey
+from champyons.core.application.context.localization_context import get_current_language as get_lang
 from typing import Any, Optional, Sequence, TypeVar
 from collections import defaultdict
-from champyons.schemas.translation import TranslationCreate, TranslationRead
+from champyons.core.application.dto.translation import TranslationCreate, TranslationRead
 
 from pydantic import BaseModel
 
@@ -1,73 +1,73 @@
+from typing import Dict, Iterable, Mapping
+
+from champyons.core.domain.entities.geography import City, Continent, Country, LocalRegion, Region
+from champyons.core.domain.enums.geography import GeographyType
+from champyons.core.ports.repositories.base import BaseRepository
+from champyons.core.ports.repositories.city import CityRepository
 from champyons.core.ports.repositories.continent import ContinentRepository
-from champyons.core.ports.repositories.region import RegionRepository
-from champyons.core.ports.repositories.country import NationRepository
+from champyons.core.ports.repositories.country import CountryRepository
+from champyons.core.ports.repositories.geonames_registry import GeonamesRef, GeonamesRegistry
 from champyons.core.ports.repositories.local_region import LocalRegionRepository
-from champyons.core.ports.repositories.city import CityRepository
-from champyons.core.application.dto.continent import ContinentRead
-from champyons.core.application.dto.region import RegionRead
-from champyons.core.application.dto.country import NationRead
-from champyons.core.application.dto.local_region import LocalRegionRead
-from champyons.core.application.dto.city import CityRead
+from champyons.core.ports.repositories.region import RegionRepository
 
-type GeoRead = ContinentRead | RegionRead | NationRead | LocalRegionRead | CityRead
+type Geography = City | LocalRegion | Country | Region | Continent
 
 class GetGeographicByGeonamesId:
     """
     Use Case: Search in persisted data for any geography object with given geonames id.
 
     If two or more entities share geonames id, only one instance will be return following this priority:
-    City > LocalRegion > Nation > Region > Continent
-    
+    City > LocalRegion > Country > Region > Continent
+
     Responsabilities:
-    - Fetch data from Geonames (via port)
-    - Validate that the data is a continent
-    - Process tranlations
-    - Delegate creation to ContinentService
+    - Resolve the geonames id in the geonames registry (one indexed query, hit or miss)
+    - Fetch the entity from the repository of its type
     """
-    
+
     def __init__(
         self,
+        registry: GeonamesRegistry,
         continent_repo: ContinentRepository,
         region_repo: RegionRepository,
-        nation_repo: NationRepository,
+        country_repo: CountryRepository,
         local_region_repo: LocalRegionRepository,
         city_repo: CityRepository
     ):
+        self.registry = registry
         self.continent_repo = continent_repo
-        self.region_repo = continent_repo
-        self.continent_repo = region_repo
-        self.nation_repo = nation_repo
+        self.region_repo = region_repo
+        self.country_repo = country_repo
         self.local_region_repo = local_region_repo
         self.city_repo = city_repo
-    
-    def execute(self, geonames_id: int) -> GeoRead|None:
+
+    @property
+    def _repositories(self) -> Mapping[GeographyType, BaseRepository]:
+        return {
+            GeographyType.CITY: self.city_repo,
+            GeographyType.LOCAL_REGION: self.local_region_repo,
+            GeographyType.COUNTRY: self.country_repo,
+            GeographyType.REGION: self.region_repo,
+            GeographyType.CONTINENT: self.continent_repo,
+        }
+
+    def execute(self, geonames_id: int) -> Geography | None:
         """
-        Create continent from Geonames ID.
-        
+        Find the geography entity with the given Geonames ID.
+
         Args:
             geonames_id: ID from Geonames
-            
+
         Returns:
-            ContinentRead, RegionRead or NationRead with given id or None, if it is not found
-            
+            City, LocalRegion, Country, Region or Continent with given id or None, if it is not found
         """
-        # 1. Try cities
-        geo_data = self.city_repo.get_by_geonames_id(geonames_id)
-        
-        # 2. Try local regions
-        if not geo_data:
-            geo_data = self.local_region_repo.get_by_geonames_id(geonames_id)
-
-        # 3. Try local regions
-        if not geo_data:
-            geo_data = self.nation_repo.get_by_geonames_id(geonames_id)
+        ref = self.registry.resolve(geonames_id)
+        if ref is None:
+            return None
+        return self._repositories[ref.geography_type].get_by_id(ref.entity_id)
 
-        # 4. Try local regions
-        if not geo_data:
-            geo_data = self.region_repo.get_by_geonames_id(geonames_id)
-
-        # 5. Try local regions
-        if not geo_data:
-            geo_data = self.continent_repo.get_by_geonames_id(geonames_id)
-
-        return geo_data
\ No newline at end of file
+    def resolve_many(self, geonames_ids: Iterable[int]) -> Dict[int, GeonamesRef]:
+        """
+        Which of the given Geonames IDs are already persisted, and as what. Used by imports to skip
+        existing entities: one query per batch of ids instead of five per id
+        """
+        return self.registry.resolve_many(geonames_ids)
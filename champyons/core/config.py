@@ -15,6 +15,7 @@ class Config(BaseSettings):
     db_user: str = ""
     db_password: str = ""
     db_name: str = "test.db"
+    saves_folder: str = "saves" # forks/branches of the game database
     
     # localization (i18n) settings
     default_locale: str = "en"
@@ -35,6 +36,10 @@ class Config(BaseSettings):
     def root_path(self) -> Path:
         return self.app_rootpath.parent
     
+    @property
+    def saves_path(self) -> Path:
+        return self.root_path / self.saves_folder
+
     @property
     def locales_path(self) -> Path:
         return self.root_path / self.locales_folder
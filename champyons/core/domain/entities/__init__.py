@@ -78,9 +78,11 @@ from .geography import (
     Nationality
 )
 
+from .people import PlayerProfile
+from .matches import Fixture, Match, MatchEvent
+
 # from .people import Player, Person
 # from .teams import Team, Squad
-# from .matches import Match, MatchEvent
 # from .competitions import Competition, Season
 
 __all__ = [
@@ -101,9 +103,11 @@ __all__ = [
     "Region",
     "LocalRegion",
     "City",
-    "Nationality"
+    "Nationality",
     
-    # People entities (uncomment when implemented)
+    # People entities
+    "PlayerProfile",
+    # (uncomment when implemented)
     # "Player",
     # "Person",
     
@@ -111,9 +115,10 @@ __all__ = [
     # "Team",
     # "Squad",
     
-    # Match entities (uncomment when implemented)
-    # "Match",
-    # "MatchEvent",
+    # Match entities
+    "Fixture",
+    "Match",
+    "MatchEvent",
     
     # Competition entities (uncomment when implemented)
     # "Competition",
@@ -5,14 +5,26 @@ This module contains all competition-related domain entities.
 
 Entities:
 ---------
-TODO
+- CompetitionTemplate: season-independent definition of a competition and its stages
+- CompetitionStage: a phase of a template (league, groups, knockout)
+- CompetitionEdition: a template played in a season
+- CompetitionGroup: teams drawn together in a stage of an edition
 
 Notes:
 ------
-TODO
+Fixtures are built by champyons.core.domain.services.fixtures
 """
 
 # Base entities
+from .competition_stage import CompetitionStage
+from .competition_template import CompetitionTemplate
+from .competition_group import CompetitionGroup
+from .competition_edition import CompetitionEdition
 
 # Define exports
-__all__ = []
\ No newline at end of file
+__all__ = [
+    "CompetitionStage",
+    "CompetitionTemplate",
+    "CompetitionGroup",
+    "CompetitionEdition",
+]
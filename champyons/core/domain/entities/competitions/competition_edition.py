@@ -1,5 +1,30 @@
-from dataclasses import dataclass
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional
+
+from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from .competition_template import CompetitionTemplate
+from .competition_group import CompetitionGroup
+
+if TYPE_CHECKING:
+    from champyons.core.domain.entities.game.season import Season
+    from champyons.core.domain.entities.matches.fixture import Fixture
 
 @dataclass
-class CompetitionEdition:
-    pass
\ No newline at end of file
+class CompetitionEdition(TimestampMixin):
+    """ A competition template played in a season by a set of teams """
+    id: Optional[int] = None
+    template_id: Optional[int] = None
+    template: Optional[CompetitionTemplate] = None
+    season_id: Optional[int] = None
+    season: Optional[Season] = None
+
+    # Teams ordered by seed (best first)
+    team_ids: List[int] = field(default_factory=list)
+
+    groups: List[CompetitionGroup] = field(default_factory=list)
+    fixtures: List[Fixture] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if len(set(self.team_ids)) != len(self.team_ids):
+            raise ValueError("A team cannot take part twice in the same edition")
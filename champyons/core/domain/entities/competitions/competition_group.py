@@ -1,5 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 @dataclass
 class CompetitionGroup:
-    pass
\ No newline at end of file
+    """ Teams drawn together in a stage of an edition. Round robin stages have a single group """
+    id: Optional[int] = None
+    edition_id: Optional[int] = None
+    stage_id: Optional[int] = None
+    name: str = ""
+    team_ids: List[int] = field(default_factory=list)
@@ -1,5 +1,31 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+
+from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.enums.competition import StageFormat
+from champyons.core.domain.value_objects.football.stage_base import StageRulesBase
 
 @dataclass
-class CompetitionStage:
-    pass
\ No newline at end of file
+class CompetitionStage(TimestampMixin):
+    """
+    A phase of a competition template (e.g. "League", "Group stage", "Round of 16").
+
+    Stage dates are relative to the season: start_day/end_day are days from the season start
+    date (end_day None means until the season end).
+    """
+    id: Optional[int] = None
+    template_id: Optional[int] = None
+    name: str = ""
+    order: int = 1
+
+    format: StageFormat = StageFormat.ROUND_ROBIN
+    rules: StageRulesBase = field(default_factory=StageRulesBase)
+
+    start_day: int = 0
+    end_day: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.start_day < 0:
+            raise ValueError("Stage start day cannot be negative")
+        if self.end_day is not None and self.end_day <= self.start_day:
+            raise ValueError(f"Stage end day ({self.end_day}) must be later than start day ({self.start_day})")
@@ -1,5 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from champyons.core.domain.entities.mixins.active import ActiveMixin
+from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.value_objects.football.competition_rules import CompetitionRules
+from .competition_stage import CompetitionStage
 
 @dataclass
-class CompetitionTemplate:
-    pass
\ No newline at end of file
+class CompetitionTemplate(ActiveMixin, TimestampMixin):
+    """
+    Season-independent definition of a competition (e.g. "Premier League"): its stages and rules.
+    Every season plays a new CompetitionEdition of it.
+    """
+    id: Optional[int] = None
+    name: str = ""
+    nationality_id: Optional[int] = None # organizing federation. None for international competitions
+
+    stages: List[CompetitionStage] = field(default_factory=list)
+    rules: CompetitionRules = field(default_factory=CompetitionRules)
+
+    def __post_init__(self) -> None:
+        self.stages.sort(key=lambda stage: stage.order)
+
+    @property
+    def first_stage(self) -> CompetitionStage | None:
+        return self.stages[0] if self.stages else None
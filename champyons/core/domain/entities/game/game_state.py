@@ -2,13 +2,14 @@ from dataclasses import dataclass, field
 from datetime import date, timedelta
 
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.entities.game.season import Season
 
 import warnings
 from typing import Optional
 
 @dataclass
-class GameState(TimestampMixin):
+class GameState(TimestampMixin, DirtyTrackingMixin):
     """
     Represents the global state of a game instance.
 
@@ -1,7 +1,8 @@
+from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
-from champyons.core.domain.entities.mixins import ActiveMixin, TimestampMixin
+from champyons.core.domain.entities.mixins import ActiveMixin, DirtyTrackingMixin, TimestampMixin
 from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
 from champyons.core.domain.value_objects.game.game_settings import GameSettings
 
@@ -9,7 +10,7 @@ if TYPE_CHECKING:
     from champyons.core.domain.entities.competitions.competition_edition import CompetitionEdition
 
 @dataclass
-class Season(ActiveMixin, TimestampMixin):
+class Season(ActiveMixin, TimestampMixin, DirtyTrackingMixin):
     """
     Represents a football season, a cyclic period of time where competitions are played, transfer windows are opened/closed, etc.
 
@@ -1,20 +1,29 @@
+from __future__ import annotations
 from champyons.core.domain.entities.mixins.author import AuthorMixin
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 from champyons.core.domain.entities.mixins.geography import GeographyMixin
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.enums.city import CityPopulationRange
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint
 
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .continent import Continent
     from .country import Country
     from .local_region import LocalRegion
 
-@dataclass
-class City(AuthorMixin, ActiveMixin, GeographyMixin, TimestampMixin):
+# Assignments that change what a city counts towards in PopulationRollups
+_ROLLUP_FIELDS = frozenset({"population_range", "country_id", "local_region_id"})
+
+@dataclass(slots=True, weakref_slot=True)
+class City(AuthorMixin, ActiveMixin, GeographyMixin, TimestampMixin, DirtyTrackingMixin):
     ''' Represents a city or town'''
+    # Set by PopulationRollups.track. First, so it is set before the fields that notify it
+    _population_listener: Optional[Callable[["City"], None]] = field(default=None, init=False, repr=False, compare=False)
+
     id: Optional[int] = None
     name: str = field(default="")
     population_range: CityPopulationRange = CityPopulationRange.UNSET
@@ -58,13 +67,31 @@ class City(AuthorMixin, ActiveMixin, GeographyMixin, TimestampMixin):
             max_pop = self.population_range.max_population or min_pop
             return (max_pop+min_pop)//2
     
+    @property
+    def point(self) -> GeoPoint|None:
+        if self.latitude is None or self.longitude is None:
+            return None
+        return GeoPoint(self.latitude, self.longitude)
+
     @property
     def continent(self) -> Continent|None:
         if self.country:
             return self.country.continent
     
+    def __setattr__(self, name: str, value) -> None:
+        DirtyTrackingMixin.__setattr__(self, name, value)
+        if name in _ROLLUP_FIELDS and self._population_listener is not None:
+            self._population_listener(self)
+
     def update_population(self, new_population: int) -> None:
         self.population_range = CityPopulationRange.from_population(new_population)
+
+    def move_to(self, country_id: int, local_region_id: Optional[int] = None) -> None:
+        """ Moves the city to another country and/or local region """
+        if country_id <= 0:
+            raise ValueError(f"City '{self.name}' must belong to a country")
+        self.country_id = country_id
+        self.local_region_id = local_region_id
     
 
 
@@ -1,6 +1,7 @@
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 from champyons.core.domain.entities.mixins.geography import GeographyMixin
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List, Optional
@@ -9,8 +10,8 @@ if TYPE_CHECKING:
     from .country import Country
     from .nationality import Nationality
 
-@dataclass
-class Continent(ActiveMixin, GeographyMixin, TimestampMixin):
+@dataclass(slots=True, weakref_slot=True)
+class Continent(ActiveMixin, GeographyMixin, TimestampMixin, DirtyTrackingMixin):
     ''' Represents a continental landmass (e.g., Europe, South America) '''
     id: Optional[int] = None
     code: str = field(default="")
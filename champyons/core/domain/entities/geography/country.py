@@ -1,5 +1,7 @@
+from __future__ import annotations
 from champyons.core.domain.entities.mixins.geography import GeographyMixin
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 from champyons.core.domain.enums.region import RegionTypeEnum
 
@@ -13,8 +15,8 @@ if TYPE_CHECKING:
     from .city import City
     from .nationality import Nationality
 
-@dataclass
-class Country(GeographyMixin, TimestampMixin, ActiveMixin):
+@dataclass(slots=True, weakref_slot=True)
+class Country(GeographyMixin, TimestampMixin, ActiveMixin, DirtyTrackingMixin):
     """ Represents a country (e.g. United Kingdom, Spain, Argentina...)"""
     id: Optional[int] = None
     name: str = field(default="")
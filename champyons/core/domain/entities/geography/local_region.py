@@ -1,5 +1,7 @@
+from __future__ import annotations
 from champyons.core.domain.entities.mixins.geography import GeographyMixin
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 
 from dataclasses import dataclass, field
@@ -12,8 +14,8 @@ if TYPE_CHECKING:
     from .city import City
     from .nationality import Nationality
 
-@dataclass
-class LocalRegion(ActiveMixin, GeographyMixin, TimestampMixin):
+@dataclass(slots=True, weakref_slot=True)
+class LocalRegion(ActiveMixin, GeographyMixin, TimestampMixin, DirtyTrackingMixin):
     """ Represents a subnational region of a country. It might be an administrative region
     or a geographical region inside a country (e.g. England (UK), Andalusia (Spain)..). """
     id: Optional[int] = None
@@ -41,9 +43,13 @@ class LocalRegion(ActiveMixin, GeographyMixin, TimestampMixin):
         
     @property
     def cities(self) -> List["City"]:
-        all_cities = list(self._cities)
-        for child in self.children:
-            all_cities.extend(child.cities)
+        " Cities of the local region and of every local region under it. Use GeographyHierarchy to query them from persistence "
+        all_cities = []
+        pending = [self]
+        while pending:
+            local_region = pending.pop()
+            all_cities.extend(local_region._cities)
+            pending.extend(reversed(local_region.children))
         return all_cities
     
     @property
@@ -55,9 +61,10 @@ class LocalRegion(ActiveMixin, GeographyMixin, TimestampMixin):
     def parents(self) -> List["LocalRegion"]:
         " Returns a list of all parent local regions, sorted by hierarchy (from lower to higher)"
         parents = list()
-        if self.parent:
-            parents.append(self.parent)
-            parents.extend(self.parent.parents)
+        parent = self.parent
+        while parent:
+            parents.append(parent)
+            parent = parent.parent
         return parents
     
     
@@ -1,4 +1,6 @@
+from __future__ import annotations
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 from champyons.core.domain.enums.nationality import NationalityEntityType
 from champyons.core.domain.value_objects.geography.culture import CultureDistribution
@@ -8,14 +10,16 @@ from champyons.core.domain.value_objects.football.federation_rules import Federa
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, List, Optional
 
+# Needed at runtime by the entity type checks in __post_init__
+from .country import Country
+from .local_region import LocalRegion
+
 if TYPE_CHECKING:
     from .continent import Continent
-    from .country import Country
-    from .local_region import LocalRegion
     from .city import City
 
-@dataclass
-class Nationality(TimestampMixin, ActiveMixin):
+@dataclass(slots=True, weakref_slot=True)
+class Nationality(TimestampMixin, ActiveMixin, DirtyTrackingMixin):
     """
     Represents any entity that may have a national team. Nations and LocaL Regions are elegible
     to have a nationality (e.g. England (local region), Germany (nation)... )
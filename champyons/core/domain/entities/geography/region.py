@@ -1,5 +1,6 @@
 from champyons.core.domain.entities.mixins.geography import GeographyMixin
 from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
 from champyons.core.domain.entities.mixins.active import ActiveMixin
 from champyons.core.domain.enums.region import RegionTypeEnum
 
@@ -9,8 +10,8 @@ from typing import TYPE_CHECKING, List, Optional
 if TYPE_CHECKING:
     from .country import Country
 
-@dataclass
-class Region(ActiveMixin, GeographyMixin, TimestampMixin):
+@dataclass(slots=True, weakref_slot=True)
+class Region(ActiveMixin, GeographyMixin, TimestampMixin, DirtyTrackingMixin):
     """ A supranational entity thar contains nations. Can be used for geographics regions, treaties..."""
     id: Optional[int] = None
     name: str = field(default="")
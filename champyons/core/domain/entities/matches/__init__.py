@@ -5,7 +5,9 @@ This module contains all match-related domain entities.
 
 Entities:
 ---------
-TODO
+- Fixture: a scheduled match of a competition edition
+- Match: result of a played fixture
+- MatchEvent: goals and shots of a match
 
 Notes:
 ------
@@ -13,6 +15,12 @@ TODO
 """
 
 # Base entities
+from .fixture import Fixture
+from .match import Match, MatchEvent
 
 # Define exports
-__all__ = []
\ No newline at end of file
+__all__ = [
+    "Fixture",
+    "Match",
+    "MatchEvent",
+]
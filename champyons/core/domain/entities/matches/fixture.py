@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+@dataclass
+class Fixture:
+    """ A scheduled match between two teams of a competition edition """
+    id: Optional[int] = None
+    edition_id: Optional[int] = None
+    stage_id: Optional[int] = None
+    group_id: Optional[int] = None
+
+    round_number: int = 1 # matchday (round robin) or round (knockout), starting at 1
+    leg: int = 1
+    home_team_id: int = 0
+    away_team_id: int = 0
+    match_date: Optional[date] = None
+
+    def __post_init__(self) -> None:
+        if self.home_team_id == self.away_team_id:
+            raise ValueError("A team cannot play against itself")
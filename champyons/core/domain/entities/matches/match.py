@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional
+
+from champyons.core.domain.enums.match import MatchEventType
+
+@dataclass(frozen=True)
+class MatchEvent:
+    """ Something that happened in a match, at a given minute (1-90) """
+    minute: int
+    team_id: int
+    type: MatchEventType
+    player_profile_id: Optional[int] = None
+
+
+@dataclass
+class Match:
+    """ Result of a played fixture """
+    id: Optional[int] = None
+    fixture_id: Optional[int] = None
+    home_team_id: int = 0
+    away_team_id: int = 0
+    played_on: Optional[date] = None
+
+    home_goals: int = 0
+    away_goals: int = 0
+    home_shots: int = 0
+    away_shots: int = 0
+
+    events: List[MatchEvent] = field(default_factory=list)
+
+    @property
+    def winner_team_id(self) -> int | None:
+        if self.home_goals == self.away_goals:
+            return None
+        return self.home_team_id if self.home_goals > self.away_goals else self.away_team_id
+
+    @property
+    def is_draw(self) -> bool:
+        return self.home_goals == self.away_goals
@@ -7,6 +7,7 @@ Mixins:
 -----------
 - active: enables soft-deletion
 - author: adds support for user creation/modification
+- dirty: tracks attributes modified since the entity was last saved
 - geography: adds geonames_id to geogrephic entities, and therefore can be syncronized via api.geonames
 - timestamp: adds support for creation and modification datetimes
 
@@ -16,6 +17,7 @@ You can import mixins each mixin individually:
 
     from champyons.core.domain.entities.mixins.active import ActiveMixin
     from champyons.core.domain.entities.mixins.author import AuthorMixin
+    from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
     from champyons.core.domain.entities.mixins.geography import GeographyMixin
     from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
 
@@ -27,12 +29,14 @@ Or import then from here:
 # Import mixins for easy access
 from .active import ActiveMixin
 from .author import AuthorMixin
+from .dirty import DirtyTrackingMixin
 from .geography import GeographyMixin
 from .timestamp import TimestampMixin
 
 __all__ = [
     "ActiveMixin",
     "AuthorMixin",
+    "DirtyTrackingMixin",
     "GeographyMixin", 
     "TimestampMixin"
 ]
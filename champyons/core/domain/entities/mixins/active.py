@@ -5,6 +5,8 @@ from typing import Optional
 @dataclass(kw_only=True)
 class ActiveMixin:
     ''' Mixin that adds active (bool) to the entity'''
+    __slots__ = ()
+
     active: bool = True
     
     def activate(self) -> None:
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 @dataclass(kw_only=True)
 class AuthorMixin:
     ''' Mixin that adds optional created_by and updated_by (User instances) and created_by_id and updated_by_id (Optional[int]) to the entity'''
+    __slots__ = ()
+
     created_by_id: Optional[int] = None
     updated_by_id: Optional[int] = None
 
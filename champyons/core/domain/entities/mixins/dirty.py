@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Any, Callable, Iterable, Optional, Tuple
+import weakref
+
+
+class TrackedList(list):
+    ''' List field of a tracked entity: in-place changes mark the field as assigned '''
+    __slots__ = ("_owner", "_name")
+
+    def __init__(self, items: Iterable[Any], owner: Any, name: str):
+        super().__init__(items)
+        self._owner = weakref.ref(owner)
+        self._name = name
+
+    def __reduce__(self):
+        # Copies and pickles are plain lists
+        return list, (list(self),)
+
+    def tracks(self, owner: Any, name: str) -> bool:
+        return self._owner() is owner and self._name == name
+
+    def _changed(self) -> None:
+        owner = self._owner()
+        if owner is not None:
+            owner.mark_dirty(self._name)
+
+
+def _tracking(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def mutate(self: TrackedList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse", "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(TrackedList, _name, _tracking(_name))
+
+
+@cache
+def _list_fields(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if f.default_factory is list and f.name[0] != "_")
+
+
+@dataclass(kw_only=True)
+class DirtyTrackingMixin:
+    '''
+    Mixin that records which attributes were assigned since the entity was last saved.
+
+    Tracking starts with mark_clean (entities that were never marked clean are new, so they are
+    dirty). The optional on_dirty callback is called once, when a clean entity is first modified,
+    so a unit of work can collect modified entities without scanning the whole world.
+
+    List fields (default_factory=list) are wrapped in a TrackedList by mark_clean, so appending to
+    or removing from them marks the field too. Other attribute values must be immutable (value
+    objects are frozen: assign a modified copy, e.g. with dataclasses.replace); call mark_dirty
+    after changing anything else in place.
+    '''
+    __slots__ = ()
+
+    # Tracking state. Fields (so slotted entities get a slot for them) kept out of init, repr and eq
+    _dirty_fields: Optional[set[str]] = field(default=None, init=False, repr=False, compare=False)
+    _on_dirty: Optional[Callable[[Any], None]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name[0] != "_":
+            dirty = self._dirty_fields
+            if dirty is not None:
+                if not dirty and self._on_dirty is not None:
+                    self._on_dirty(self)
+                dirty.add(name)
+        object.__setattr__(self, name, value)
+
+    @property
+    def is_tracked(self) -> bool:
+        return self._dirty_fields is not None
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty_fields is None or bool(self._dirty_fields)
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        return frozenset(self._dirty_fields or ())
+
+    def mark_dirty(self, *names: str) -> None:
+        for name in names:
+            setattr(self, name, getattr(self, name))
+
+    def mark_clean(self, on_dirty: Optional[Callable[[Any], None]] = None) -> None:
+        for name in _list_fields(type(self)):
+            value = getattr(self, name)
+            if isinstance(value, list) and not (isinstance(value, TrackedList) and value.tracks(self, name)):
+                object.__setattr__(self, name, TrackedList(value, self, name))
+        object.__setattr__(self, "_dirty_fields", set())
+        if on_dirty is not None:
+            object.__setattr__(self, "_on_dirty", on_dirty)
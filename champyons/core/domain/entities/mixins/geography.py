@@ -4,6 +4,8 @@ from typing import Optional
 @dataclass(kw_only=True)
 class GeographyMixin:
     ''' Mixin that adds geonames_id (int) to the entity'''
+    __slots__ = ()
+
     geonames_id: Optional[int] = None
 
     
\ No newline at end of file
@@ -6,6 +6,8 @@ now_server = lambda: datetime.now(UTC) # define a lambda function for returning
 @dataclass(kw_only=True)
 class TimestampMixin:
     ''' Mixin that adds created_at and updated_at (datetime) to the entity'''
+    __slots__ = ()
+
     created_at: datetime = field(default_factory=now_server)
     updated_at: datetime = field(default_factory=now_server)
 
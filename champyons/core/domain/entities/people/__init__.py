@@ -5,7 +5,7 @@ This module contains all people-related domain entities used in the game.
 
 Entities:
 ---------
-TODO
+- PlayerProfile: skills and playable positions of a person as a player
 
 Notes:
 ------
@@ -13,7 +13,9 @@ TODO
 """
 
 # Base entities
-
+from .player_profile import PlayerProfile
 
 # Define exports
-__all__ = []
+__all__ = [
+    "PlayerProfile",
+]
@@ -0,0 +1,17 @@
+from champyons.core.domain.entities.mixins.active import ActiveMixin
+from champyons.core.domain.entities.mixins.timestamp import TimestampMixin
+from champyons.core.domain.entities.mixins.dirty import DirtyTrackingMixin
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass(slots=True, weakref_slot=True)
+class PlayerProfile(ActiveMixin, TimestampMixin, DirtyTrackingMixin):
+    """ Player side of a person: football skills and the positions he/she can play in """
+    id: Optional[int] = None
+    person_id: Optional[int] = None
+
+    skills: PlayerSkills = field(default_factory=PlayerSkills)
+    positions: PositionSet = field(default_factory=PositionSet)
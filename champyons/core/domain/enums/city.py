@@ -37,6 +37,8 @@ class CityPopulationRange(enum.IntEnum):
         if not isinstance(population, int) or population < 0:
             return cls.UNSET
         for r in cls:
+            if r is cls.UNSET:
+                continue
             if r.min_population is not None and population < r.min_population:
                 continue
             if r.max_population is not None and population > r.max_population:
@@ -0,0 +1,20 @@
+from enum import StrEnum
+
+class StageFormat(StrEnum):
+    """ How the fixtures of a competition stage are built """
+    ROUND_ROBIN = "round_robin" # every team plays every other team (leagues)
+    GROUPS = "groups" # teams are drawn into groups, each one played as a round robin
+    KNOCKOUT = "knockout" # single elimination bracket, one or two legs per tie
+
+
+class Tiebreaker(StrEnum):
+    """ Criteria used to rank teams level on points, applied in the order given by CompetitionRules """
+    GOAL_DIFFERENCE = "goal_difference"
+    GOALS_FOR = "goals_for"
+    WINS = "wins"
+    HEAD_TO_HEAD_POINTS = "head_to_head_points" # points in matches between the tied teams
+    HEAD_TO_HEAD_GOAL_DIFFERENCE = "head_to_head_goal_difference"
+
+    @property
+    def is_head_to_head(self) -> bool:
+        return self in (Tiebreaker.HEAD_TO_HEAD_POINTS, Tiebreaker.HEAD_TO_HEAD_GOAL_DIFFERENCE)
@@ -0,0 +1,13 @@
+import enum
+
+class GeographyType(enum.IntEnum):
+    '''
+    Kinds of geography entities that may carry a geonames id. When several entities share a
+    geonames id, the lowest value wins: City > LocalRegion > Country > Region > Continent
+    '''
+
+    CITY = 1
+    LOCAL_REGION = 2
+    COUNTRY = 3
+    REGION = 4
+    CONTINENT = 5
@@ -0,0 +1,5 @@
+from enum import StrEnum
+
+class MatchEventType(StrEnum):
+    """ Events recorded in a simulated match """
+    GOAL = "goal"
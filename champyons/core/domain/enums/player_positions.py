@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List
 
-from player_roles import PositionAttackingRoles, PositionDefendingRoles
+from .player_roles import PositionAttackingRoles, PositionDefendingRoles
 
 class Position(str, Enum):
     GK =    ("GK", "Goalkeeper", 0, 1, [PositionAttackingRoles.GK, PositionAttackingRoles.GK_BALL_PLAYING, PositionAttackingRoles.GK_NO_NONSENSE], [PositionDefendingRoles.GK, PositionDefendingRoles.GK_LINE_HOLDING, PositionDefendingRoles.GK_SWEEPER])
@@ -35,6 +35,11 @@ class Position(str, Enum):
     RW =    ("RW", "Right winger", 2, 5, [PositionAttackingRoles.WF_INSIDE, PositionAttackingRoles.WF_INSIDE_FORWARD, PositionAttackingRoles.WF_PLAYMAKER, PositionAttackingRoles.WF_WIDE_FORWARD, PositionAttackingRoles.WF_WINGER], [PositionDefendingRoles.WF_WINGER, PositionDefendingRoles.WF_INSIDE_OUTLET, PositionDefendingRoles.WF_TRACKING, PositionDefendingRoles.WF_WIDE_OUTLET])
 
 
+    def __new__(cls, code: str, *args):
+        obj = str.__new__(cls, code)
+        obj._value_ = code
+        return obj
+
     def __init__(self, code: str, pos_name: str, side: int, depth: int, attack_roles: List[PositionAttackingRoles], defense_roles: List[PositionDefendingRoles]):
         self.code = code
         self.position_name = pos_name
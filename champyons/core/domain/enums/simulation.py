@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+class SimulationEventType(StrEnum):
+    """
+    Types of dated events processed by the simulation scheduler.
+
+    Declaration order is the processing order of events that fall on the same date.
+    """
+    CONTRACT_EXPIRY = "contract_expiry"
+    TRANSFER_WINDOW_CLOSE = "transfer_window_close"
+    TRANSFER_WINDOW_OPEN = "transfer_window_open"
+    MATCHDAY = "matchday"
+    SEASON_END = "season_end"
+
+    @property
+    def priority(self) -> int:
+        return list(SimulationEventType).index(self)
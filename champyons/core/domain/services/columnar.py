@@ -0,0 +1,83 @@
+"""
+Columnar rows
+
+Growable columnar storage shared by the in-memory indexes (scouting partitions, similarity
+stores): one NumPy array per column and one row per id, so filters and scores are vectorized over
+whole columns. Arrays double when full, and rows of removed ids are recycled by later inserts;
+`alive` masks the free rows out of queries.
+
+Usage:
+------
+    class _Store(ColumnarRows):
+        skills: np.ndarray
+
+        def __init__(self):
+            super().__init__({"skills": ColumnSpec(np.float32, (5,))})
+
+    store = _Store()
+    row = store.row_for(profile_id) # first: it may grow (replace) the column arrays
+    store.skills[row] = vector
+    rows = np.flatnonzero(store.live_mask())
+"""
+from typing import Dict, List, Mapping, NamedTuple, Tuple
+
+import numpy as np
+
+NO_ID = -1
+
+
+class ColumnSpec(NamedTuple):
+    dtype: type
+    shape: Tuple[int, ...] = () # shape of each row's value
+    fill: int = 0 # value of unused rows
+
+
+class ColumnarRows:
+    """ Columns are attributes named after the spec keys, plus `ids` and `alive` """
+    ids: np.ndarray
+    alive: np.ndarray
+
+    def __init__(self, columns: Mapping[str, ColumnSpec], capacity: int = 64):
+        self.size = 0 # rows in use, free rows included
+        self.rows: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self._columns = {"ids": ColumnSpec(np.int64, fill=NO_ID), **columns, "alive": ColumnSpec(bool)}
+        for name, spec in self._columns.items():
+            setattr(self, name, np.full((capacity, *spec.shape), spec.fill, dtype=spec.dtype))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self.rows
+
+    def row_for(self, entity_id: int) -> int:
+        """ Row of an id, taking a free row (or a new one) for new ids. The row is marked alive """
+        row = self.rows.get(entity_id)
+        if row is None:
+            row = self._free_rows.pop() if self._free_rows else self._next_row()
+            self.rows[entity_id] = row
+            self.ids[row] = entity_id
+            self.alive[row] = True
+        return row
+
+    def remove(self, entity_id: int) -> None:
+        row = self.rows.pop(entity_id)
+        self.alive[row] = False
+        self.ids[row] = NO_ID
+        self._free_rows.append(row)
+
+    def live_mask(self) -> np.ndarray:
+        """ Writable mask of the rows in use that hold an id """
+        return self.alive[:self.size].copy()
+
+    def _next_row(self) -> int:
+        if self.size == len(self.ids):
+            capacity = len(self.ids) * 2
+            for name, spec in self._columns.items():
+                current: np.ndarray = getattr(self, name)
+                grown = np.full((capacity, *spec.shape), spec.fill, dtype=spec.dtype)
+                grown[:len(current)] = current
+                setattr(self, name, grown)
+        self.size += 1
+        return self.size - 1
@@ -0,0 +1,178 @@
+"""
+City distances
+
+Great-circle distances between cities for travel and fatigue, computed with vectorized NumPy
+haversine and cached so that fixtures and fatigue get them by lookup:
+
+- dense matrices per group of cities (a league: every club city against every other), built with
+  one broadcasted computation and kept until the group changes
+- a sparse global cache of city pairs, filled in batches (every pair missing from a batch is
+  computed in one vectorized call)
+
+Only the sparse pairs are persisted with the save (see CityDistanceRepository): dense matrices are
+rebuilt from coordinates on demand, which is cheaper than reading them back.
+
+Coordinates are copied when the object is built: when a city moves, update_city drops its cached
+pairs and the matrices that contain it (the SQLAlchemy adapter deletes its persisted pairs when
+the moved city is flushed).
+
+Usage:
+------
+    distances = CityDistances({city.id: city.point for city in cities if city.point})
+    distances.preload(city_distance_repository.get_all())
+    league = distances.matrix(club_city_ids)
+    km = league[madrid_id, barcelona_id]
+    travel = distances.travel_km(fixtures, city_by_team)       # one value per fixture
+    city_distance_repository.save_many(distances.drain_new())
+    distances.update_city(city.id, city.point)                  # after changing a city's coordinates
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.value_objects.geography.coordinates import EARTH_RADIUS_KM, GeoPoint
+
+CityPair = Tuple[int, int] # (lower id, higher id)
+
+
+def haversine_matrix(latitudes_a: np.ndarray, longitudes_a: np.ndarray, latitudes_b: np.ndarray, longitudes_b: np.ndarray) -> np.ndarray:
+    """ Distances in km between every point of a and every point of b (degrees). Shape (len(a), len(b)) """
+    return haversine_pairs(
+        np.asarray(latitudes_a, dtype=np.float64)[:, None], np.asarray(longitudes_a, dtype=np.float64)[:, None],
+        np.asarray(latitudes_b, dtype=np.float64)[None, :], np.asarray(longitudes_b, dtype=np.float64)[None, :],
+    )
+
+
+def haversine_pairs(latitudes_a, longitudes_a, latitudes_b, longitudes_b) -> np.ndarray:
+    """ Element-wise (broadcasted) distances in km between points given in degrees """
+    phi_a, phi_b = np.radians(latitudes_a), np.radians(latitudes_b)
+    h = np.sin((phi_b - phi_a) / 2) ** 2 + np.cos(phi_a) * np.cos(phi_b) * np.sin(np.radians(np.subtract(longitudes_b, longitudes_a)) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(h)))
+
+
+def city_pair(city_a: int, city_b: int) -> CityPair:
+    return (city_a, city_b) if city_a <= city_b else (city_b, city_a)
+
+
+class DistanceMatrix:
+    """ Dense distances between a group of cities, indexed by city id """
+    def __init__(self, city_ids: Sequence[int], values: np.ndarray):
+        self.city_ids = tuple(city_ids)
+        self.index: Dict[int, int] = {city_id: i for i, city_id in enumerate(self.city_ids)}
+        self.values = values
+
+    def __getitem__(self, pair: Tuple[int, int]) -> float:
+        return float(self.values[self.index[pair[0]], self.index[pair[1]]])
+
+    def __contains__(self, city_id: int) -> bool:
+        return city_id in self.index
+
+    def rows(self, city_ids: Sequence[int]) -> np.ndarray:
+        """ Positions of the given cities in the matrix, for fancy indexing of values """
+        return np.fromiter((self.index[c] for c in city_ids), dtype=np.int64, count=len(city_ids))
+
+
+class CityDistances:
+    """
+    Args:
+        coordinates: city id -> location. Cities without coordinates cannot be measured
+    """
+    def __init__(self, coordinates: Mapping[int, GeoPoint]):
+        self.city_ids = np.fromiter(coordinates.keys(), dtype=np.int64, count=len(coordinates))
+        self.latitudes = np.fromiter((p.latitude for p in coordinates.values()), dtype=np.float64, count=len(coordinates))
+        self.longitudes = np.fromiter((p.longitude for p in coordinates.values()), dtype=np.float64, count=len(coordinates))
+        self._rows: Dict[int, int] = {city_id: i for i, city_id in enumerate(self.city_ids.tolist())}
+        self._matrices: Dict[Tuple[int, ...], DistanceMatrix] = {}
+        self._pairs: Dict[CityPair, float] = {}
+        self._new_pairs: Dict[CityPair, float] = {}
+
+    def __contains__(self, city_id: int) -> bool:
+        return city_id in self._rows
+
+    # --------------------
+    # Dense
+    # --------------------
+    def matrix(self, city_ids: Iterable[int]) -> DistanceMatrix:
+        """ Dense matrix of a group of cities (e.g. the club cities of a league), cached per group """
+        key = tuple(sorted(set(city_ids)))
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            rows = self._row_indexes(key)
+            values = haversine_matrix(self.latitudes[rows], self.longitudes[rows], self.latitudes[rows], self.longitudes[rows])
+            matrix = self._matrices[key] = DistanceMatrix(key, values)
+        return matrix
+
+    def forget_matrix(self, city_ids: Iterable[int]) -> None:
+        """ Drops a cached group, e.g. after promotions and relegations """
+        self._matrices.pop(tuple(sorted(set(city_ids))), None)
+
+    # --------------------
+    # Sparse
+    # --------------------
+    def distance(self, city_a: int, city_b: int) -> float:
+        return float(self.distances([(city_a, city_b)])[0])
+
+    def distances(self, pairs: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """ Distances of many city pairs. Pairs not cached yet are computed together and cached """
+        keys = [city_pair(a, b) for a, b in pairs]
+        missing = list(dict.fromkeys(k for k in keys if k not in self._pairs))
+        if missing:
+            rows_a = self._row_indexes([a for a, _ in missing])
+            rows_b = self._row_indexes([b for _, b in missing])
+            values = haversine_pairs(self.latitudes[rows_a], self.longitudes[rows_a], self.latitudes[rows_b], self.longitudes[rows_b])
+            computed = dict(zip(missing, values.tolist()))
+            self._pairs.update(computed)
+            self._new_pairs.update(computed)
+        return np.fromiter((self._pairs[k] for k in keys), dtype=np.float64, count=len(keys))
+
+    def travel_km(self, fixtures: Sequence[Fixture], city_by_team: Mapping[int, int]) -> np.ndarray:
+        """ Distance the away team travels for each fixture. NaN when a team has no known city """
+        result = np.full(len(fixtures), np.nan)
+        known: List[int] = []
+        pairs: List[Tuple[int, int]] = []
+        for i, fixture in enumerate(fixtures):
+            home, away = city_by_team.get(fixture.home_team_id), city_by_team.get(fixture.away_team_id)
+            if home in self._rows and away in self._rows:
+                known.append(i)
+                pairs.append((home, away))
+        if pairs:
+            result[known] = self.distances(pairs)
+        return result
+
+    # --------------------
+    # Persistence
+    # --------------------
+    def preload(self, pairs: Iterable[Tuple[int, int, float]]) -> None:
+        """ Fills the sparse cache with persisted (city_a, city_b, km) rows """
+        self._pairs.update((city_pair(a, b), km) for a, b, km in pairs)
+
+    def drain_new(self) -> List[Tuple[int, int, float]]:
+        """ Pairs computed since the last call, as (city_a, city_b, km) rows to persist """
+        rows = [(a, b, km) for (a, b), km in self._new_pairs.items()]
+        self._new_pairs.clear()
+        return rows
+
+    def update_city(self, city_id: int, point: Optional[GeoPoint]) -> None:
+        """ Sets (or, with None, removes) the location of a city and evicts everything computed from the old one """
+        row = self._rows.get(city_id)
+        if point is None:
+            self._rows.pop(city_id, None)
+        elif row is None:
+            self._rows[city_id] = len(self.city_ids)
+            self.city_ids = np.append(self.city_ids, city_id)
+            self.latitudes = np.append(self.latitudes, point.latitude)
+            self.longitudes = np.append(self.longitudes, point.longitude)
+        else:
+            self.latitudes[row], self.longitudes[row] = point.latitude, point.longitude
+
+        # Moves are rare: a scan of the caches is cheaper than keeping a per-city index of them
+        self._matrices = {key: matrix for key, matrix in self._matrices.items() if city_id not in matrix}
+        self._pairs = {pair: km for pair, km in self._pairs.items() if city_id not in pair}
+        self._new_pairs = {pair: km for pair, km in self._new_pairs.items() if city_id not in pair}
+
+    def _row_indexes(self, city_ids: Sequence[int]) -> np.ndarray:
+        try:
+            return np.fromiter((self._rows[c] for c in city_ids), dtype=np.int64, count=len(city_ids))
+        except KeyError as e:
+            raise ValueError(f"City {e.args[0]} has no coordinates") from None
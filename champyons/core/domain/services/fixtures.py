@@ -0,0 +1,234 @@
+"""
+Fixture generation
+
+Builds the fixtures of competition editions: round robin leagues (circle method), group stages
+and knockout brackets, with balanced home/away and dates spread over the stage period.
+
+Schedules only depend on the number of teams, so the pairing patterns are computed once per size
+and cached; generating an edition is then a matter of mapping team ids onto a cached pattern. This
+keeps season start (every competition in the world at once) in the order of seconds.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+import itertools
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from champyons.core.domain.entities.competitions import CompetitionEdition, CompetitionGroup, CompetitionStage
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.enums.competition import StageFormat
+
+
+@lru_cache(maxsize=256)
+def round_robin_pattern(n_teams: int, legs: int = 2) -> np.ndarray:
+    """
+    Round robin schedule for `n_teams` teams as a read-only array of shape (rounds, matches, 2)
+    holding (home, away) team indexes.
+
+    Berger tables: with m = n - 1 (n even), round r pairs the last team with team r and teams
+    (r + k) mod m with (r - k) mod m for k = 1..n/2 - 1. The last team's venue alternates every
+    round and the home side of the other pairs alternates with k, so every team alternates home and
+    away with at most one break (two consecutive home or away games) per leg. Odd sizes add a bye.
+    Each leg is shifted by one round and swaps home and away, so it opens with the round that
+    closed the previous leg at the other venue: no break between legs.
+    """
+    if n_teams < 2:
+        raise ValueError("A round robin needs at least two teams")
+    if legs < 1:
+        raise ValueError("A round robin needs at least one leg")
+
+    n = n_teams + n_teams % 2 # odd sizes: the extra team is the bye
+    m = n - 1
+    rounds = []
+    for r in range(m):
+        pairs = [(m, r) if r % 2 else (r, m)]
+        for k in range(1, n // 2):
+            home, away = (r + k) % m, (r - k) % m
+            pairs.append((home, away) if k % 2 else (away, home))
+        rounds.append([pair for pair in pairs if max(pair) < n_teams])
+
+    single = np.array(rounds, dtype=np.int64).reshape(m, n_teams // 2, 2)
+    pattern = np.concatenate([
+        np.roll(single, leg, axis=0)[:, :, ::-1] if leg % 2 else np.roll(single, leg, axis=0)
+        for leg in range(legs)
+    ])
+    pattern.setflags(write=False)
+    return pattern
+
+
+@lru_cache(maxsize=256)
+def knockout_pairings(n_teams: int) -> tuple[tuple[int, Optional[int]], ...]:
+    """
+    First round of a seeded single elimination bracket, in bracket order: (seed, rival seed) with
+    seeds starting at 0 (best). The bracket is padded to a power of two and the best seeds get a
+    bye (rival None). Winners of consecutive ties meet in the next round.
+    """
+    if n_teams < 2:
+        raise ValueError("A knockout needs at least two teams")
+    size = 1 << (n_teams - 1).bit_length()
+    order = [0]
+    while len(order) < size:
+        length = len(order) * 2
+        order = [seed for s in order for seed in (s, length - 1 - s)]
+    return tuple(
+        (order[i], order[i + 1] if order[i + 1] < n_teams else None)
+        for i in range(0, size, 2)
+    )
+
+
+def knockout_round_count(n_teams: int) -> int:
+    return (n_teams - 1).bit_length()
+
+
+@lru_cache(maxsize=1024)
+def matchday_dates(start: date, end: date, rounds: int, weekday: int = 5, excluded: frozenset[date] = frozenset()) -> tuple[date, ...]:
+    """
+    Spreads `rounds` matchdays evenly between start and end (included), on the preferred weekday.
+    Falls back to any day of the week when there are not enough preferred weekdays.
+    """
+    days = [start + timedelta(days=d) for d in range((end - start).days + 1)]
+    days = [day for day in days if day not in excluded]
+    candidates = [day for day in days if day.weekday() == weekday]
+    if len(candidates) < rounds:
+        candidates = days
+    if len(candidates) < rounds:
+        raise ValueError(f"Cannot fit {rounds} matchdays between {start} and {end}")
+    indexes = np.linspace(0, len(candidates) - 1, rounds).round().astype(int)
+    return tuple(candidates[i] for i in indexes)
+
+
+def draw_groups(team_ids: List[int], group_count: int) -> List[List[int]]:
+    """ Splits seeded teams into groups by pots (snake order), so every group gets one team of each pot """
+    if group_count > len(team_ids) // 2:
+        raise ValueError(f"Cannot draw {len(team_ids)} teams into {group_count} groups")
+    groups: List[List[int]] = [[] for _ in range(group_count)]
+    for i, team_id in enumerate(team_ids):
+        pot, position = divmod(i, group_count)
+        groups[position if pot % 2 == 0 else group_count - 1 - position].append(team_id)
+    return groups
+
+
+@dataclass(frozen=True)
+class StagePeriod:
+    start: date
+    end: date
+
+
+class FixtureGenerator:
+    """
+    Builds fixtures for competition editions against their season calendar.
+
+    Args:
+        excluded_dates: days without club matches (e.g. international breaks)
+        first_group_id: id of the first group drawn. Groups get consecutive ids, which their fixtures
+            carry in group_id (e.g. to build standings)
+    """
+    def __init__(self, excluded_dates: Iterable[date] = (), first_group_id: int = 1):
+        self.excluded_dates = frozenset(excluded_dates)
+        self._group_ids = itertools.count(first_group_id)
+
+    def generate_all(self, editions: Iterable[CompetitionEdition]) -> int:
+        """ Generates the first stage of every edition (season start). Returns the number of fixtures """
+        return sum(len(self.generate_edition(edition)) for edition in editions)
+
+    def generate_edition(self, edition: CompetitionEdition) -> List[Fixture]:
+        """ Generates the fixtures of the first stage of an edition and stores them in edition.fixtures """
+        if edition.template is None or edition.template.first_stage is None:
+            raise ValueError("Edition must have a template with at least one stage")
+        fixtures = self.generate_stage(edition, edition.template.first_stage, edition.team_ids)
+        edition.fixtures = fixtures
+        return fixtures
+
+    def generate_stage(self, edition: CompetitionEdition, stage: CompetitionStage, team_ids: List[int]) -> List[Fixture]:
+        if stage.format == StageFormat.ROUND_ROBIN:
+            group = CompetitionGroup(id=next(self._group_ids), edition_id=edition.id, stage_id=stage.id, name=stage.name, team_ids=list(team_ids))
+            edition.groups = [group]
+            return self._round_robin(edition, stage, [group])
+        if stage.format == StageFormat.GROUPS:
+            edition.groups = [
+                CompetitionGroup(id=next(self._group_ids), edition_id=edition.id, stage_id=stage.id, name=chr(ord("A") + i), team_ids=ids)
+                for i, ids in enumerate(draw_groups(list(team_ids), stage.rules.group_count))
+            ]
+            return self._round_robin(edition, stage, edition.groups)
+        if stage.format == StageFormat.KNOCKOUT:
+            return self._knockout_first_round(edition, stage, list(team_ids))
+        raise ValueError(f"Unsupported stage format: {stage.format}")
+
+    def next_knockout_round(self, edition: CompetitionEdition, stage: CompetitionStage, round_number: int, team_ids: List[int]) -> List[Fixture]:
+        """
+        Fixtures of a later knockout round. `team_ids` are the qualified teams in bracket order
+        (winner of tie 1, winner of tie 2...), so consecutive teams meet.
+        """
+        if len(team_ids) < 2 or len(team_ids) % 2:
+            raise ValueError("A knockout round needs an even number of teams")
+        dates = self._knockout_dates(edition, stage, len(team_ids) * 2 ** (round_number - 1))
+        return self._ties(edition, stage, round_number, list(zip(team_ids[::2], team_ids[1::2])), dates)
+
+    def stage_period(self, edition: CompetitionEdition, stage: CompetitionStage) -> StagePeriod:
+        if edition.season is None:
+            raise ValueError("Edition must belong to a season to schedule its fixtures")
+        season = edition.season
+        start = season.start_date + timedelta(days=stage.start_day)
+        end = season.start_date + timedelta(days=stage.end_day) if stage.end_day is not None else season.end_date
+        return StagePeriod(start=start, end=min(end, season.end_date))
+
+    # --------------------
+    # Builders
+    # --------------------
+    def _round_robin(self, edition: CompetitionEdition, stage: CompetitionStage, groups: List[CompetitionGroup]) -> List[Fixture]:
+        patterns = [round_robin_pattern(len(group.team_ids), stage.rules.legs) for group in groups]
+        period = self.stage_period(edition, stage)
+        dates = matchday_dates(period.start, period.end, max(len(p) for p in patterns), stage.rules.matchday_weekday, self.excluded_dates)
+
+        fixtures: List[Fixture] = []
+        for group, pattern in zip(groups, patterns):
+            matches = np.asarray(group.team_ids, dtype=np.int64)[pattern]
+            legs_rounds = len(pattern) // stage.rules.legs
+            for round_index, round_matches in enumerate(matches.tolist()):
+                for home, away in round_matches:
+                    fixtures.append(Fixture(
+                        edition_id=edition.id,
+                        stage_id=stage.id,
+                        group_id=group.id,
+                        round_number=round_index + 1,
+                        leg=round_index // legs_rounds + 1,
+                        home_team_id=home,
+                        away_team_id=away,
+                        match_date=dates[round_index],
+                    ))
+        return fixtures
+
+    def _knockout_first_round(self, edition: CompetitionEdition, stage: CompetitionStage, team_ids: List[int]) -> List[Fixture]:
+        ties = [
+            (team_ids[a], team_ids[b])
+            for a, b in knockout_pairings(len(team_ids))
+            if b is not None # byes go straight to the next round
+        ]
+        return self._ties(edition, stage, 1, ties, self._knockout_dates(edition, stage, len(team_ids)))
+
+    def _knockout_dates(self, edition: CompetitionEdition, stage: CompetitionStage, n_teams: int) -> tuple[date, ...]:
+        period = self.stage_period(edition, stage)
+        rounds = knockout_round_count(n_teams) * min(stage.rules.legs, 2)
+        return matchday_dates(period.start, period.end, rounds, stage.rules.matchday_weekday, self.excluded_dates)
+
+    def _ties(self, edition: CompetitionEdition, stage: CompetitionStage, round_number: int, ties: List[tuple[int, int]], dates: tuple[date, ...]) -> List[Fixture]:
+        """ Better seed plays at home the first leg (single legs) or the second leg (two legs) """
+        legs = min(stage.rules.legs, 2)
+        fixtures: List[Fixture] = []
+        for leg in range(1, legs + 1):
+            match_date = dates[(round_number - 1) * legs + leg - 1]
+            for seed, rival in ties:
+                home, away = (rival, seed) if legs == 2 and leg == 1 else (seed, rival)
+                fixtures.append(Fixture(
+                    edition_id=edition.id,
+                    stage_id=stage.id,
+                    round_number=round_number,
+                    leg=leg,
+                    home_team_id=home,
+                    away_team_id=away,
+                    match_date=match_date,
+                ))
+        return fixtures
+
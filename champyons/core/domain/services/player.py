@@ -1,7 +1,10 @@
 from champyons.core.domain.entities import Country, LocalRegion, City, Nationality
+from champyons.core.domain.enums.geography import GeographyType
+from champyons.core.domain.services.population import PopulationRollups
 from champyons.core.domain.value_objects.geography.culture import Culture
 from typing import List, Optional
 from dataclasses import dataclass
+from itertools import accumulate
 
 import random
 
@@ -17,7 +20,15 @@ class PlayerGenerationContext:
     secondary_nationalities: List[Nationality]
 
 class PlayerGenerator:
-    
+    """
+    Args:
+        rollups: population rollups of the world. When the club base is tracked there, residence
+            cities are drawn from its cached sampler instead of summing the weights of every city
+    """
+    def __init__(self, rollups: Optional[PopulationRollups] = None, rng: random.Random = random):
+        self.rollups = rollups
+        self.rng = rng
+
     def generate_player_context(self, club_base_nation: Country | LocalRegion) -> PlayerGenerationContext:
         """Generate complete player context."""
         
@@ -56,14 +67,20 @@ class PlayerGenerator:
     
     def _select_city_by_population(self, club_base_nation: Country|LocalRegion):
         """Select a city weighted by population."""
+        if self.rollups is not None:
+            geography_type = GeographyType.COUNTRY if isinstance(club_base_nation, Country) else GeographyType.LOCAL_REGION
+            sampler = self.rollups.sampler(geography_type, club_base_nation.id)
+            if sampler.total:
+                return self.rollups.city(sampler.draw(self.rng))
+
         cities = club_base_nation.cities
         
         if not cities:
             raise ValueError(f"No cities found in {club_base_nation.name}")
         
         # Weight by population
-        weights = [city.population for city in cities]
-        return random.choices(cities, weights=weights, k=1)[0]
+        cum_weights = list(accumulate(city.population or 0 for city in cities))
+        return self.rng.choices(cities, cum_weights=cum_weights, k=1)[0]
     
     def _get_nationality_from_city(self, city: City, club_base: Country|LocalRegion) -> Nationality:
         """
@@ -0,0 +1,194 @@
+"""
+Population rollups
+
+Maintained population totals per local region, country, region and continent, so regional and
+national totals are dictionary reads instead of a sum over every city, and population-weighted
+city samplers (cumulative weights, drawn by bisection) for player generation.
+
+Each tracked city remembers the nodes it counts towards (its local region chain, its country and
+parent countries, their regions and continent). When a tracked city's population range, country or
+local region changes (assigned directly, or through City.update_population / City.move_to), only
+the difference is applied to those nodes, and only their samplers are dropped.
+
+The hierarchy (countries and local regions) must be added before the cities under it. Their links
+are copied when added: after changing a country's parent, continent or regions (or a local
+region's parent or country), add it again, which refreshes every tracked city.
+
+Usage:
+------
+    rollups = PopulationRollups.from_entities(countries, local_regions, cities)
+    rollups.total(GeographyType.COUNTRY, spain.id)
+    city_id = rollups.sampler(GeographyType.LOCAL_REGION, andalusia.id).draw(rng)
+    generator = PlayerGenerator(rollups=rollups)
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import random
+
+from champyons.core.domain.entities.geography import City, Country, LocalRegion
+from champyons.core.domain.enums.geography import GeographyType
+
+Node = Tuple[GeographyType, int]
+
+
+@dataclass(frozen=True)
+class CitySampler:
+    """ Population-weighted draws among the cities of a node """
+    city_ids: Tuple[int, ...]
+    cum_weights: Tuple[int, ...]
+
+    @property
+    def total(self) -> int:
+        return self.cum_weights[-1] if self.cum_weights else 0
+
+    def draw(self, rng: random.Random = random) -> int:
+        if not self.total:
+            raise ValueError("No populated cities to draw from")
+        return self.city_ids[bisect_right(self.cum_weights, rng.random() * self.total)]
+
+
+@dataclass(frozen=True)
+class _CountryLinks:
+    parent_id: Optional[int]
+    continent_id: Optional[int]
+    region_ids: Tuple[int, ...]
+
+
+class PopulationRollups:
+    def __init__(self):
+        self._countries: Dict[int, _CountryLinks] = {}
+        self._local_regions: Dict[int, Tuple[Optional[int], Optional[int]]] = {} # id -> (parent id, country id)
+        self._cities: Dict[int, City] = {}
+        self._counted: Dict[int, Tuple[int, Tuple[Node, ...]]] = {} # city id -> (population counted, nodes)
+        self._totals: Dict[Node, int] = defaultdict(int)
+        self._members: Dict[Node, Set[int]] = defaultdict(set)
+        self._samplers: Dict[Node, CitySampler] = {}
+
+    @classmethod
+    def from_entities(cls, countries: Iterable[Country], local_regions: Iterable[LocalRegion], cities: Iterable[City]) -> "PopulationRollups":
+        rollups = cls()
+        for country in countries:
+            rollups.add_country(country)
+        for local_region in local_regions:
+            rollups.add_local_region(local_region)
+        for city in cities:
+            rollups.track(city)
+        return rollups
+
+    # --------------------
+    # Hierarchy
+    # --------------------
+    def add_country(self, country: Country) -> None:
+        """ Adds a country, or updates its links (parent, continent, regions) """
+        links = _CountryLinks(
+            parent_id=country.parent_id,
+            continent_id=country.continent_id,
+            region_ids=tuple(region.id for region in country.regions if region.id is not None),
+        )
+        if self._countries.get(country.id, links) != links:
+            self._countries[country.id] = links
+            self._refresh_all()
+        self._countries[country.id] = links
+
+    def add_local_region(self, local_region: LocalRegion) -> None:
+        """ Adds a local region, or updates its links (parent local region, country) """
+        links = (local_region.parent_local_region_id, local_region.country_id)
+        if self._local_regions.get(local_region.id, links) != links:
+            self._local_regions[local_region.id] = links
+            self._refresh_all()
+        self._local_regions[local_region.id] = links
+
+    # --------------------
+    # Cities
+    # --------------------
+    def track(self, city: City) -> None:
+        """ Counts the city and follows its population changes and moves """
+        if city.id is None:
+            raise ValueError(f"City '{city.name}' has no id")
+        self._cities[city.id] = city
+        object.__setattr__(city, "_population_listener", self._refresh)
+        self._refresh(city)
+
+    def untrack(self, city_id: int) -> None:
+        city = self._cities.pop(city_id)
+        object.__setattr__(city, "_population_listener", None)
+        population, nodes = self._counted.pop(city_id)
+        self._apply(city_id, population, nodes, sign=-1)
+
+    def city(self, city_id: int) -> City:
+        return self._cities[city_id]
+
+    # --------------------
+    # Reads
+    # --------------------
+    def total(self, geography_type: GeographyType, entity_id: int) -> int:
+        return self._totals.get((geography_type, entity_id), 0)
+
+    def totals(self, geography_type: GeographyType) -> Dict[int, int]:
+        """ entity id -> population of every node of a type, for stats screens """
+        return {entity_id: total for (t, entity_id), total in self._totals.items() if t == geography_type}
+
+    def sampler(self, geography_type: GeographyType, entity_id: int) -> CitySampler:
+        """ Population-weighted sampler of the cities under a node. Cached until one of them changes """
+        node = (geography_type, entity_id)
+        sampler = self._samplers.get(node)
+        if sampler is None:
+            city_ids = tuple(sorted(self._members.get(node, ())))
+            cum_weights = tuple(accumulate(self._counted[c][0] for c in city_ids))
+            sampler = self._samplers[node] = CitySampler(city_ids, cum_weights)
+        return sampler
+
+    # --------------------
+    # Maintenance
+    # --------------------
+    def _refresh(self, city: City) -> None:
+        previous = self._counted.get(city.id)
+        population, nodes = city.population or 0, self._nodes_of(city)
+        if previous == (population, nodes):
+            return
+        if previous is not None:
+            self._apply(city.id, *previous, sign=-1)
+        self._apply(city.id, population, nodes, sign=1)
+        self._counted[city.id] = (population, nodes)
+
+    def _refresh_all(self) -> None:
+        # Hierarchy changes are rare: recomputing every city's nodes keeps the bookkeeping simple
+        for city in self._cities.values():
+            self._refresh(city)
+
+    def _apply(self, city_id: int, population: int, nodes: Tuple[Node, ...], sign: int) -> None:
+        for node in nodes:
+            self._totals[node] += sign * population
+            if sign > 0:
+                self._members[node].add(city_id)
+            else:
+                self._members[node].discard(city_id)
+            self._samplers.pop(node, None)
+
+    def _nodes_of(self, city: City) -> Tuple[Node, ...]:
+        nodes: List[Node] = []
+        country_id: Optional[int] = city.country_id
+        local_region_id = city.local_region_id
+        while local_region_id is not None and local_region_id in self._local_regions:
+            nodes.append((GeographyType.LOCAL_REGION, local_region_id))
+            local_region_id, region_country_id = self._local_regions[local_region_id]
+            country_id = country_id or region_country_id
+
+        regions: List[int] = []
+        continent_id: Optional[int] = None
+        while country_id is not None and (GeographyType.COUNTRY, country_id) not in nodes:
+            nodes.append((GeographyType.COUNTRY, country_id))
+            links = self._countries.get(country_id)
+            if links is None:
+                break
+            regions.extend(r for r in links.region_ids if r not in regions)
+            continent_id = continent_id or links.continent_id
+            country_id = links.parent_id
+
+        nodes.extend((GeographyType.REGION, region_id) for region_id in regions)
+        if continent_id is not None:
+            nodes.append((GeographyType.CONTINENT, continent_id))
+        return tuple(nodes)
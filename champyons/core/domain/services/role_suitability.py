@@ -0,0 +1,170 @@
+"""
+Role suitability
+
+Compiles the per-position skill weights declared in PlayerSkills field metadata into a single
+(role x skill) weight matrix that covers every PositionAttackingRoles and PositionDefendingRoles
+member. Suitability of many players for every role is then one matrix product instead of walking
+enums and dataclass metadata for each player and role.
+
+Usage:
+------
+    table = get_role_weight_table()
+    scores = table.score(skills_matrix([p.skills for p in players]))   # shape (n_players, n_roles)
+
+    cache = RoleSuitabilityCache()
+    cache.get_many({player.id: player.skills for player in squad})
+"""
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from champyons.core.domain.enums.player_positions import Position
+from champyons.core.domain.enums.player_roles import PositionRoles, PositionAttackingRoles, PositionDefendingRoles
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+SKILL_NAMES: tuple[str, ...] = tuple(f.name for f in fields(PlayerSkills))
+
+
+def skills_to_vector(skills: PlayerSkills) -> np.ndarray:
+    """ Returns skills as a float vector, ordered by SKILL_NAMES """
+    return np.fromiter((getattr(skills, name) for name in SKILL_NAMES), dtype=np.float64, count=len(SKILL_NAMES))
+
+
+def skills_matrix(skills: Iterable[PlayerSkills]) -> np.ndarray:
+    """ Stacks several PlayerSkills in a (n_players, n_skills) matrix """
+    rows = [skills_to_vector(s) for s in skills]
+    if not rows:
+        return np.empty((0, len(SKILL_NAMES)), dtype=np.float64)
+    return np.vstack(rows)
+
+
+@dataclass(frozen=True, eq=False)
+class RoleWeightTable:
+    """
+    Compiled role weights. Each row holds the skill weights of a role and sums up to 1, so scores
+    share the 0-20 scale of the skills (same as PlayerSkills.weighted_total).
+
+    Attacking roles come first, followed by defending roles. Use index_of() to locate a role.
+    """
+    roles: tuple[PositionRoles, ...]
+    skill_names: tuple[str, ...]
+    weights: np.ndarray
+
+    def __post_init__(self):
+        if self.weights.shape != (len(self.roles), len(self.skill_names)):
+            raise ValueError(
+                f"Weights shape {self.weights.shape} does not match "
+                f"({len(self.roles)} roles, {len(self.skill_names)} skills)"
+            )
+        object.__setattr__(self, "_role_index", {role: i for i, role in enumerate(self.roles)})
+
+    @classmethod
+    def compile(cls) -> "RoleWeightTable":
+        """
+        Builds the table from Position role lists and PlayerSkills metadata.
+
+        A role takes the mean weights of the positions it can be played in. Roles without weighted
+        positions get uniform weights: PlayerSkills only declares weights for ST and CB, so today
+        every other role (goalkeepers, full backs, wing backs, midfielders, wingers...) is uniform,
+        as are central midfield roles, which have no Position yet. Declaring weights_by_position
+        for more position codes refines those rows with no change here.
+        """
+        codes_by_role: Dict[PositionRoles, List[str]] = {}
+        for position in Position:
+            for role in (*position.attack_roles, *position.defense_roles):
+                codes_by_role.setdefault(role, []).append(position.code)
+
+        weights_by_skill = [f.metadata.get("weights_by_position", {}) for f in fields(PlayerSkills)]
+        roles: tuple[PositionRoles, ...] = (*PositionAttackingRoles, *PositionDefendingRoles)
+        weights = np.empty((len(roles), len(SKILL_NAMES)), dtype=np.float64)
+
+        for i, role in enumerate(roles):
+            codes = [code for code in codes_by_role.get(role, []) if any(code in w for w in weights_by_skill)]
+            row = np.array([
+                sum(w.get(code, 0.0) for code in codes) / len(codes) if codes else 0.0
+                for w in weights_by_skill
+            ])
+            total = row.sum()
+            weights[i] = row / total if total > 0 else 1 / len(SKILL_NAMES)
+
+        weights.setflags(write=False)
+        return cls(roles=roles, skill_names=SKILL_NAMES, weights=weights)
+
+    def index_of(self, role: PositionRoles) -> int:
+        return self._role_index[role] # type: ignore[attr-defined]
+
+    def score(self, skills: np.ndarray) -> np.ndarray:
+        """
+        Scores a (n_players, n_skills) matrix against every role in a single pass.
+
+        Returns:
+            (n_players, n_roles) matrix of suitabilities
+        """
+        return skills @ self.weights.T
+
+    def score_role(self, skills: np.ndarray, role: PositionRoles) -> np.ndarray:
+        """ Scores a (n_players, n_skills) matrix against a single role """
+        return skills @ self.weights[self.index_of(role)]
+
+
+@cache
+def get_role_weight_table() -> RoleWeightTable:
+    """ Returns the compiled table. It is built once per process, as enums and metadata are static """
+    return RoleWeightTable.compile()
+
+
+class RoleSuitabilityCache:
+    """
+    Per-player cache of role suitabilities.
+
+    Entries remember the skills they were computed from, so a player whose skills have changed
+    since the last call is recomputed automatically. invalidate() drops entries explicitly.
+    """
+    def __init__(self, table: Optional[RoleWeightTable] = None):
+        self.table = table or get_role_weight_table()
+        self._skills: Dict[int, np.ndarray] = {}
+        self._scores: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def get(self, player_id: int, skills: PlayerSkills) -> np.ndarray:
+        """ Returns the suitability of a player for every role (ordered as table.roles) """
+        return self.get_many({player_id: skills})[player_id]
+
+    def get_many(self, skills_by_player: Mapping[int, PlayerSkills]) -> Dict[int, np.ndarray]:
+        """ Returns suitabilities for several players, computing all stale entries in one pass """
+        stale_ids: List[int] = []
+        stale_vectors: List[np.ndarray] = []
+        for player_id, skills in skills_by_player.items():
+            vector = skills_to_vector(skills)
+            cached = self._skills.get(player_id)
+            if cached is None or not np.array_equal(cached, vector):
+                stale_ids.append(player_id)
+                stale_vectors.append(vector)
+
+        if stale_ids:
+            matrix = np.vstack(stale_vectors)
+            scores = self.table.score(matrix)
+            for row, player_id in enumerate(stale_ids):
+                self._skills[player_id] = matrix[row]
+                self._scores[player_id] = scores[row]
+
+        return {player_id: self._scores[player_id] for player_id in skills_by_player}
+
+    def best_roles(self, player_id: int, skills: PlayerSkills, *, roles: Optional[Sequence[PositionRoles]] = None, k: int = 3) -> List[tuple[PositionRoles, float]]:
+        """ Returns the k most suitable roles for a player, optionally restricted to given roles """
+        scores = self.get(player_id, skills)
+        candidates = list(roles) if roles is not None else list(self.table.roles)
+        ranked = sorted(candidates, key=lambda role: scores[self.table.index_of(role)], reverse=True)
+        return [(role, float(scores[self.table.index_of(role)])) for role in ranked[:k]]
+
+    def invalidate(self, player_id: int) -> None:
+        self._skills.pop(player_id, None)
+        self._scores.pop(player_id, None)
+
+    def clear(self) -> None:
+        self._skills.clear()
+        self._scores.clear()
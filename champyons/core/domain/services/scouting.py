@@ -0,0 +1,209 @@
+"""
+Scouting index
+
+In-memory, columnar index over player profiles used to answer scouting searches such as
+"the 50 best left backs under 23 from this scoutable region" without loading every profile.
+
+Profiles are partitioned by scoutable region (Region with RegionTypeEnum.SCOUTABLE_REGION),
+using the country <-> region mapping. Each partition keeps skills, positions, birth dates and
+nationalities in NumPy arrays, so a query is a handful of vectorized filters plus a top-k
+selection over the partitions it targets. Entries are upserted/removed one by one as profiles
+change, with no rebuild.
+"""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from champyons.core.domain.entities.geography import Country
+from champyons.core.domain.enums.player_positions import Position
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+from champyons.core.domain.services.columnar import NO_ID, ColumnarRows, ColumnSpec
+from champyons.core.domain.services.role_suitability import SKILL_NAMES, skills_to_vector
+
+@dataclass(frozen=True)
+class ScoutingEntry:
+    """ Indexed data of a player profile """
+    profile_id: int
+    skills: PlayerSkills
+    positions: PositionSet
+    date_of_birth: date
+    nationality_id: Optional[int] = None
+    country_id: Optional[int] = None # country used to place the profile in a scoutable region
+
+
+@dataclass(frozen=True)
+class ScoutingQuery:
+    """
+    Filtered top-k query. Every filter is optional.
+
+    - region_ids: scoutable regions to search in. None searches the whole world
+    - positions: profiles that can play at least one of these positions
+    - min_age / max_age: inclusive ages at reference_date (e.g. max_age=22 means "under 23")
+    - nationality_ids: profiles with any of these nationalities
+    - min_skills: inclusive lower bounds by skill name
+    - weights: skill weights used for ranking. Defaults to equal weights
+    """
+    region_ids: Optional[frozenset[int]] = None
+    positions: Optional[PositionSet] = None
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+    nationality_ids: Optional[frozenset[int]] = None
+    min_skills: Mapping[str, float] = field(default_factory=dict)
+    weights: Mapping[str, float] = field(default_factory=dict)
+    k: int = 50
+    reference_date: date = field(default_factory=date.today)
+
+    def __post_init__(self):
+        unknown = (set(self.min_skills) | set(self.weights)) - set(SKILL_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown skills: {', '.join(sorted(unknown))}")
+        if self.k < 1:
+            raise ValueError("k must be a positive integer")
+
+    @classmethod
+    def for_position(cls, position: Position | str, **kwargs) -> "ScoutingQuery":
+        """
+        Query for players of a position, ranked by the weights PlayerSkills declares for it. Only
+        ST and CB declare weights so far: other positions (e.g. "LB") rank by equal weights
+        """
+        position = Position(position)
+        return cls(positions=PositionSet.from_positions([position]), weights=PlayerSkills.position_weights(position.code), **kwargs)
+
+    def weight_vector(self) -> np.ndarray:
+        if not self.weights:
+            return np.full(len(SKILL_NAMES), 1 / len(SKILL_NAMES), dtype=np.float32)
+        return np.array([self.weights.get(name, 0.0) for name in SKILL_NAMES], dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class ScoutingResult:
+    profile_id: int
+    score: float
+
+
+def _years_before(reference: date, years: int) -> date:
+    try:
+        return reference.replace(year=reference.year - years)
+    except ValueError: # February 29th
+        return reference.replace(year=reference.year - years, day=28)
+
+
+class _Partition(ColumnarRows):
+    """ Columnar storage of the entries of one region """
+    skills: np.ndarray
+    positions: np.ndarray
+    birth_ordinals: np.ndarray
+    nationalities: np.ndarray
+
+    def __init__(self, capacity: int = 64):
+        super().__init__({
+            "skills": ColumnSpec(np.float32, (len(SKILL_NAMES),)),
+            "positions": ColumnSpec(np.int64),
+            "birth_ordinals": ColumnSpec(np.int64),
+            "nationalities": ColumnSpec(np.int64, fill=NO_ID),
+        }, capacity)
+
+    def upsert(self, entry: ScoutingEntry) -> None:
+        row = self.row_for(entry.profile_id)
+        self.skills[row] = skills_to_vector(entry.skills)
+        self.positions[row] = entry.positions.mask
+        self.birth_ordinals[row] = entry.date_of_birth.toordinal()
+        self.nationalities[row] = entry.nationality_id if entry.nationality_id is not None else NO_ID
+
+    def top_k(self, query: ScoutingQuery, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """ Returns (ids, scores) of the best k matching rows, unsorted """
+        n = self.size
+        mask = self.live_mask()
+
+        if query.positions is not None:
+            mask &= (self.positions[:n] & query.positions.mask) != 0
+        if query.min_age is not None:
+            mask &= self.birth_ordinals[:n] <= _years_before(query.reference_date, query.min_age).toordinal()
+        if query.max_age is not None:
+            mask &= self.birth_ordinals[:n] > _years_before(query.reference_date, query.max_age + 1).toordinal()
+        if query.nationality_ids is not None:
+            mask &= np.isin(self.nationalities[:n], np.fromiter(query.nationality_ids, dtype=np.int64))
+        for skill, value in query.min_skills.items():
+            mask &= self.skills[:n, SKILL_NAMES.index(skill)] >= value
+
+        rows = np.flatnonzero(mask)
+        scores = self.skills[rows] @ weights
+        if len(rows) > query.k:
+            best = np.argpartition(-scores, query.k - 1)[:query.k]
+            rows, scores = rows[best], scores[best]
+        return self.ids[rows], scores
+
+
+class ScoutingIndex:
+    """
+    Scouting index partitioned by scoutable region.
+
+    Profiles whose country has no scoutable region are kept in a partition that is only searched
+    by world-wide queries (region_ids=None).
+    """
+    def __init__(self, region_by_country: Mapping[int, int]):
+        """
+        Args:
+            region_by_country: scoutable region id for each country id
+        """
+        self.region_by_country = dict(region_by_country)
+        self._partitions: Dict[Optional[int], _Partition] = {}
+        self._region_by_profile: Dict[int, Optional[int]] = {}
+
+    @classmethod
+    def from_countries(cls, countries: Iterable[Country]) -> "ScoutingIndex":
+        """ Builds the country <-> region mapping from the scoutable region of each country """
+        return cls({
+            country.id: country.region.id
+            for country in countries
+            if country.id is not None and country.region is not None and country.region.id is not None
+        })
+
+    def __len__(self) -> int:
+        return len(self._region_by_profile)
+
+    def __contains__(self, profile_id: int) -> bool:
+        return profile_id in self._region_by_profile
+
+    def upsert(self, entry: ScoutingEntry) -> None:
+        """ Adds or refreshes a profile, moving it between regions if its country changed """
+        region_id = self.region_by_country.get(entry.country_id) if entry.country_id is not None else None
+        previous = self._region_by_profile.get(entry.profile_id, region_id)
+        if previous != region_id:
+            self._partitions[previous].remove(entry.profile_id)
+
+        partition = self._partitions.get(region_id)
+        if partition is None:
+            partition = self._partitions[region_id] = _Partition()
+        partition.upsert(entry)
+        self._region_by_profile[entry.profile_id] = region_id
+
+    def upsert_many(self, entries: Iterable[ScoutingEntry]) -> None:
+        for entry in entries:
+            self.upsert(entry)
+
+    def remove(self, profile_id: int) -> None:
+        if profile_id not in self._region_by_profile:
+            return
+        region_id = self._region_by_profile.pop(profile_id)
+        self._partitions[region_id].remove(profile_id)
+
+    def query(self, query: ScoutingQuery) -> List[ScoutingResult]:
+        """ Returns the k best matching profiles, sorted by descending score (ties by profile id) """
+        if query.region_ids is None:
+            partitions = list(self._partitions.values())
+        else:
+            partitions = [self._partitions[r] for r in query.region_ids if r in self._partitions]
+
+        weights = query.weight_vector()
+        candidates = [partition.top_k(query, weights) for partition in partitions if len(partition)]
+        if not candidates:
+            return []
+
+        ids = np.concatenate([c[0] for c in candidates])
+        scores = np.concatenate([c[1] for c in candidates])
+        order = np.lexsort((ids, -scores))[:query.k]
+        return [ScoutingResult(profile_id=int(ids[i]), score=float(scores[i])) for i in order]
@@ -0,0 +1,254 @@
+"""
+Player similarity
+
+k-nearest-neighbour search over player skill vectors (PlayerSkills fields, euclidean distance),
+optionally restricted to players that can play some positions. Used by the "similar players"
+screen and by the transfer AI to find replacements.
+
+Two indexes share the same interface:
+- BruteForceSimilarityIndex: exact, one vectorized distance computation per query.
+- IVFSimilarityIndex: approximate. Vectors are clustered with k-means into inverted lists and a
+  query only scans the `nprobe` lists closest to it. Recall/latency trade-off is tuned with nprobe.
+
+Both support incremental inserts and deletes.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+from champyons.core.domain.services.columnar import ColumnarRows, ColumnSpec
+from champyons.core.domain.services.role_suitability import SKILL_NAMES, skills_to_vector
+
+
+@dataclass(frozen=True)
+class SimilarityMatch:
+    profile_id: int
+    distance: float
+
+
+class _VectorStore(ColumnarRows):
+    """ Columnar storage of (id, skill vector, position mask) """
+    vectors: np.ndarray
+    positions: np.ndarray
+
+    def __init__(self, capacity: int = 64):
+        super().__init__({"vectors": ColumnSpec(np.float32, (len(SKILL_NAMES),)), "positions": ColumnSpec(np.int64)}, capacity)
+
+    def upsert(self, profile_id: int, vector: np.ndarray, positions: PositionSet) -> None:
+        row = self.row_for(profile_id)
+        self.vectors[row] = vector
+        self.positions[row] = positions.mask
+
+    def vector(self, profile_id: int) -> np.ndarray:
+        return self.vectors[self.rows[profile_id]]
+
+    def nearest(self, vector: np.ndarray, k: int, positions: Optional[PositionSet], exclude_id: Optional[int]) -> tuple[np.ndarray, np.ndarray]:
+        """ Returns (ids, squared distances) of the k nearest matching rows, unsorted """
+        n = self.size
+        mask = self.live_mask()
+        if positions is not None:
+            mask &= (self.positions[:n] & positions.mask) != 0
+        if exclude_id is not None and exclude_id in self.rows:
+            mask[self.rows[exclude_id]] = False
+
+        rows = np.flatnonzero(mask)
+        diff = self.vectors[rows] - vector
+        distances = np.einsum("ij,ij->i", diff, diff)
+        if len(rows) > k:
+            best = np.argpartition(distances, k - 1)[:k]
+            rows, distances = rows[best], distances[best]
+        return self.ids[rows], distances
+
+
+def _merge(candidates: List[tuple[np.ndarray, np.ndarray]], k: int) -> List[SimilarityMatch]:
+    """ Merges per-store candidates into the k nearest, sorted by distance (ties by profile id) """
+    candidates = [c for c in candidates if len(c[0])]
+    if not candidates:
+        return []
+    ids = np.concatenate([c[0] for c in candidates])
+    distances = np.concatenate([c[1] for c in candidates])
+    order = np.lexsort((ids, distances))[:k]
+    return [SimilarityMatch(profile_id=int(ids[i]), distance=float(np.sqrt(distances[i]))) for i in order]
+
+
+class SimilarityIndex(ABC):
+    """ Common interface of player similarity indexes """
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __contains__(self, profile_id: int) -> bool: ...
+
+    @abstractmethod
+    def upsert(self, profile_id: int, skills: PlayerSkills, positions: PositionSet) -> None:
+        """ Adds a player or refreshes its skills and positions """
+
+    @abstractmethod
+    def remove(self, profile_id: int) -> None:
+        """ Removes a player. Unknown ids are ignored """
+
+    @abstractmethod
+    def _vector(self, profile_id: int) -> np.ndarray: ...
+
+    @abstractmethod
+    def _search(self, vector: np.ndarray, k: int, positions: Optional[PositionSet], exclude_id: Optional[int]) -> List[SimilarityMatch]: ...
+
+    def search(self, skills: PlayerSkills, k: int = 10, positions: Optional[PositionSet] = None) -> List[SimilarityMatch]:
+        """ Returns the k players closest to some skills, nearest first """
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        return self._search(skills_to_vector(skills), k, positions, None)
+
+    def similar_to(self, profile_id: int, k: int = 10, positions: Optional[PositionSet] = None) -> List[SimilarityMatch]:
+        """ Returns the k players closest to an indexed player, excluding the player itself """
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        if profile_id not in self:
+            raise ValueError(f"Player profile {profile_id} is not indexed")
+        return self._search(self._vector(profile_id), k, positions, profile_id)
+
+
+class BruteForceSimilarityIndex(SimilarityIndex):
+    """ Exact k-NN: every query scans all players with a single vectorized distance computation """
+    def __init__(self):
+        self._store = _VectorStore()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, profile_id: int) -> bool:
+        return profile_id in self._store.rows
+
+    def upsert(self, profile_id: int, skills: PlayerSkills, positions: PositionSet) -> None:
+        self._store.upsert(profile_id, skills_to_vector(skills), positions)
+
+    def remove(self, profile_id: int) -> None:
+        if profile_id in self._store.rows:
+            self._store.remove(profile_id)
+
+    def _vector(self, profile_id: int) -> np.ndarray:
+        return self._store.vector(profile_id)
+
+    def _search(self, vector, k, positions, exclude_id):
+        return _merge([self._store.nearest(vector, k, positions, exclude_id)], k)
+
+
+def kmeans(vectors: np.ndarray, n_clusters: int, n_iter: int = 20, seed: int = 0) -> np.ndarray:
+    """ Lloyd's k-means. Returns the centroids; empty clusters keep their previous centroid """
+    rng = np.random.default_rng(seed)
+    n_clusters = min(n_clusters, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), size=n_clusters, replace=False)].astype(np.float32)
+    for _ in range(n_iter):
+        labels = _nearest_centroids(vectors, centroids, 1)[:, 0]
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.stack([np.bincount(labels, weights=vectors[:, d], minlength=n_clusters) for d in range(vectors.shape[1])], axis=1)
+        filled = counts > 0
+        updated = centroids.copy()
+        updated[filled] = sums[filled] / counts[filled, None]
+        if np.allclose(updated, centroids):
+            break
+        centroids = updated
+    return centroids
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, n: int) -> np.ndarray:
+    """ Indexes of the n closest centroids of each vector, closest first """
+    distances = (
+        np.einsum("ij,ij->i", vectors, vectors)[:, None]
+        - 2 * vectors @ centroids.T
+        + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+    )
+    n = min(n, len(centroids))
+    if n == 1:
+        return distances.argmin(axis=1)[:, None]
+    closest = np.argpartition(distances, n - 1, axis=1)[:, :n]
+    order = np.take_along_axis(distances, closest, axis=1).argsort(axis=1)
+    return np.take_along_axis(closest, order, axis=1)
+
+
+class IVFSimilarityIndex(SimilarityIndex):
+    """
+    Approximate k-NN with an inverted file: players are assigned to the closest of `n_lists`
+    k-means centroids and a query scans only the `nprobe` closest lists.
+
+    Centroids are trained once (train() or from_players()). Later inserts are assigned to the
+    existing centroids; retrain if the skill distribution drifts far from the training sample.
+    """
+    def __init__(self, n_lists: int = 64, nprobe: int = 8):
+        if n_lists < 1 or nprobe < 1:
+            raise ValueError("n_lists and nprobe must be positive integers")
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[_VectorStore] = []
+        self._list_by_profile: Dict[int, int] = {}
+
+    @classmethod
+    def from_players(cls, players: Iterable[tuple[int, PlayerSkills, PositionSet]], n_lists: int = 64, nprobe: int = 8, seed: int = 0) -> "IVFSimilarityIndex":
+        """ Trains the centroids on the given players and indexes them """
+        players = list(players)
+        index = cls(n_lists=n_lists, nprobe=nprobe)
+        vectors = np.array([skills_to_vector(skills) for _, skills, _ in players], dtype=np.float32)
+        index.train(vectors, seed=seed)
+        labels = _nearest_centroids(vectors, index.centroids, 1)[:, 0]
+        for (profile_id, _, positions), vector, label in zip(players, vectors, labels):
+            index._insert(profile_id, vector, positions, int(label))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._list_by_profile)
+
+    def __contains__(self, profile_id: int) -> bool:
+        return profile_id in self._list_by_profile
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def train(self, vectors: np.ndarray, seed: int = 0) -> None:
+        """ Computes the centroids and redistributes the already indexed players """
+        if len(vectors) == 0:
+            raise ValueError("Cannot train on an empty sample")
+        indexed = [
+            (profile_id, store.vector(profile_id).copy(), PositionSet(int(store.positions[store.rows[profile_id]])))
+            for store in self._lists
+            for profile_id in store.rows
+        ]
+        self.centroids = kmeans(np.asarray(vectors, dtype=np.float32), self.n_lists, seed=seed)
+        self._lists = [_VectorStore() for _ in range(len(self.centroids))]
+        self._list_by_profile = {}
+        for profile_id, vector, positions in indexed:
+            self._insert(profile_id, vector, positions)
+
+    def upsert(self, profile_id: int, skills: PlayerSkills, positions: PositionSet) -> None:
+        if not self.is_trained:
+            raise ValueError("IVF index must be trained before inserting players")
+        self._insert(profile_id, skills_to_vector(skills), positions)
+
+    def remove(self, profile_id: int) -> None:
+        list_index = self._list_by_profile.pop(profile_id, None)
+        if list_index is not None:
+            self._lists[list_index].remove(profile_id)
+
+    def _insert(self, profile_id: int, vector: np.ndarray, positions: PositionSet, list_index: Optional[int] = None) -> None:
+        if list_index is None:
+            list_index = int(_nearest_centroids(vector[None, :], self.centroids, 1)[0, 0])
+        previous = self._list_by_profile.get(profile_id)
+        if previous is not None and previous != list_index:
+            self._lists[previous].remove(profile_id)
+        self._lists[list_index].upsert(profile_id, vector, positions)
+        self._list_by_profile[profile_id] = list_index
+
+    def _vector(self, profile_id: int) -> np.ndarray:
+        return self._lists[self._list_by_profile[profile_id]].vector(profile_id)
+
+    def _search(self, vector, k, positions, exclude_id):
+        if not self.is_trained:
+            return []
+        probes = _nearest_centroids(vector[None, :], self.centroids, self.nprobe)[0]
+        return _merge([self._lists[i].nearest(vector, k, positions, exclude_id) for i in probes], k)
@@ -0,0 +1,180 @@
+"""
+League standings
+
+Incremental standings of a CompetitionGroup. Each result updates the two teams' rows and moves
+them in a sorted ranking with a binary search, instead of rebuilding the table from every match.
+
+Ranking follows CompetitionRules: points first, then tiebreakers in order. Tiebreakers that only
+depend on a team's own row (goal difference, goals for, wins) are part of the sorted key.
+Head-to-head tiebreakers depend on the tied teams, so they are resolved when the table is read,
+and only within blocks of teams still level at that point.
+
+Rows are immutable, so a matchday snapshot is just a tuple of references to the current rows.
+"""
+from bisect import bisect_left, insort
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Optional
+
+from champyons.core.domain.entities.competitions import CompetitionGroup
+from champyons.core.domain.entities.matches import Match
+from champyons.core.domain.enums.competition import Tiebreaker
+from champyons.core.domain.value_objects.football.competition_rules import CompetitionRules
+
+
+@dataclass(frozen=True)
+class StandingRow:
+    team_id: int
+    played: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    points: int = 0
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    def with_result(self, goals_for: int, goals_against: int, rules: CompetitionRules) -> "StandingRow":
+        won, drawn = goals_for > goals_against, goals_for == goals_against
+        return replace(
+            self,
+            played=self.played + 1,
+            wins=self.wins + won,
+            draws=self.draws + drawn,
+            losses=self.losses + (not won and not drawn),
+            goals_for=self.goals_for + goals_for,
+            goals_against=self.goals_against + goals_against,
+            points=self.points + (rules.points_win if won else rules.points_draw if drawn else rules.points_loss),
+        )
+
+
+@dataclass(frozen=True)
+class StandingsSnapshot:
+    """ Table of a group after a matchday, best team first """
+    matchday: int
+    rows: tuple[StandingRow, ...]
+
+    def position(self, team_id: int) -> int:
+        return next(i for i, row in enumerate(self.rows, start=1) if row.team_id == team_id)
+
+
+_ROW_CRITERIA: Dict[Tiebreaker, Callable[[StandingRow], int]] = {
+    Tiebreaker.GOAL_DIFFERENCE: lambda row: row.goal_difference,
+    Tiebreaker.GOALS_FOR: lambda row: row.goals_for,
+    Tiebreaker.WINS: lambda row: row.wins,
+}
+
+
+class GroupStandings:
+    """ Standings of a group of teams, updated one result at a time """
+    def __init__(self, team_ids: Iterable[int], rules: Optional[CompetitionRules] = None, group_id: Optional[int] = None):
+        self.group_id = group_id
+        self.rules = rules or CompetitionRules()
+
+        tiebreakers = self.rules.tiebreakers
+        first_h2h = next((i for i, t in enumerate(tiebreakers) if t.is_head_to_head), len(tiebreakers))
+        self._key_criteria = [_ROW_CRITERIA[t] for t in tiebreakers[:first_h2h]]
+        self._tied_criteria = tiebreakers[first_h2h:]
+
+        self._rows: Dict[int, StandingRow] = {team_id: StandingRow(team_id=team_id) for team_id in team_ids}
+        if len(self._rows) < 2:
+            raise ValueError("Standings need at least two teams")
+        self._keys: List[tuple] = sorted(self._key(row) for row in self._rows.values())
+        # (team, rival) -> [points, goals for, goals against] of team in matches against rival
+        self._head_to_head: Dict[tuple[int, int], List[int]] = {}
+        self._table: Optional[tuple[StandingRow, ...]] = None
+        self.history: Dict[int, StandingsSnapshot] = {}
+
+    @classmethod
+    def for_group(cls, group: CompetitionGroup, rules: Optional[CompetitionRules] = None) -> "GroupStandings":
+        return cls(group.team_ids, rules, group.id)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, team_id: int) -> StandingRow:
+        return self._rows[team_id]
+
+    def apply(self, match: Match) -> None:
+        """
+        Adds a result to the table. Each team's ranking slot is found by binary search (O(log n)),
+        but moving it in the sorted key list shifts the entries in between (O(n) worst case)
+        """
+        home, away = match.home_team_id, match.away_team_id
+        if home not in self._rows or away not in self._rows:
+            raise ValueError(f"Match {home}-{away} does not belong to this group")
+
+        for team_id, rival_id, goals_for, goals_against in (
+            (home, away, match.home_goals, match.away_goals),
+            (away, home, match.away_goals, match.home_goals),
+        ):
+            old = self._rows[team_id]
+            del self._keys[bisect_left(self._keys, self._key(old))]
+            new = old.with_result(goals_for, goals_against, self.rules)
+            self._rows[team_id] = new
+            insort(self._keys, self._key(new))
+
+            record = self._head_to_head.setdefault((team_id, rival_id), [0, 0, 0])
+            record[0] += new.points - old.points
+            record[1] += goals_for
+            record[2] += goals_against
+
+        self._table = None
+
+    def apply_many(self, matches: Iterable[Match]) -> None:
+        for match in matches:
+            self.apply(match)
+
+    def table(self) -> tuple[StandingRow, ...]:
+        """ Current table, best team first. Cached until the next result """
+        if self._table is None:
+            ordered = [self._rows[key[-1]] for key in self._keys]
+            if self._tied_criteria:
+                ordered = self._resolve_ties(ordered)
+            self._table = tuple(ordered)
+        return self._table
+
+    def position(self, team_id: int) -> int:
+        """ 1-based position of a team """
+        if team_id not in self._rows:
+            raise ValueError(f"Team {team_id} does not belong to this group")
+        return next(i for i, row in enumerate(self.table(), start=1) if row.team_id == team_id)
+
+    def snapshot(self, matchday: int) -> StandingsSnapshot:
+        """ Stores and returns the current table as the standings after a matchday """
+        snapshot = StandingsSnapshot(matchday=matchday, rows=self.table())
+        self.history[matchday] = snapshot
+        return snapshot
+
+    def _key(self, row: StandingRow) -> tuple:
+        return (-row.points, *(-criterion(row) for criterion in self._key_criteria), row.team_id)
+
+    def _resolve_ties(self, ordered: List[StandingRow]) -> List[StandingRow]:
+        """ Reorders blocks of teams level on the sorted key using the remaining (head-to-head) tiebreakers """
+        result: List[StandingRow] = []
+        start = 0
+        while start < len(ordered):
+            level = self._key(ordered[start])[:-1]
+            end = start + 1
+            while end < len(ordered) and self._key(ordered[end])[:-1] == level:
+                end += 1
+            block = ordered[start:end]
+            if len(block) > 1:
+                block = sorted(block, key=lambda row: self._tied_key(row, block))
+            result.extend(block)
+            start = end
+        return result
+
+    def _tied_key(self, row: StandingRow, block: List[StandingRow]) -> tuple:
+        records = [self._head_to_head.get((row.team_id, rival.team_id), (0, 0, 0)) for rival in block if rival is not row]
+        key = []
+        for tiebreaker in self._tied_criteria:
+            if tiebreaker == Tiebreaker.HEAD_TO_HEAD_POINTS:
+                key.append(-sum(r[0] for r in records))
+            elif tiebreaker == Tiebreaker.HEAD_TO_HEAD_GOAL_DIFFERENCE:
+                key.append(-sum(r[1] - r[2] for r in records))
+            else:
+                key.append(-_ROW_CRITERIA[tiebreaker](row))
+        return (*key, row.team_id)
@@ -0,0 +1,146 @@
+"""
+Transfer window calendar
+
+Precomputes the transfer windows of every federation for a season into a sorted interval index,
+so "which markets are open at this datetime" and "is this nationality's market open" are a binary
+search plus a set lookup, instead of rebuilding and checking every federation's windows.
+"""
+from __future__ import annotations
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.enums.simulation import SimulationEventType
+from champyons.core.domain.value_objects.football.federation_rules import FederationRules
+from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
+
+if TYPE_CHECKING:
+    from champyons.core.domain.entities.geography.nationality import Nationality
+    from champyons.core.application.services.simulation_scheduler import SimulationScheduler
+
+
+@dataclass(frozen=True)
+class WindowTransition:
+    """ Transfer markets opening or closing on a given in-game date """
+    date: date
+    opens: bool
+    window_number: int
+    nationality_ids: tuple[int, ...]
+
+
+class TransferWindowCalendar:
+    """
+    Interval index over the transfer windows of a season.
+
+    Window boundaries (UTC datetimes) are sorted and, for each elementary segment between two
+    consecutive boundaries, the set of nationalities whose market is open is precomputed. As in
+    TransferWindow.check_transfer_market_open, windows are open intervals: a market is closed at
+    the exact datetime it opens or closes.
+    """
+    def __init__(self, windows: Mapping[int, Iterable[TransferWindow]]):
+        """
+        Args:
+            windows: transfer windows of each nationality id
+        """
+        self.windows: Dict[int, tuple[TransferWindow, ...]] = {
+            nationality_id: tuple(sorted(ws, key=lambda w: w.start_datetime))
+            for nationality_id, ws in windows.items()
+        }
+
+        boundaries = sorted({
+            moment
+            for ws in self.windows.values()
+            for w in ws
+            for moment in (w.start_datetime, w.end_datetime)
+        })
+        self._boundaries: List[datetime] = boundaries
+
+        # _segments[i]: nationalities open strictly between boundaries[i - 1] and boundaries[i]
+        # (_segments[0] is before the first boundary and _segments[-1] after the last one)
+        opened_at: Dict[datetime, List[int]] = defaultdict(list)
+        closed_at: Dict[datetime, List[int]] = defaultdict(list)
+        for nationality_id, ws in self.windows.items():
+            for w in ws:
+                opened_at[w.start_datetime].append(nationality_id)
+                closed_at[w.end_datetime].append(nationality_id)
+
+        segments: List[frozenset[int]] = [frozenset()]
+        open_count: Dict[int, int] = defaultdict(int)
+        for moment in boundaries:
+            for nationality_id in closed_at.get(moment, ()):
+                open_count[nationality_id] -= 1
+            for nationality_id in opened_at.get(moment, ()):
+                open_count[nationality_id] += 1
+            segments.append(frozenset(n for n, count in open_count.items() if count > 0))
+        self._segments = segments
+
+        # Open exactly at a boundary: open on both sides of it (windows starting/ending there are closed)
+        self._at_boundary: List[frozenset[int]] = [segments[i] & segments[i + 1] for i in range(len(boundaries))]
+
+    @classmethod
+    def for_season(
+        cls,
+        season: Season,
+        federation_rules: Mapping[int, Optional[FederationRules]],
+    ) -> TransferWindowCalendar:
+        """
+        Builds the calendar of a season from the federation rules of each nationality id. Nationalities
+        without rules use the season default windows.
+        """
+        year = season.start_date.year
+        defaults = tuple(w for w in (season.default_transfer_window_1, season.default_transfer_window_2) if w)
+        return cls({
+            nationality_id: rules.get_transfer_windows(year) if rules is not None else defaults
+            for nationality_id, rules in federation_rules.items()
+        })
+
+    @classmethod
+    def from_nationalities(cls, season: Season, nationalities: Iterable[Nationality]) -> TransferWindowCalendar:
+        return cls.for_season(season, {n.id: n.federation_rules for n in nationalities if n.id is not None})
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+    def open_nationalities(self, moment: datetime) -> frozenset[int]:
+        """ Nationality ids whose transfer market is open at a given (aware) datetime. O(log n) """
+        i = bisect_left(self._boundaries, moment)
+        if i < len(self._boundaries) and self._boundaries[i] == moment:
+            return self._at_boundary[i]
+        return self._segments[i]
+
+    def is_open(self, nationality_id: int, moment: datetime) -> bool:
+        return nationality_id in self.open_nationalities(moment)
+
+    def next_change(self, moment: datetime) -> datetime | None:
+        """ Next datetime after `moment` when any market opens or closes """
+        i = bisect_left(self._boundaries, moment)
+        if i < len(self._boundaries) and self._boundaries[i] == moment:
+            i += 1
+        return self._boundaries[i] if i < len(self._boundaries) else None
+
+    def transitions(self) -> Iterator[WindowTransition]:
+        """ Openings and closings by in-game date, grouping nationalities that share them """
+        grouped: Dict[tuple[date, bool, int], List[int]] = defaultdict(list)
+        for nationality_id, ws in self.windows.items():
+            for number, w in enumerate(ws, start=1):
+                grouped[(w.start_date, True, number)].append(nationality_id)
+                grouped[(w.end_date, False, number)].append(nationality_id)
+        for (day, opens, number), ids in sorted(grouped.items()):
+            yield WindowTransition(date=day, opens=opens, window_number=number, nationality_ids=tuple(sorted(ids)))
+
+    def schedule_events(self, scheduler: SimulationScheduler) -> int:
+        """
+        Schedules an open/close event for every future transition. Payload carries `nationality_ids`
+        and `window_number`. Returns the number of scheduled events.
+        """
+        count = 0
+        for transition in self.transitions():
+            if transition.date < scheduler.game_state.sim_date:
+                continue
+            event_type = SimulationEventType.TRANSFER_WINDOW_OPEN if transition.opens else SimulationEventType.TRANSFER_WINDOW_CLOSE
+            scheduler.schedule(transition.date, event_type, nationality_ids=transition.nationality_ids, window_number=transition.window_number)
+            count += 1
+        return count
@@ -1,5 +1,25 @@
 from dataclasses import dataclass
 
+from champyons.core.domain.enums.competition import Tiebreaker
+
 @dataclass(frozen=True)
 class CompetitionRules:
-    pass
\ No newline at end of file
+    """
+    Rules of a competition: points awarded per result and tiebreakers for teams level on points.
+    Teams still level after every tiebreaker are ordered by team id, so tables are deterministic.
+    """
+    points_win: int = 3
+    points_draw: int = 1
+    points_loss: int = 0
+
+    tiebreakers: tuple[Tiebreaker, ...] = (
+        Tiebreaker.GOAL_DIFFERENCE,
+        Tiebreaker.GOALS_FOR,
+        Tiebreaker.HEAD_TO_HEAD_POINTS,
+    )
+
+    def __post_init__(self):
+        if not self.points_win >= self.points_draw >= self.points_loss:
+            raise ValueError("Points must satisfy win >= draw >= loss")
+        if len(set(self.tiebreakers)) != len(self.tiebreakers):
+            raise ValueError("Tiebreakers cannot be repeated")
@@ -1,6 +1,7 @@
 # champyons/core/domain/value_objects/geography/nation_rules.py
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional
 from ..game.transfer_window import TransferWindow
 
@@ -71,6 +72,7 @@ class FederationRules:
     ) -> TransferWindow:
         """
         Creates a TransferWindow for this nation in a specific year.
+        Windows are immutable, so they are built once per (rules, year, window) and reused.
         
         Args:
             year: The year to create window for
@@ -79,25 +81,32 @@ class FederationRules:
         Returns:
             TransferWindow configured for this nation
         """
-        from datetime import timedelta
-        
-        if window_number == 1:
-            start = date(year, self.window_1_start_month, self.window_1_start_day)
-            end = start + timedelta(days=self.window_1_duration_days)
-        elif window_number == 2:
-            # Window 2 might be in next year (e.g., Jan 2025 for 2024/25 season)
-            start = date(year + 1, self.window_2_start_month, self.window_2_start_day)
-            end = start + timedelta(days=self.window_2_duration_days)
-        else:
+        if window_number not in (1, 2):
             raise ValueError("Window number must be 1 or 2")
-        
-        return TransferWindow(
-            start_date=start,
-            end_date=end,
-            time_offset=self.time_offset
-        )
+        return _build_transfer_window(self, year, window_number)
+
+    def get_transfer_windows(self, year: int) -> tuple[TransferWindow, TransferWindow]:
+        """ Returns both transfer windows of the season starting in a given year """
+        return self.get_transfer_window(year, 1), self.get_transfer_window(year, 2)
     
     @classmethod
     def default(cls) -> "FederationRules":
         """Returns default nation rules (UEFA-like)."""
-        return cls()
\ No newline at end of file
+        return cls()
+
+
+@lru_cache(maxsize=4096)
+def _build_transfer_window(rules: FederationRules, year: int, window_number: int) -> TransferWindow:
+    if window_number == 1:
+        start = date(year, rules.window_1_start_month, rules.window_1_start_day)
+        end = start + timedelta(days=rules.window_1_duration_days)
+    else:
+        # Window 2 might be in next year (e.g., Jan 2025 for 2024/25 season)
+        start = date(year + 1, rules.window_2_start_month, rules.window_2_start_day)
+        end = start + timedelta(days=rules.window_2_duration_days)
+
+    return TransferWindow(
+        start_date=start,
+        end_date=end,
+        time_offset=rules.time_offset
+    )
@@ -1,5 +1,22 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class StageRulesBase:
-    pass
\ No newline at end of file
+    """
+    Rules that shape the fixtures of a competition stage.
+
+    - legs: times each pair of teams meet (2 = home and away). Knockout ties support 1 or 2 legs
+    - group_count: number of groups (GROUPS format only)
+    - matchday_weekday: preferred weekday for matchdays (0 = Monday ... 6 = Sunday)
+    """
+    legs: int = 2
+    group_count: int = 1
+    matchday_weekday: int = 5 # Saturday
+
+    def __post_init__(self):
+        if self.legs < 1:
+            raise ValueError("A stage must have at least one leg")
+        if self.group_count < 1:
+            raise ValueError("A stage must have at least one group")
+        if not 0 <= self.matchday_weekday <= 6:
+            raise ValueError("Matchday weekday must be between 0 (Monday) and 6 (Sunday)")
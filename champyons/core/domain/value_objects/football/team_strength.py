@@ -0,0 +1,35 @@
+from dataclasses import dataclass, fields
+from typing import Sequence
+
+import numpy as np
+
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+@dataclass(frozen=True)
+class TeamStrength:
+    """
+    Attacking and defending strength of a lineup, on the 0-20 skill scale.
+
+    - attack: average skills of the lineup weighted as strikers ("ST")
+    - defense: average skills of the lineup weighted as center backs ("CB")
+    """
+    attack: float = 10.0
+    defense: float = 10.0
+
+    def __post_init__(self):
+        if not (0 <= self.attack <= 20 and 0 <= self.defense <= 20):
+            raise ValueError(f"Team strength must be between 0 and 20, got {self.attack}/{self.defense}")
+
+    @classmethod
+    def from_lineup(cls, lineup: Sequence[PlayerSkills]) -> "TeamStrength":
+        if not lineup:
+            raise ValueError("A lineup needs at least one player")
+        names = [f.name for f in fields(PlayerSkills)]
+        skills = np.array([[getattr(player, name) for name in names] for player in lineup], dtype=np.float64)
+
+        def strength(position: str) -> float:
+            weights = PlayerSkills.position_weights(position)
+            vector = np.array([weights.get(name, 0.0) for name in names])
+            return float((skills @ vector).mean() / vector.sum())
+
+        return cls(attack=strength("ST"), defense=strength("CB"))
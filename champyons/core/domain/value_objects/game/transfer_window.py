@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, UTC
+from functools import cached_property
 
 @dataclass(frozen=True)
 class TransferWindow:
@@ -8,7 +9,7 @@ class TransferWindow:
 
     When offset is set, you can fix the exact time of the day that the market opens and closes.
 
-    All datetimes are returned with UTC timezone
+    All datetimes are returned with UTC timezone. They are computed once and cached, as windows are immutable
     """
     start_date: date
     end_date: date
@@ -26,11 +27,11 @@ class TransferWindow:
     def duration(self) -> int:
         return (self.end_date - self.start_date).days
     
-    @property
+    @cached_property
     def start_datetime(self) -> datetime:
         return self._date_to_datetime(self.start_date, self.time_offset)
     
-    @property
+    @cached_property
     def end_datetime(self) -> datetime:
         return self._date_to_datetime(self.end_date, self.time_offset)
     
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+import math
+
+EARTH_RADIUS_KM = 6371.0088 # mean radius
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM # half a great circle
+
+# (min latitude, max latitude, min longitude, max longitude)
+BoundingBox = Tuple[float, float, float, float]
+
+
+def haversine_km(latitude_a: float, longitude_a: float, latitude_b: float, longitude_b: float) -> float:
+    """ Great-circle distance in km between two points given in degrees """
+    phi_a, phi_b = math.radians(latitude_a), math.radians(latitude_b)
+    d_phi = phi_b - phi_a
+    d_lambda = math.radians(longitude_b - longitude_a)
+    h = math.sin(d_phi / 2) ** 2 + math.cos(phi_a) * math.cos(phi_b) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    " A point on the Earth's surface, in degrees "
+    latitude: float
+    longitude: float
+
+    def __post_init__(self):
+        if not -90 <= self.latitude <= 90:
+            raise ValueError(f"Invalid latitude: {self.latitude}. Must be between -90 and 90.")
+        if not -180 <= self.longitude <= 180:
+            raise ValueError(f"Invalid longitude: {self.longitude}. Must be between -180 and 180.")
+
+    def distance_km(self, other: "GeoPoint") -> float:
+        return haversine_km(self.latitude, self.longitude, other.latitude, other.longitude)
+
+    def bounding_boxes(self, radius_km: float) -> List[BoundingBox]:
+        """
+        Latitude/longitude boxes that contain every point within radius_km. Usually one box; two when
+        the circle crosses the antimeridian. Near the poles the box spans every longitude
+        """
+        if radius_km < 0:
+            raise ValueError("Radius cannot be negative")
+        d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        min_lat, max_lat = self.latitude - d_lat, self.latitude + d_lat
+        if min_lat <= -90 or max_lat >= 90:
+            return [(max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)]
+
+        # widest longitude span of the circle, reached at latitude asin(sin(lat) / cos(r))
+        ratio = math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(self.latitude))
+        if ratio >= 1:
+            return [(min_lat, max_lat, -180.0, 180.0)]
+        d_lon = math.degrees(math.asin(ratio))
+        min_lon, max_lon = self.longitude - d_lon, self.longitude + d_lon
+        if min_lon < -180:
+            return [(min_lat, max_lat, min_lon + 360, 180.0), (min_lat, max_lat, -180.0, max_lon)]
+        if max_lon > 180:
+            return [(min_lat, max_lat, min_lon, 180.0), (min_lat, max_lat, -180.0, max_lon - 360)]
+        return [(min_lat, max_lat, min_lon, max_lon)]
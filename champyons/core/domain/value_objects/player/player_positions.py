@@ -1,35 +1,117 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Set
+from typing import Iterable, Iterator, List, Tuple
 from champyons.core.domain.enums.player_positions import Position
 
+# Bit assigned to each position, following declaration order in Position.
+# Bits are persisted, so new positions must always be appended at the end of the enum.
+POSITION_BITS: dict[Position, int] = {position: 1 << index for index, position in enumerate(Position)}
+ALL_POSITIONS_MASK: int = (1 << len(POSITION_BITS)) - 1
+CENTER_SIDES_MASK: int = sum(bit for position, bit in POSITION_BITS.items() if abs(position.side) == 1)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class PositionSet:
+    """
+    Immutable set of positions backed by an integer bitmask.
+
+    Membership, set operations and "can play X" checks are single integer operations, and the mask
+    is the value stored in the database.
+    """
+    mask: int = 0
+
+    def __post_init__(self):
+        if not 0 <= self.mask <= ALL_POSITIONS_MASK:
+            raise ValueError(f"Invalid position mask: {self.mask}")
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position | str]) -> PositionSet:
+        """ Builds a set from positions or position codes (e.g. "LB") """
+        mask = 0
+        for position in positions:
+            mask |= POSITION_BITS[Position(position)]
+        return cls(mask)
+
+    def __contains__(self, position: Position | str) -> bool:
+        return bool(self.mask & POSITION_BITS[Position(position)])
+
+    def __iter__(self) -> Iterator[Position]:
+        return (position for position, bit in POSITION_BITS.items() if self.mask & bit)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __or__(self, other: PositionSet) -> PositionSet:
+        return PositionSet(self.mask | other.mask)
+
+    def __and__(self, other: PositionSet) -> PositionSet:
+        return PositionSet(self.mask & other.mask)
+
+    def __sub__(self, other: PositionSet) -> PositionSet:
+        return PositionSet(self.mask & ~other.mask)
+
+    def __xor__(self, other: PositionSet) -> PositionSet:
+        return PositionSet(self.mask ^ other.mask)
+
+    def can_play(self, position: Position | str) -> bool:
+        return position in self
+
+    def intersects(self, other: PositionSet) -> bool:
+        return bool(self.mask & other.mask)
+
+    def issubset(self, other: PositionSet) -> bool:
+        return self.mask & ~other.mask == 0
+
+    def without_center_sides(self) -> PositionSet:
+        """ Returns a copy without left/right variants of central positions (LCB, RDM, LST...) """
+        return PositionSet(self.mask & ~CENTER_SIDES_MASK)
+
+    def to_codes(self) -> List[str]:
+        return [position.code for position in self]
+
+
+@dataclass(frozen=True)
 class BasePositionList:
-    positions: List[Position] = field(default_factory=list)
+    """
+    Ordered positions without duplicates (first occurrence wins). Immutable, so position_set always
+    matches positions: build a new list to change them.
+    """
+    positions: Tuple[Position, ...] = ()
+    position_set: PositionSet = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        self._remove_duplicates()
+        self._set_positions(self.positions)
+
+    def __contains__(self, position: Position | str) -> bool:
+        return position in self.position_set
 
-    def _remove_duplicates(self):
-        seen: Set[Position] = set()
+    def _set_positions(self, positions: Iterable[Position | str]) -> None:
+        # Keeps the first occurrence of each position, preserving order
+        mask = 0
         unique_positions: List[Position] = []
-        for pos in self.positions:
-            if pos not in seen:
-                unique_positions.append(pos)
-                seen.add(pos)
-        self.positions = unique_positions
+        for pos in positions:
+            bit = POSITION_BITS[Position(pos)]
+            if not mask & bit:
+                unique_positions.append(Position(pos))
+                mask |= bit
+        object.__setattr__(self, "positions", tuple(unique_positions))
+        object.__setattr__(self, "position_set", PositionSet(mask))
 
 
-@dataclass
+@dataclass(frozen=True)
 class PitchPositionList(BasePositionList):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerPositionList(BasePositionList):
     def __post_init__(self):
         super().__post_init__()
         self._exclude_center_sides()
 
     def _exclude_center_sides(self):
-        self.positions = [pos for pos in self.positions if abs(pos.side) != 1]
\ No newline at end of file
+        central = self.position_set.without_center_sides()
+        self._set_positions(pos for pos in self.positions if pos in central)
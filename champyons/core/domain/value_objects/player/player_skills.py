@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field, fields
 from typing import Dict
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerSkills:
     shooting: float = field(default=10.0, metadata={
         "category": "technical",
@@ -39,6 +39,12 @@ class PlayerSkills:
             total += value * weights.get(position, 0.0)
         return total
 
+    @classmethod
+    def position_weights(cls, position: str) -> Dict[str, float]:
+        """ Returns the non-zero skill weights declared for a position code (e.g. "ST") """
+        weights = {f.name: f.metadata.get("weights_by_position", {}).get(position, 0.0) for f in fields(cls)}
+        return {name: weight for name, weight in weights.items() if weight}
+
     def group_by_category(self) -> Dict[str, Dict[str, float]]:
         result: Dict[str, Dict[str, float]] = {}
         for f in fields(self):
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List
+from typing import Any, Generic, Iterator, List, Mapping, Optional, TypeVar
+
+from .load_plan import LoadPlan
 
 T = TypeVar("T")
 
@@ -14,10 +16,34 @@ class BaseRepository(ABC, Generic[T]):
     def get_all(self) -> List[T]:
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000, where: Optional[Mapping[str, Any]] = None) -> Iterator[T]:
+        '''
+        Streams the entities in id order, fetching batch_size rows at a time, so only one batch is
+        held in memory. where filters by equality on entity fields, e.g. {"continent_id": 3}
+        '''
+        pass
+
+    @abstractmethod
+    def page(self, after_id: Optional[int] = None, limit: int = 100, where: Optional[Mapping[str, Any]] = None) -> List[T]:
+        ''' Keyset page: up to limit entities with id > after_id, in id order. Pass the last id of a page to get the next one '''
+        pass
+
     @abstractmethod
     def save(self, entity: T) -> T:
         pass
 
     @abstractmethod
     def delete(self, entity: T) -> None:
-        pass
\ No newline at end of file
+        pass
+
+class LoadPlanRepository(BaseRepository[T], ABC):
+    ''' Repository whose reads take a LoadPlan: the relations loaded with each entity. None uses the repository default '''
+
+    @abstractmethod
+    def get_by_id(self, entity_id: int, plan: Optional[LoadPlan] = None) -> T | None:
+        pass
+
+    @abstractmethod
+    def get_all(self, plan: Optional[LoadPlan] = None) -> List[T]:
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+
+DistanceRow = Tuple[int, int, float] # (city_a_id, city_b_id, km), city_a_id <= city_b_id
+
+class CityDistanceRepository(ABC):
+    ''' Persisted cache of city-to-city distances, saved along with the game '''
+
+    @abstractmethod
+    def get_all(self) -> List[DistanceRow]:
+        pass
+
+    @abstractmethod
+    def save_many(self, rows: Iterable[DistanceRow]) -> int:
+        """
+        Inserts or replaces distances. Returns the number of rows written
+        """
+
+    @abstractmethod
+    def delete_for_city(self, city_id: int) -> None:
+        """
+        Drops the distances of a city, e.g. after its coordinates change. Adapters that persist
+        cities themselves may also do it when a city with new coordinates is saved
+        """
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint
+
+class CityDistance(NamedTuple):
+    city_id: int
+    distance_km: float
+
+class CitySpatialIndex(ABC):
+    ''' Spatial index over city coordinates. Cities without coordinates are not indexed '''
+
+    @abstractmethod
+    def within_radius(self, point: GeoPoint, radius_km: float, limit: Optional[int] = None) -> List[CityDistance]:
+        """
+        Cities at most radius_km away from point (great-circle distance), nearest first
+
+        Params:
+            limit: maximum number of cities returned
+        """
+
+    @abstractmethod
+    def nearest(self, point: GeoPoint, k: int = 1, max_distance_km: Optional[float] = None) -> List[CityDistance]:
+        """
+        The k cities nearest to point, nearest first. Fewer when the index holds fewer cities, or
+        when max_distance_km is given and fewer cities are that close
+        """
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Rebuilds the index from the city table (after bulk loads that bypass the ORM). Returns the
+        number of indexed cities
+        """
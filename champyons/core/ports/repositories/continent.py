@@ -1,17 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from champyons.core.domain.entities.geography.continent import Continent
-from .base import BaseRepository
+from .base import LoadPlanRepository
+from .load_plan import LoadPlan
 
-class ContinentRepository(BaseRepository[Continent], ABC):
+class ContinentRepository(LoadPlanRepository[Continent], ABC):
     @abstractmethod
-    def get_by_code(self, code: str) -> Continent: 
+    def get_by_code(self, code: str, plan: Optional[LoadPlan] = None) -> Continent: 
         """
         Retrieves a continent by its code
         """
 
     @abstractmethod
-    def get_by_geonames_id(self, geonames_id: int) -> Continent:
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> Continent:
         """
         Retrieves a continent by its geonames id
         """
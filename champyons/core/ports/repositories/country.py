@@ -1,23 +1,45 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
 from champyons.core.domain.entities.geography.country import Country
-from .base import BaseRepository
+from .base import LoadPlanRepository
+from .load_plan import LoadPlan
 
-class CountryRepository(BaseRepository[Country], ABC):
+class CountryRow(NamedTuple):
+    ''' Flat read projection of a country: its own columns and the ids of its regions, no relations '''
+    id: int
+    code: str
+    name: str
+    continent_id: Optional[int]
+    parent_id: Optional[int]
+    geonames_id: Optional[int]
+    active: bool
+    created_at: datetime
+    updated_at: datetime
+    region_ids: Tuple[int, ...] = ()
+
+class CountryRepository(LoadPlanRepository[Country], ABC):
     @abstractmethod
-    def get_by_code(self, code: str) -> Country: 
+    def get_by_code(self, code: str, plan: Optional[LoadPlan] = None) -> Country: 
         """
         Retrieve a country by its code, usually the ISO 3166-1 alpha-2 code
         """
         
     @abstractmethod
-    def get_by_continent_id(self, continent_id: int) -> List[Country]:
+    def get_by_continent_id(self, continent_id: int, plan: Optional[LoadPlan] = None) -> List[Country]:
         """
         Retrieve all countries that belong to a specific continent.
         """
 
     @abstractmethod
-    def get_by_geonames_id(self, geonames_id: int) -> Country:
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> Country:
         """ 
         Retrieve a country by its geonames ID 
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    def get_rows(self, continent_id: Optional[int] = None) -> List[CountryRow]:
+        """
+        Flat rows of all countries (or the countries of a continent), read without building entities.
+        Meant for read-heavy list views
+        """
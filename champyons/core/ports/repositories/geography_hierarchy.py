@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+from champyons.core.domain.enums.geography import GeographyType
+
+class GeographyNode(NamedTuple):
+    """ A country, local region or city, and its distance to the node a query started from """
+    geography_type: GeographyType
+    entity_id: int
+    depth: int
+
+class GeographyHierarchy(ABC):
+    ''' Ancestry of the country > local region > city hierarchy, answered from a closure table '''
+
+    @abstractmethod
+    def ancestors(self, geography_type: GeographyType, entity_id: int) -> List[GeographyNode]:
+        """
+        Every ancestor of the node, nearest first (e.g. a city's local region, its parent local
+        regions, its country and the country's parents)
+        """
+
+    @abstractmethod
+    def descendants(
+        self,
+        geography_type: GeographyType,
+        entity_id: int,
+        of_type: Optional[GeographyType] = None,
+        max_depth: Optional[int] = None,
+    ) -> List[GeographyNode]:
+        """
+        Every node under the given one, nearest first
+
+        Params:
+            of_type: only nodes of this type (e.g. GeographyType.CITY for "every city under Andalusia")
+            max_depth: only nodes at most this many levels below (1 = direct children)
+        """
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Rebuilds the hierarchy from the country, local region and city tables (after bulk loads that
+        bypass the repositories). Returns the number of paths
+        """
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, NamedTuple, Optional
+from champyons.core.domain.enums.geography import GeographyType
+
+class GeonamesRef(NamedTuple):
+    """ Geography entity registered under a geonames id """
+    geonames_id: int
+    geography_type: GeographyType
+    entity_id: int
+
+class GeonamesRegistry(ABC):
+    ''' Single index of the geonames ids of every geography entity (cities, local regions, countries, regions, continents) '''
+
+    @abstractmethod
+    def resolve(self, geonames_id: int) -> Optional[GeonamesRef]:
+        """
+        Entity registered under the geonames id. If several entities share it, the one with the
+        highest priority (see GeographyType) is returned
+        """
+
+    @abstractmethod
+    def resolve_many(self, geonames_ids: Iterable[int]) -> Dict[int, GeonamesRef]:
+        """
+        Batch version of resolve: geonames id -> entity, for the ids that are registered. Unknown ids
+        are left out, so the missing ones are those to import
+        """
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Rebuilds the registry from the geography tables (after bulk loads that bypass the
+        repositories). Returns the number of registered entities
+        """
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+@dataclass(frozen=True)
+class LoadPlan:
+    """
+    Relations a repository must load along with an entity, and how deep.
+
+    Each relation carries the plan of the related entities, so LoadPlan.of("continent", "children.regions")
+    loads a country's continent, its children and the regions of those children. Relations not in
+    the plan are left empty (None or []) in the returned entities, and are never loaded behind the
+    caller's back.
+
+    Usage:
+    ------
+        countries = country_repository.get_all(plan=LoadPlan.of("continent", "regions"))
+    """
+    relations: tuple[tuple[str, "LoadPlan"], ...] = ()
+
+    @classmethod
+    def of(cls, *paths: str) -> "LoadPlan":
+        """ Builds a plan from dotted relation paths """
+        tree: dict = {}
+        for path in paths:
+            node = tree
+            for name in path.split("."):
+                if not name:
+                    raise ValueError(f"Invalid relation path: {path!r}")
+                node = node.setdefault(name, {})
+        return cls._from_tree(tree)
+
+    @classmethod
+    def _from_tree(cls, tree: dict) -> "LoadPlan":
+        return cls(tuple((name, cls._from_tree(children)) for name, children in tree.items()))
+
+    def __contains__(self, name: str) -> bool:
+        return any(relation == name for relation, _ in self.relations)
+
+    def __iter__(self) -> Iterator[tuple[str, "LoadPlan"]]:
+        return iter(self.relations)
+
+    def __bool__(self) -> bool:
+        return bool(self.relations)
+
+    def get(self, name: str) -> Optional["LoadPlan"]:
+        """ Plan of a relation's entities, or None when the relation is not loaded """
+        return next((plan for relation, plan in self.relations if relation == name), None)
+
+    @property
+    def depth(self) -> int:
+        return 1 + max((plan.depth for _, plan in self.relations), default=0) if self.relations else 0
+
+
+NO_RELATIONS = LoadPlan()
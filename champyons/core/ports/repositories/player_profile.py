@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields
+from typing import List, Mapping, Optional
+from champyons.core.domain.entities.people import PlayerProfile
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from .base import BaseRepository
+
+@dataclass(frozen=True)
+class PlayerProfileSearch:
+    """
+    Scouting query over player profiles. Every criterion is optional.
+
+    - min_skills / max_skills: inclusive bounds by skill name (e.g. {"passing": 15})
+    - positions: profiles that can play at least one of these positions
+    - order_by_weights: skill weights used to rank results (descending weighted score), e.g.
+      PlayerSkills.position_weights("ST")
+    - limit: maximum number of results (top-k when combined with order_by_weights)
+    """
+    min_skills: Mapping[str, float] = field(default_factory=dict)
+    max_skills: Mapping[str, float] = field(default_factory=dict)
+    positions: Optional[PositionSet] = None
+    order_by_weights: Mapping[str, float] = field(default_factory=dict)
+    limit: Optional[int] = None
+    active_only: bool = True
+
+    def __post_init__(self):
+        skill_names = {f.name for f in fields(PlayerSkills)}
+        for criteria in (self.min_skills, self.max_skills, self.order_by_weights):
+            unknown = set(criteria) - skill_names
+            if unknown:
+                raise ValueError(f"Unknown skills: {', '.join(sorted(unknown))}")
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("Limit must be a positive integer")
+
+
+class PlayerProfileRepository(BaseRepository[PlayerProfile], ABC):
+    @abstractmethod
+    def get_by_person_id(self, person_id: int) -> PlayerProfile | None:
+        """
+        Retrieve the player profile of a person
+        """
+
+    @abstractmethod
+    def search(self, query: PlayerProfileSearch) -> List[PlayerProfile]:
+        """
+        Retrieve player profiles matching a scouting query. Filters and ordering must be resolved
+        by the storage, without loading non-matching profiles.
+        """
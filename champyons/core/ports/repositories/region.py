@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from champyons.core.domain.entities.geography.region import Region
-from .base import BaseRepository
+from .base import LoadPlanRepository
+from .load_plan import LoadPlan
 
-class RegionRepository(BaseRepository[Region], ABC):
+class RegionRepository(LoadPlanRepository[Region], ABC):
     @abstractmethod
-    def get_by_geonames_id(self, geonames_id: int) -> Region:
+    def get_by_geonames_id(self, geonames_id: int, plan: Optional[LoadPlan] = None) -> Region:
         """ 
         Retrieve a region by its geonames ID 
         """
\ No newline at end of file
@@ -0,0 +1,45 @@
+from datetime import date
+
+import pytest
+
+from champyons.adapters.persistence.snapshot import GameSnapshotData
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.entities.geography import City, Continent, Country, LocalRegion, Nationality, Region
+from champyons.core.domain.entities.people import PlayerProfile
+from champyons.core.domain.enums.city import CityPopulationRange
+from champyons.core.domain.enums.nationality import NationalityEntityType
+from champyons.core.domain.enums.region import RegionTypeEnum
+from champyons.core.domain.value_objects.football.federation_rules import FederationRules
+from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+
+@pytest.fixture
+def game_data() -> GameSnapshotData:
+    continent = Continent(id=1, code="EU", name="Europe")
+    region = Region(id=1, name="European Union", type=RegionTypeEnum(1))
+    spain = Country(id=1, name="Spain", code="ES", continent_id=1)
+    spain.regions.append(region)
+    galicia = LocalRegion(id=1, name="Galicia", code="GA", country_id=1)
+    city = City(
+        id=1, name="Vigo", population_range=CityPopulationRange(list(CityPopulationRange)[0]),
+        latitude=42.24, longitude=-8.72, country_id=1, local_region_id=1,
+    )
+    nationality = Nationality(
+        id=1, entity_type=NationalityEntityType.COUNTRY, entity_id=1, entity=spain, federation_rules=FederationRules(time_offset=1),
+    )
+    season = Season(
+        id=1, start_date=date(2025, 7, 1), end_date=date(2026, 6, 30),
+        default_transfer_window_1=TransferWindow(date(2025, 7, 1), date(2025, 9, 1)),
+    )
+    profiles = [
+        PlayerProfile(id=i, person_id=i, skills=PlayerSkills(passing=float(i % 20 + 1)), positions=PositionSet.from_positions(["ST"]))
+        for i in range(1, 101)
+    ]
+    return GameSnapshotData(
+        game_state=GameState(id=1, sim_date=date(2025, 8, 1), start_sim_date=date(2025, 7, 1), current_season_id=1),
+        seasons=[season], continents=[continent], regions=[region], countries=[spain],
+        local_regions=[galicia], cities=[city], nationalities=[nationality], player_profiles=profiles,
+    )
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from champyons.adapters.persistence.sqlalchemy.base import Base
+import champyons.adapters.persistence.sqlalchemy.models # noqa: F401 (registers the models)
+
+
+@pytest.fixture()
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def db_session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def query_counter(engine):
+    """ List of the SQL statements executed by the engine """
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
@@ -0,0 +1,56 @@
+import pytest
+
+from champyons.adapters.persistence.sqlalchemy.models.city import City
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.local_region import LocalRegion
+from champyons.adapters.persistence.sqlalchemy.repositories.city_distance_repository import SqlAlchemyCityDistanceRepository
+from champyons.core.domain.services.distances import CityDistances
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint
+
+
+@pytest.fixture()
+def points(db_session):
+    country = Country(code="ES", default_name="Spain")
+    db_session.add(country)
+    db_session.flush()
+    region = LocalRegion(default_name="Spain", country_id=country.id)
+    db_session.add(region)
+    db_session.flush()
+    cities = [
+        City(default_name=name, country_id=country.id, local_region_id=region.id, latitude=lat, longitude=lon)
+        for name, lat, lon in [("Madrid", 40.4168, -3.7038), ("Barcelona", 41.3874, 2.1686), ("Sevilla", 37.3891, -5.9845)]
+    ]
+    db_session.add_all(cities)
+    db_session.commit()
+    return {c.id: GeoPoint(c.latitude, c.longitude) for c in cities}
+
+
+def test_distances_round_trip(db_session, points):
+    repository = SqlAlchemyCityDistanceRepository(db_session)
+    a, b, c = points
+    distances = CityDistances(points)
+    distances.distances([(b, a), (a, c)])
+    assert repository.save_many(distances.drain_new()) == 2
+    assert repository.save_many([(c, a, 1.0)]) == 1 # replaces, stored in (lower, higher) order
+
+    restored = CityDistances(points)
+    restored.preload(repository.get_all())
+    assert restored.distance(a, b) == pytest.approx(points[a].distance_km(points[b]))
+    assert restored.distance(a, c) == 1.0
+
+    repository.delete_for_city(a)
+    assert repository.get_all() == []
+
+
+def test_moving_a_city_drops_its_persisted_distances(db_session, points):
+    repository = SqlAlchemyCityDistanceRepository(db_session)
+    a, b, c = points
+    repository.save_many([(a, b, 1.0), (a, c, 2.0), (b, c, 3.0)])
+
+    db_session.get(City, b).default_name = "Barna" # not a move
+    db_session.commit()
+    assert len(repository.get_all()) == 3
+
+    db_session.get(City, a).latitude = 39.8628
+    db_session.commit()
+    assert repository.get_all() == [(b, c, 3.0)]
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+import sqlalchemy as sa
+
+from champyons.adapters.persistence.sqlalchemy.models.city import City
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.local_region import LocalRegion
+from champyons.adapters.persistence.sqlalchemy.repositories.city_spatial_index_repository import SqliteCitySpatialIndex
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint, haversine_km
+
+MADRID = GeoPoint(40.4168, -3.7038)
+
+
+@pytest.fixture()
+def cities(db_session):
+    country = Country(code="XX", default_name="World")
+    db_session.add(country)
+    db_session.flush()
+    region = LocalRegion(default_name="Everywhere", country_id=country.id)
+    db_session.add(region)
+    db_session.flush()
+    rng = random.Random(7)
+    points = {}
+    for i in range(2000):
+        point = (rng.uniform(-70, 70), rng.uniform(-180, 180))
+        city = City(default_name=f"City {i}", country_id=country.id, local_region_id=region.id, latitude=point[0], longitude=point[1])
+        db_session.add(city)
+        db_session.flush()
+        points[city.id] = point
+    db_session.add(City(default_name="Nowhere", country_id=country.id, local_region_id=region.id))
+    db_session.commit()
+    return points
+
+
+def _brute_force(points, point, radius_km):
+    distances = sorted((haversine_km(point.latitude, point.longitude, *p), i) for i, p in points.items())
+    return [(i, d) for d, i in distances if d <= radius_km]
+
+
+def test_within_radius_matches_a_full_scan(db_session, cities):
+    index = SqliteCitySpatialIndex(db_session)
+    for center in (MADRID, GeoPoint(-17.7, 179.9), GeoPoint(65, 30)):
+        result = index.within_radius(center, 1500)
+        assert [(m.city_id, pytest.approx(m.distance_km)) for m in result] == _brute_force(cities, center, 1500)
+
+
+def test_nearest(db_session, cities):
+    index = SqliteCitySpatialIndex(db_session)
+    expected = _brute_force(cities, MADRID, float("inf"))
+    assert [m.city_id for m in index.nearest(MADRID, k=5)] == [i for i, _ in expected[:5]]
+    assert len(index.nearest(MADRID, k=5000)) == 2000
+    assert index.nearest(MADRID, k=3, max_distance_km=expected[1][1] + 0.001) == index.nearest(MADRID, k=2)
+
+
+def test_index_follows_the_city_table(db_session, cities):
+    index = SqliteCitySpatialIndex(db_session)
+    city = db_session.get(City, index.nearest(MADRID)[0].city_id)
+    city.latitude, city.longitude = MADRID.latitude, MADRID.longitude
+    db_session.commit()
+    assert index.nearest(MADRID)[0] == (city.id, 0.0)
+
+    db_session.delete(city)
+    db_session.commit()
+    assert index.nearest(MADRID)[0].city_id != city.id
+
+
+def test_rebuild_after_bulk_insert(db_session, cities):
+    country_id = db_session.execute(sa.select(Country.id)).scalar_one()
+    region_id = db_session.execute(sa.select(LocalRegion.id)).scalar_one()
+    db_session.execute(sa.insert(City.__table__), [
+        {"default_name": "Bulk", "country_id": country_id, "local_region_id": region_id, "latitude": 40.4, "longitude": -3.7},
+    ])
+    index = SqliteCitySpatialIndex(db_session)
+    assert index.nearest(MADRID)[0].distance_km > 1
+    assert index.rebuild() == 2001
+    assert index.nearest(MADRID)[0].distance_km < 2
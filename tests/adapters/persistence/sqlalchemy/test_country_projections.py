@@ -0,0 +1,46 @@
+import pytest
+
+from champyons.adapters.persistence.sqlalchemy.models.continent import Continent
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.region import Region
+from champyons.adapters.persistence.sqlalchemy.repositories.country_repository import SqlAlchemyCountryRepository
+from champyons.core.application.dto.country import CountryRead
+from champyons.core.application.dto.helpers.projection import Projection
+from champyons.core.application.services.country_service import CountryService
+from champyons.core.ports.repositories.country import CountryRow
+
+
+@pytest.fixture()
+def service(db_session):
+    europe, asia = Continent(code="EU", default_name="Europe"), Continent(code="AS", default_name="Asia")
+    db_session.add_all([europe, asia])
+    db_session.flush()
+    countries = [Country(code=f"E{i}", default_name=f"Euro {i}", continent_id=europe.id, geonames_id=100 + i) for i in range(20)]
+    countries[3].regions = [Region(default_name="Iberia"), Region(default_name="Southern Europe")]
+    db_session.add_all(countries)
+    db_session.add(Country(code="JP", default_name="Japan", continent_id=asia.id))
+    db_session.commit()
+    db_session.expunge_all()
+    return CountryService(SqlAlchemyCountryRepository(db_session), translation_service=None)
+
+
+def test_projections_return_the_same_countries(service, query_counter):
+    full = service.get_by_continent(1)
+    query_counter.clear()
+    rows = service.get_by_continent(1, projection=Projection.ROW)
+    read_models = service.get_by_continent(1, projection=Projection.READ_MODEL)
+
+    assert len(query_counter) == 2 # one Core select per projection
+    assert isinstance(rows[0], CountryRow) and isinstance(read_models[0], CountryRead)
+    assert [(c.id, c.code, c.name, c.geonames_id) for c in full] == [(r.id, r.code, r.name, r.geonames_id) for r in rows]
+    assert [c.model_dump(exclude={"continent", "regions"}) for c in full] == [c.model_dump(exclude={"continent", "regions"}) for c in read_models]
+
+
+def test_row_projections_carry_region_ids(service, query_counter):
+    rows = service.get_by_continent(1, projection=Projection.ROW)
+    read_models = service.get_by_continent(1, projection=Projection.READ_MODEL)
+
+    assert len(query_counter) == 2 # regions are grouped into the same select
+    assert [r.region_ids for r in rows if r.region_ids] == [(1, 2)]
+    assert rows[3].region_ids == (1, 2) and rows[4].region_ids == ()
+    assert read_models[3].region_ids == [1, 2]
@@ -0,0 +1,78 @@
+import pytest
+import sqlalchemy as sa
+
+from champyons.adapters.persistence.sqlalchemy.models.city import City
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.geography_closure import GeographyClosure
+from champyons.adapters.persistence.sqlalchemy.models.local_region import LocalRegion
+from champyons.adapters.persistence.sqlalchemy.repositories.geography_hierarchy_repository import SqlAlchemyGeographyHierarchy
+from champyons.core.domain.enums.geography import GeographyType as G
+
+
+@pytest.fixture()
+def spain(db_session):
+    """ United Kingdom > England, and Spain > Andalusia > Sevilla (province) > {Sevilla, Dos Hermanas}, Spain > Madrid (city) """
+    uk = Country(code="GB", default_name="United Kingdom")
+    spain = Country(code="ES", default_name="Spain")
+    db_session.add_all([uk, spain])
+    db_session.flush()
+    db_session.add(Country(code="GB-ENG", default_name="England", parent_id=uk.id))
+    andalusia = LocalRegion(default_name="Andalusia", country_id=spain.id)
+    db_session.add(andalusia)
+    db_session.flush()
+    province = LocalRegion(default_name="Sevilla", country_id=spain.id, parent_local_region_id=andalusia.id)
+    db_session.add(province)
+    db_session.flush()
+    db_session.add_all([
+        City(default_name="Sevilla", country_id=spain.id, local_region_id=province.id),
+        City(default_name="Dos Hermanas", country_id=spain.id, local_region_id=province.id),
+        City(default_name="Cordoba", country_id=spain.id, local_region_id=andalusia.id),
+    ])
+    db_session.commit()
+    return {"uk": uk.id, "spain": spain.id, "andalusia": andalusia.id, "province": province.id}
+
+
+def _paths(db_session):
+    return set(db_session.execute(sa.select(GeographyClosure.__table__)).all())
+
+
+def test_descendants_and_ancestors(db_session, spain, query_counter):
+    hierarchy = SqlAlchemyGeographyHierarchy(db_session)
+    cities = hierarchy.descendants(G.LOCAL_REGION, spain["andalusia"], of_type=G.CITY)
+    assert len(query_counter) == 1
+    assert [(c.depth) for c in cities] == [1, 2, 2]
+    assert len(hierarchy.descendants(G.COUNTRY, spain["spain"])) == 5
+    assert [n.geography_type for n in hierarchy.descendants(G.COUNTRY, spain["spain"], max_depth=1)] == [G.LOCAL_REGION]
+
+    sevilla = cities[1].entity_id
+    assert [(n.geography_type, n.entity_id) for n in hierarchy.ancestors(G.CITY, sevilla)] == [
+        (G.LOCAL_REGION, spain["province"]), (G.LOCAL_REGION, spain["andalusia"]), (G.COUNTRY, spain["spain"]),
+    ]
+    assert hierarchy.descendants(G.COUNTRY, spain["uk"])[0].geography_type == G.COUNTRY
+
+
+def test_moving_a_subtree(db_session, spain):
+    hierarchy = SqlAlchemyGeographyHierarchy(db_session)
+    province = db_session.get(LocalRegion, spain["province"])
+    province.parent_local_region_id = None
+    db_session.commit()
+    assert len(hierarchy.descendants(G.LOCAL_REGION, spain["andalusia"], of_type=G.CITY)) == 1
+    assert [n.depth for n in hierarchy.descendants(G.COUNTRY, spain["spain"], of_type=G.CITY)] == [2, 2, 2]
+
+    province.parent_local_region_id = spain["andalusia"]
+    db_session.commit()
+    assert len(hierarchy.descendants(G.LOCAL_REGION, spain["andalusia"], of_type=G.CITY)) == 3
+
+
+def test_delete(db_session, spain):
+    hierarchy = SqlAlchemyGeographyHierarchy(db_session)
+    db_session.execute(sa.delete(City).where(City.local_region_id == spain["province"]))
+    db_session.delete(db_session.get(LocalRegion, spain["province"]))
+    db_session.commit()
+    assert len(hierarchy.descendants(G.COUNTRY, spain["spain"])) == 2
+
+
+def test_rebuild_matches_incremental_maintenance(db_session, spain):
+    incremental = _paths(db_session)
+    assert SqlAlchemyGeographyHierarchy(db_session).rebuild() == len(incremental)
+    assert _paths(db_session) == incremental
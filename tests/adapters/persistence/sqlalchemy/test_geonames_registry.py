@@ -0,0 +1,77 @@
+import pytest
+import sqlalchemy as sa
+
+from champyons.adapters.persistence.sqlalchemy.models.city import City
+from champyons.adapters.persistence.sqlalchemy.models.continent import Continent
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.local_region import LocalRegion
+from champyons.adapters.persistence.sqlalchemy.models.region import Region
+from champyons.adapters.persistence.sqlalchemy.repositories.continent_repository import SqlAlchemyContinentRepository
+from champyons.adapters.persistence.sqlalchemy.repositories.country_repository import SqlAlchemyCountryRepository
+from champyons.adapters.persistence.sqlalchemy.repositories.geonames_registry_repository import SqlAlchemyGeonamesRegistry
+from champyons.adapters.persistence.sqlalchemy.repositories.region_repository import SqlAlchemyRegionRepository
+from champyons.core.application.use_cases.geography.get_by_geonames_id import GetGeographicByGeonamesId
+from champyons.core.domain.enums.geography import GeographyType
+
+
+@pytest.fixture()
+def geography(db_session):
+    europe = Continent(code="EU", default_name="Europe", geonames_id=6255148)
+    iberia = Region(default_name="Iberia", geonames_id=100)
+    spain = Country(code="ES", default_name="Spain", geonames_id=2510769, continent=europe, regions=[iberia])
+    db_session.add_all([europe, iberia, spain])
+    db_session.flush()
+    # a city-state: country and city share the geonames id
+    madrid_region = LocalRegion(default_name="Madrid", country_id=spain.id, geonames_id=3117732)
+    db_session.add(madrid_region)
+    db_session.flush()
+    db_session.add(City(default_name="Madrid", country_id=spain.id, local_region_id=madrid_region.id, geonames_id=2510769))
+    db_session.commit()
+    return {"europe": europe.id, "iberia": iberia.id, "spain": spain.id}
+
+
+def test_resolve_many_is_one_query(db_session, geography, query_counter):
+    resolved = SqlAlchemyGeonamesRegistry(db_session).resolve_many([6255148, 100, 3117732, 2510769, 42, 100])
+    assert len(query_counter) == 1
+    assert {i: ref.geography_type for i, ref in resolved.items()} == {
+        6255148: GeographyType.CONTINENT,
+        100: GeographyType.REGION,
+        3117732: GeographyType.LOCAL_REGION,
+        2510769: GeographyType.CITY,
+    }
+    assert resolved[100].entity_id == geography["iberia"]
+
+
+def test_registry_follows_updates_and_deletes(db_session, geography):
+    registry = SqlAlchemyGeonamesRegistry(db_session)
+    iberia = db_session.get(Region, geography["iberia"])
+    iberia.geonames_id = 200
+    db_session.commit()
+    assert registry.resolve(100) is None
+    assert registry.resolve(200).entity_id == iberia.id
+
+    db_session.delete(iberia)
+    db_session.commit()
+    assert registry.resolve(200) is None
+
+
+def test_rebuild_after_bulk_insert(db_session, geography):
+    db_session.execute(sa.insert(Region.__table__), [{"default_name": f"Bulk {i}", "geonames_id": 1000 + i} for i in range(5)])
+    registry = SqlAlchemyGeonamesRegistry(db_session)
+    assert registry.resolve_many(range(1000, 1005)) == {}
+    assert registry.rebuild() == 10
+    assert len(registry.resolve_many(range(1000, 1005))) == 5
+
+
+def test_use_case_fetches_from_the_right_repository(db_session, geography):
+    use_case = GetGeographicByGeonamesId(
+        SqlAlchemyGeonamesRegistry(db_session),
+        continent_repo=SqlAlchemyContinentRepository(db_session),
+        region_repo=SqlAlchemyRegionRepository(db_session),
+        country_repo=SqlAlchemyCountryRepository(db_session),
+        local_region_repo=None,
+        city_repo=None,
+    )
+    assert use_case.execute(6255148).code == "EU"
+    assert use_case.execute(100).name == "Iberia"
+    assert use_case.execute(42) is None
@@ -0,0 +1,106 @@
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from champyons.adapters.persistence.sqlalchemy.models.continent import Continent
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.region import Region
+from champyons.adapters.persistence.sqlalchemy.repositories.country_repository import SqlAlchemyCountryRepository
+from champyons.adapters.persistence.sqlalchemy.repositories.continent_repository import SqlAlchemyContinentRepository
+from champyons.core.ports.repositories.load_plan import LoadPlan, NO_RELATIONS
+
+
+@pytest.fixture()
+def world(db_session):
+    continents = [Continent(code=f"C{i}", default_name=f"Continent {i}") for i in range(5)]
+    regions = [Region(default_name=f"Region {i}") for i in range(10)]
+    db_session.add_all(continents + regions)
+    db_session.flush()
+    countries = []
+    for i in range(250):
+        country = Country(code=f"K{i:03}", default_name=f"Country {i}", continent=continents[i % 5], regions=[regions[i % 10], regions[(i + 1) % 10]])
+        if i >= 200:
+            country.parent = countries[i - 200]
+        countries.append(country)
+    db_session.add_all(countries)
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def test_load_plan_paths():
+    plan = LoadPlan.of("continent", "children.regions", "children.parent")
+    assert "continent" in plan and "regions" not in plan
+    assert [name for name, _ in plan.get("children")] == ["regions", "parent"]
+    assert plan.depth == 2 and NO_RELATIONS.depth == 0
+    with pytest.raises(ValueError):
+        LoadPlan.of("children..regions")
+
+
+def test_listing_countries_uses_fixed_number_of_queries(db_session, world, query_counter):
+    countries = SqlAlchemyCountryRepository(db_session).get_all()
+    # countries + continent and parent joined, then one IN query per collection (regions, children)
+    assert len(countries) == 250
+    assert len(query_counter) == 3
+    spain = countries[0]
+    assert spain.continent.code == "C0"
+    assert len(spain.regions) == 2 and len(spain.children) == 1
+
+
+def test_relations_outside_the_plan_are_not_loaded(db_session, world, query_counter):
+    countries = SqlAlchemyCountryRepository(db_session).get_all(plan=NO_RELATIONS)
+    assert len(query_counter) == 1
+    assert countries[0].continent is None and countries[0].regions == []
+
+
+def test_nested_plans(db_session, world, query_counter):
+    continents = SqlAlchemyContinentRepository(db_session).get_all(plan=LoadPlan.of("countries.regions"))
+    assert len(query_counter) == 3
+    assert sum(len(c.countries) for c in continents) == 250
+    assert all(len(country.regions) == 2 for c in continents for country in c.countries)
+
+
+def test_unknown_relation(db_session, world):
+    with pytest.raises(ValueError):
+        SqlAlchemyCountryRepository(db_session).get_all(plan=LoadPlan.of("clubs"))
+
+
+def test_entities_are_shared_within_a_unit_of_work(db_session, world):
+    repository = SqlAlchemyCountryRepository(db_session)
+    countries = repository.get_all(plan=LoadPlan.of("continent", "regions"))
+    assert len({id(c.continent) for c in countries}) == 5
+    assert len({id(r) for c in countries for r in c.regions}) == 10
+
+    # a later read returns the same objects, and fills in the relations its plan adds
+    spain = repository.get_by_id(countries[0].id, plan=LoadPlan.of("children"))
+    assert spain is countries[0]
+    assert spain.continent is countries[5].continent and len(spain.children) == 1
+    assert SqlAlchemyContinentRepository(db_session).get_by_id(spain.continent_id, plan=NO_RELATIONS) is spain.continent
+
+
+def test_entities_are_not_shared_across_units_of_work(db_session, world):
+    repository = SqlAlchemyCountryRepository(db_session)
+    before = repository.get_all(plan=NO_RELATIONS)[0]
+    db_session.commit()
+    after = repository.get_by_id(before.id, plan=NO_RELATIONS)
+    assert after is not before and after == before
+
+
+def test_entities_are_not_shared_after_the_session_is_closed(engine, db_session, world):
+    repository = SqlAlchemyCountryRepository(db_session)
+    before = repository.get_by_code("K000", plan=NO_RELATIONS)
+    db_session.close()
+
+    with sessionmaker(bind=engine)() as other:
+        other.execute(update(Country).where(Country.code == "K000").values(default_name="Renamed"))
+        other.commit()
+
+    after = repository.get_by_code("K000", plan=NO_RELATIONS)
+    assert after is not before and after.name == "Renamed"
+
+
+def test_entities_are_shared_across_savepoints(db_session, world):
+    repository = SqlAlchemyCountryRepository(db_session)
+    before = repository.get_by_code("K000", plan=NO_RELATIONS)
+    with db_session.begin_nested():
+        pass
+    assert repository.get_by_code("K000", plan=NO_RELATIONS) is before
@@ -0,0 +1,73 @@
+import pytest
+
+from champyons.adapters.persistence.sqlalchemy.repositories.player_profile_repository import SqlAlchemyPlayerProfileRepository
+from champyons.core.domain.entities.people.player_profile import PlayerProfile
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+from champyons.core.ports.repositories.player_profile import PlayerProfileSearch
+
+POSITIONS = [PositionSet.from_positions(["ST"]), PositionSet.from_positions(["CB"]), PositionSet.from_positions(["LB", "LM"])]
+
+
+def _profile(i: int) -> PlayerProfile:
+    return PlayerProfile(
+        person_id=i,
+        skills=PlayerSkills(shooting=i % 21, passing=(i * 7) % 21, stamina=(i * 3) % 21),
+        positions=POSITIONS[i % 3],
+        active=i % 10 != 9,
+    )
+
+
+@pytest.fixture()
+def repository(db_session):
+    repository = SqlAlchemyPlayerProfileRepository(db_session)
+    for i in range(1, 61):
+        repository.save(_profile(i))
+    db_session.expunge_all()
+    return repository
+
+
+def _matching(predicate):
+    return sorted(i for i in range(1, 61) if i % 10 != 9 and predicate(_profile(i)))
+
+
+def test_save_round_trips_skill_columns_and_positions(repository):
+    profile = repository.get_by_person_id(8)
+    assert profile.skills == PlayerSkills(shooting=8, passing=14, stamina=3)
+    assert profile.positions == POSITIONS[2]
+
+
+def test_search_min_and_max_skills(repository):
+    found = repository.search(PlayerProfileSearch(min_skills={"shooting": 15}, max_skills={"passing": 10}))
+    assert [p.person_id for p in found] == _matching(lambda p: p.skills.shooting >= 15 and p.skills.passing <= 10)
+    assert found
+
+
+def test_search_positions_intersect(repository):
+    wide = PositionSet.from_positions(["LM", "RM"])
+    found = repository.search(PlayerProfileSearch(positions=wide))
+    assert [p.person_id for p in found] == _matching(lambda p: p.positions.intersects(wide))
+    assert all(p.positions == POSITIONS[2] for p in found)
+
+
+def test_search_inactive_profiles_on_request(repository):
+    query = PlayerProfileSearch(min_skills={"shooting": 19})
+    assert [p.person_id for p in repository.search(query)] == [20, 40, 41]
+    found = repository.search(PlayerProfileSearch(min_skills={"shooting": 19}, active_only=False))
+    assert [p.person_id for p in found] == [19, 20, 40, 41]
+
+
+def test_search_orders_by_weighted_score_and_limits(repository):
+    weights = {"shooting": 0.7, "stamina": 0.3}
+    found = repository.search(PlayerProfileSearch(positions=POSITIONS[0], order_by_weights=weights, limit=5))
+
+    candidates = [_profile(i) for i in _matching(lambda p: p.positions == POSITIONS[0])]
+    score = lambda p: sum(getattr(p.skills, skill) * weight for skill, weight in weights.items())
+    expected = sorted(candidates, key=lambda p: (-score(p), p.person_id))[:5]
+    assert [p.person_id for p in found] == [p.person_id for p in expected]
+
+
+def test_search_builds_a_single_statement(repository, query_counter):
+    repository.search(PlayerProfileSearch(min_skills={"passing": 5}, positions=POSITIONS[1], order_by_weights={"passing": 1.0}, limit=3))
+    assert len(query_counter) == 1
+    assert "LIMIT" in query_counter[0] and "ORDER BY" in query_counter[0]
@@ -0,0 +1,47 @@
+import sqlalchemy as sa
+
+from champyons.adapters.persistence.sqlalchemy.models.player import PlayerProfile
+from champyons.core.domain.enums.player_positions import Position
+from champyons.core.domain.value_objects.player.player_positions import POSITION_BITS, PositionSet
+
+
+def _add(db_session, person_id, positions):
+    db_session.add(PlayerProfile(person_id=person_id, positions=positions))
+
+
+def test_positions_are_stored_as_an_integer_mask(db_session):
+    _add(db_session, 1, PositionSet.from_positions(["LB", "LM"]))
+    _add(db_session, 2, ["ST", Position.AM]) # any iterable of positions or codes
+    _add(db_session, 3, POSITION_BITS[Position.GK]) # a raw mask
+    _add(db_session, 4, None)
+    db_session.commit()
+
+    masks = dict(db_session.execute(sa.text("SELECT person_id, positions FROM player_profile")).all())
+    assert masks == {
+        1: POSITION_BITS[Position.LB] | POSITION_BITS[Position.LM],
+        2: POSITION_BITS[Position.ST] | POSITION_BITS[Position.AM],
+        3: POSITION_BITS[Position.GK],
+        4: 0,
+    }
+
+    db_session.expunge_all()
+    loaded = {p.person_id: p.positions for p in db_session.scalars(sa.select(PlayerProfile))}
+    assert loaded[1] == PositionSet.from_positions(["LB", "LM"])
+    assert loaded[2].to_codes() == ["AM", "ST"]
+    assert loaded[4] == PositionSet()
+
+
+def test_can_play_and_intersects_run_in_sql(db_session):
+    for person_id, codes in enumerate([["LB", "LM"], ["ST"], ["CB", "LB"], ["GK"]], start=1):
+        _add(db_session, person_id, codes)
+    db_session.commit()
+
+    def person_ids(condition):
+        return db_session.scalars(sa.select(PlayerProfile.person_id).where(condition).order_by(PlayerProfile.person_id)).all()
+
+    assert person_ids(PlayerProfile.positions.can_play(Position.LB)) == [1, 3]
+    assert person_ids(PlayerProfile.positions.can_play("GK")) == [4]
+    assert person_ids(PlayerProfile.positions.intersects(PositionSet.from_positions(["ST", "CB"]))) == [2, 3]
+    assert person_ids(PlayerProfile.positions.intersects(PositionSet())) == []
+    compiled = str(sa.select(PlayerProfile).where(PlayerProfile.positions.can_play("LB")))
+    assert "(player_profile.positions & :param_1) != :param_2" in compiled
@@ -0,0 +1,94 @@
+import gc
+import weakref
+
+import pytest
+
+from champyons.adapters.persistence.sqlalchemy.models.continent import Continent
+from champyons.adapters.persistence.sqlalchemy.models.country import Country
+from champyons.adapters.persistence.sqlalchemy.models.player import PlayerProfile
+from champyons.adapters.persistence.sqlalchemy.repositories.country_repository import SqlAlchemyCountryRepository
+from champyons.adapters.persistence.sqlalchemy.repositories.player_profile_repository import SqlAlchemyPlayerProfileRepository
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+
+
+@pytest.fixture()
+def countries(db_session):
+    continents = [Continent(code=f"C{i}", default_name=f"Continent {i}") for i in range(4)]
+    db_session.add_all(continents)
+    db_session.add_all(
+        Country(code=f"K{i:04}", default_name=f"Country {i}", continent=continents[i % 4]) for i in range(1000)
+    )
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def test_iter_all_streams_every_entity_in_one_query(db_session, countries, query_counter):
+    streamed = SqlAlchemyCountryRepository(db_session).iter_all(batch_size=64)
+    ids = [country.id for country in streamed]
+    assert ids == sorted(ids) and len(ids) == 1000
+    assert len(query_counter) == 1
+    assert SqlAlchemyCountryRepository(db_session).get_all()[0].continent is not None
+
+
+def test_iter_all_does_not_keep_models(db_session, countries):
+    repository = SqlAlchemyCountryRepository(db_session)
+    iterator = repository.iter_all(batch_size=10)
+    next(iterator)
+    first = weakref.ref(next(iter(db_session.identity_map.values())))
+    for _ in range(100):
+        next(iterator)
+    gc.collect()
+    assert first() is None
+    assert len(db_session.identity_map) <= 20
+
+
+def test_iter_all_filters(db_session, countries):
+    repository = SqlAlchemyCountryRepository(db_session)
+    assert len(list(repository.iter_all(where={"continent_id": 1}))) == 250
+    assert [c.code for c in repository.iter_all(where={"name": "Country 7"})] == ["K0007"]
+    assert list(repository.iter_all(where={"parent_id": None, "code": "nope"})) == []
+    with pytest.raises(ValueError):
+        list(repository.iter_all(where={"continent": 1}))
+    with pytest.raises(ValueError):
+        list(repository.iter_all(batch_size=0))
+
+
+def test_keyset_pages_cover_the_table_once(db_session, countries, query_counter):
+    repository = SqlAlchemyCountryRepository(db_session)
+    seen, after_id = [], None
+    while page := repository.page(after_id=after_id, limit=300, where={"active": True}):
+        seen.extend(c.id for c in page)
+        after_id = page[-1].id
+    assert len(seen) == len(set(seen)) == 1000
+    assert len(query_counter) == 5
+    assert "country.id > ?" in query_counter[-1]
+
+
+@pytest.fixture()
+def player_profiles(db_session):
+    db_session.add_all(
+        PlayerProfile(person_id=i, shooting=i % 21, positions=PositionSet.from_positions(["ST"]), active=i % 4 != 0)
+        for i in range(1, 2001)
+    )
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def test_iter_all_streams_player_profiles(db_session, player_profiles, query_counter):
+    repository = SqlAlchemyPlayerProfileRepository(db_session)
+    person_ids = [profile.person_id for profile in repository.iter_all(batch_size=128)]
+    assert person_ids == list(range(1, 2001))
+    assert len(query_counter) == 1
+    assert sum(1 for _ in repository.iter_all(where={"active": False})) == 500
+
+
+def test_keyset_pages_of_player_profiles(db_session, player_profiles, query_counter):
+    repository = SqlAlchemyPlayerProfileRepository(db_session)
+    seen, after_id = [], None
+    while page := repository.page(after_id=after_id, limit=600, where={"shooting": 20}):
+        assert all(profile.skills.shooting == 20 for profile in page)
+        seen.extend(profile.id for profile in page)
+        after_id = page[-1].id
+    assert seen == sorted(seen) and len(seen) == len(set(seen)) == len([i for i in range(1, 2001) if i % 21 == 20])
+    assert "player_profile.id > ?" not in query_counter[0]
+    assert "player_profile.id > ?" in query_counter[-1]
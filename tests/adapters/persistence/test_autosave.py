@@ -0,0 +1,166 @@
+from dataclasses import FrozenInstanceError, replace
+from datetime import date
+import pickle
+
+import pytest
+
+from champyons.adapters.persistence.snapshot import Autosave, ChangeJournal, ChangeOp, JournalChange, SnapshotReader
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.geography import City, Region
+from champyons.core.domain.entities.people import PlayerProfile
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+
+def test_dirty_tracking_starts_when_marked_clean():
+    profile = PlayerProfile(id=1)
+    assert profile.is_dirty and not profile.is_tracked
+
+    touched = []
+    profile.mark_clean(touched.append)
+    assert not profile.is_dirty
+
+    profile.skills = PlayerSkills(passing=15)
+    profile.active = False
+    assert profile.dirty_fields == {"skills", "active"}
+    assert touched == [profile] # notified once, on the first change
+
+
+def test_in_place_list_changes_mark_the_field():
+    region = Region(id=2, name="Iberia")
+    other = Region(id=3, name="Mediterranean")
+    region.mark_clean()
+    region.countries.append(object())
+    assert region.dirty_fields == {"countries"}
+
+    other.mark_clean()
+    other.countries = region.countries # a list tracked for another entity
+    other.mark_clean()
+    other.countries.pop()
+    assert other.dirty_fields == {"countries"} and region.dirty_fields == {"countries"}
+    assert type(pickle.loads(pickle.dumps(region.countries))) is list
+
+
+def test_skills_are_replaced_not_mutated():
+    profile = PlayerProfile(id=1)
+    profile.mark_clean()
+    with pytest.raises(FrozenInstanceError):
+        profile.skills.shooting = 20
+    profile.skills = replace(profile.skills, shooting=20)
+    assert profile.dirty_fields == {"skills"}
+
+
+def test_journal_drops_torn_tail(tmp_path):
+    path = tmp_path / "j"
+    journal = ChangeJournal(path)
+    journal.append(date(2025, 8, 1), [JournalChange("city", ChangeOp.DELETE, 1)])
+    journal.append(date(2025, 8, 2), [JournalChange("city", ChangeOp.DELETE, 2)])
+    with open(path, "r+b") as f:
+        f.truncate(path.stat().st_size - 3)
+
+    reopened = ChangeJournal(path)
+    assert len(reopened) == 1
+    assert [r.day for r in reopened.records()] == [date(2025, 8, 1)]
+
+
+def test_save_day_journals_only_changes(tmp_path, game_data):
+    autosave = Autosave(tmp_path, compact_every=10, chunk_rows=32)
+    data = game_data
+    autosave.save_full(data)
+    assert autosave.save_day(date(2025, 8, 1)) == 0
+
+    data.player_profiles[4].skills = PlayerSkills(passing=20)
+    data.game_state.sim_date = date(2025, 8, 2)
+    city = City(id=2, name="Lugo", country_id=1)
+    data.cities.append(city)
+    autosave.add(city)
+    autosave.remove(data.player_profiles.pop(0))
+    assert autosave.save_day(date(2025, 8, 2)) == 4
+    assert len(autosave.journal) == 2
+
+    loaded = Autosave(tmp_path).load()
+    assert loaded.game_state.sim_date == date(2025, 8, 2)
+    assert [c.name for c in loaded.cities] == ["Vigo", "Lugo"]
+    assert len(loaded.player_profiles) == 99
+    assert next(p for p in loaded.player_profiles if p.id == 5).skills.passing == 20
+    assert not (tmp_path / Autosave.JOURNAL_NAME).exists()
+
+
+def test_save_day_journals_nested_changes(tmp_path, game_data):
+    autosave = Autosave(tmp_path, compact_every=10)
+    data = game_data
+    autosave.save_full(data)
+
+    iberia = Region(id=2, name="Iberia")
+    data.regions.append(iberia)
+    autosave.add(iberia)
+    data.countries[0].regions.append(iberia)
+    data.nationalities[0].foreign_nationalities_id.extend([7, 8])
+    data.seasons[0].competition_editions_ids.append(3)
+    data.player_profiles[1].skills = replace(data.player_profiles[1].skills, shooting=19)
+    assert autosave.save_day(date(2025, 8, 1)) == 5
+
+    data.countries[0].regions.remove(iberia) # tracking goes on after a save
+    assert autosave.pending == 1
+    assert autosave.save_day(date(2025, 8, 2)) == 1
+
+    loaded = Autosave(tmp_path).load()
+    assert [r.id for r in loaded.countries[0].regions] == [1]
+    assert loaded.nationalities[0].foreign_nationalities_id == [7, 8]
+    assert loaded.seasons[0].competition_editions_ids == [3]
+    assert next(p for p in loaded.player_profiles if p.id == 2).skills.shooting == 19
+
+
+def test_journal_is_compacted_periodically(tmp_path, game_data):
+    autosave = Autosave(tmp_path, compact_every=3)
+    data = game_data
+    autosave.save_full(data)
+    for day in range(1, 4):
+        data.game_state.sim_date = date(2025, 8, day)
+        autosave.save_day(data.game_state.sim_date)
+    assert len(autosave.journal) == 0
+
+    loaded = Autosave(tmp_path).load()
+    assert loaded.game_state.sim_date == date(2025, 8, 3)
+
+
+def test_game_state_without_id_is_journaled(tmp_path, game_data):
+    autosave = Autosave(tmp_path, compact_every=2)
+    data = replace(game_data, game_state=GameState(sim_date=date(2025, 8, 1), start_sim_date=date(2025, 7, 1)))
+    autosave.save_full(data)
+
+    data.game_state.sim_date = date(2025, 8, 2)
+    assert autosave.save_day(data.game_state.sim_date) == 1
+    data.game_state.sim_date = date(2025, 8, 3)
+    autosave.save_day(data.game_state.sim_date) # compacts
+
+    loaded = Autosave(tmp_path).load()
+    assert loaded.game_state.id is None
+    assert loaded.game_state.sim_date == date(2025, 8, 3)
+
+
+def test_compaction_copies_unchanged_tables_as_stored(tmp_path, game_data):
+    def stored_chunks(name):
+        with SnapshotReader(tmp_path / Autosave.SNAPSHOT_NAME) as reader:
+            table = reader.table(name)
+            blobs = [reader._read_raw(entry["values"]) for chunk in table._chunks for entry in chunk["columns"].values()]
+            return blobs, {c.name: list(table.column(c.name)) for c in table.columns}
+
+    autosave = Autosave(tmp_path, chunk_rows=32)
+    autosave.save_full(game_data)
+    before = stored_chunks("player_profile")
+
+    game_data.game_state.sim_date = date(2025, 8, 2)
+    autosave.save_day(game_data.game_state.sim_date)
+    autosave.compact()
+
+    assert stored_chunks("player_profile") == before
+    assert Autosave(tmp_path).load().game_state.sim_date == date(2025, 8, 2)
+
+
+def test_save_day_requires_paused_game(tmp_path, game_data):
+    autosave = Autosave(tmp_path)
+    data = game_data
+    autosave.save_full(data)
+    data.game_state.is_simulation_running = True
+    with pytest.raises(ValueError):
+        autosave.save_day(date(2025, 8, 1))
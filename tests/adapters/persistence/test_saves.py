@@ -0,0 +1,89 @@
+import json
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+
+from champyons.adapters.persistence.sqlalchemy.engine import create_sqlite_engine
+from champyons.adapters.persistence.sqlalchemy.saves import SaveManager
+
+
+@pytest.fixture
+def game_db(tmp_path):
+    path = tmp_path / "game.db"
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE city (id INTEGER PRIMARY KEY, name TEXT, population INTEGER)")
+        connection.executemany("INSERT INTO city VALUES (?, ?, ?)", [(i, f"City {i}", i * 1000) for i in range(1, 1001)])
+        connection.execute("CREATE TABLE country (id INTEGER PRIMARY KEY, name TEXT)")
+        connection.execute("INSERT INTO country VALUES (1, 'Spain')")
+    connection.close()
+    return path
+
+
+def test_fork_from_engine_and_branch(tmp_path, game_db):
+    saves = SaveManager(tmp_path / "saves", pages_per_step=2)
+    steps = []
+    base = saves.fork("base", source=create_sqlite_engine(game_db), progress=lambda remaining, total: steps.append(remaining))
+    branch = saves.fork("what-if", source="base")
+
+    assert base.parent is None and branch.parent == "base"
+    assert len(steps) > 1 and steps[-1] == 0 # copied in several steps
+    assert [b.name for b in saves.list()] == ["base", "what-if"]
+    with saves.engine("what-if").connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM city")).scalar() == 1000
+
+    with pytest.raises(ValueError):
+        saves.fork("base", source="what-if")
+
+
+def test_branch_metadata_stays_out_of_game_databases(tmp_path, game_db):
+    saves = SaveManager(tmp_path / "saves")
+    saves.fork("base", source=game_db)
+    saves.fork("what-if", source="base")
+
+    connection = sqlite3.connect(saves.path("what-if"))
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    connection.close()
+    assert tables == {"city", "country"}
+
+    reopened = SaveManager(tmp_path / "saves")
+    assert reopened.get("what-if").parent == "base" and reopened.get("what-if").forked_at is not None
+    reopened.delete("base")
+    assert set(json.loads(reopened.index_path.read_text())) == {"what-if"}
+    assert [b.name for b in reopened.list()] == ["what-if"]
+
+    (tmp_path / "saves" / "copied.db").write_bytes(saves.path("what-if").read_bytes()) # not forked by us
+    assert reopened.get("copied").parent is None and reopened.get("copied").forked_at is None
+
+
+def test_diff_counts_changed_rows_per_table(tmp_path, game_db):
+    saves = SaveManager(tmp_path / "saves")
+    saves.fork("a", source=game_db)
+    saves.fork("b", source="a")
+    connection = sqlite3.connect(saves.path("b"))
+    with connection:
+        connection.execute("UPDATE city SET population = 0 WHERE id <= 10")
+        connection.execute("DELETE FROM city WHERE id = 1000")
+        connection.execute("CREATE TABLE club (id INTEGER PRIMARY KEY)")
+    connection.close()
+
+    diffs = {d.table: d for d in saves.diff("a", "b")}
+    assert (diffs["city"].removed, diffs["city"].added) == (11, 10)
+    assert not diffs["country"].changed
+    assert diffs["club"].schema_changed and diffs["club"].rows_a == 0
+
+
+def test_sources_and_branches_must_exist(tmp_path, game_db):
+    saves = SaveManager(tmp_path / "saves")
+    saves.fork("a", source=game_db)
+
+    with pytest.raises(ValueError, match="pass database files as a Path"):
+        saves.fork("b", source=str(game_db))
+    with pytest.raises(ValueError, match="Save missing does not exist"):
+        saves.fork("b", source="missing")
+    with pytest.raises(ValueError, match="does not exist"):
+        saves.fork("b", source=tmp_path / "missing.db")
+    with pytest.raises(ValueError, match="Save missing does not exist"):
+        saves.diff("a", "missing")
+    assert [b.name for b in saves.list()] == ["a"]
@@ -0,0 +1,119 @@
+from datetime import date, datetime, UTC
+
+import numpy as np
+import pytest
+
+from champyons.adapters.persistence.snapshot import (
+    Column, ColumnKind, GameSnapshot, GameSnapshotData, SnapshotFormatError, SnapshotReader, SnapshotWriter, write_game_snapshot,
+)
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.entities.geography import City, Continent, Country, LocalRegion, Nationality, Region
+from champyons.core.domain.entities.people import PlayerProfile
+from champyons.core.domain.enums.city import CityPopulationRange
+from champyons.core.domain.enums.nationality import NationalityEntityType
+from champyons.core.domain.enums.region import RegionTypeEnum
+from champyons.core.domain.value_objects.football.federation_rules import FederationRules
+from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+
+def test_table_round_trip_with_nulls_and_chunks(tmp_path):
+    path = tmp_path / "table.snap"
+    columns = [Column(n, k) for n, k in (
+        ("id", ColumnKind.INT), ("rating", ColumnKind.FLOAT), ("name", ColumnKind.STR),
+        ("born", ColumnKind.DATE), ("seen", ColumnKind.DATETIME), ("extra", ColumnKind.JSON), ("ok", ColumnKind.BOOL),
+    )]
+    data = {
+        "id": list(range(10)),
+        "rating": [i / 2 for i in range(10)],
+        "name": [f"nombre {i}" if i % 3 else None for i in range(10)],
+        "born": [date(2000, 1, 1 + i) for i in range(10)],
+        "seen": [datetime(2024, 5, 1, i, tzinfo=UTC) for i in range(10)],
+        "extra": [{"k": i} if i % 2 else None for i in range(10)],
+        "ok": [i % 2 == 0 for i in range(10)],
+    }
+    with SnapshotWriter(path, metadata={"v": 1}, chunk_rows=4) as writer:
+        writer.add_table("t", columns, data)
+
+    with SnapshotReader(path) as reader:
+        table = reader.table("t")
+        assert reader.metadata == {"v": 1}
+        assert table.chunk_count == 3 and len(table) == 10
+        assert isinstance(table.column("id"), np.ndarray)
+        assert [row for row in table.rows()] == [dict(zip(data, values)) for values in zip(*data.values())]
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "other.snap"
+    path.write_bytes(b"not a snapshot at all, definitely not")
+    with pytest.raises(SnapshotFormatError):
+        SnapshotReader(path)
+
+
+def _game() -> GameSnapshotData:
+    continent = Continent(id=1, code="EU", name="Europe")
+    region = Region(id=1, name="European Union", type=RegionTypeEnum(1))
+    spain = Country(id=1, name="Spain", code="ES", continent_id=1)
+    spain.regions.append(region)
+    galicia = LocalRegion(id=1, name="Galicia", code="GA", country_id=1)
+    city = City(
+        id=1, name="Vigo", population_range=CityPopulationRange(list(CityPopulationRange)[0]),
+        latitude=42.24, longitude=-8.72, country_id=1, local_region_id=1,
+    )
+    nationality = Nationality(
+        id=1, entity_type=NationalityEntityType.COUNTRY, entity_id=1, entity=spain, federation_rules=FederationRules(time_offset=1),
+    )
+    season = Season(
+        id=1, start_date=date(2025, 7, 1), end_date=date(2026, 6, 30),
+        default_transfer_window_1=TransferWindow(date(2025, 7, 1), date(2025, 9, 1)),
+    )
+    profiles = [
+        PlayerProfile(id=i, person_id=i, skills=PlayerSkills(passing=float(i % 20 + 1)), positions=PositionSet.from_positions(["ST"]))
+        for i in range(1, 101)
+    ]
+    return GameSnapshotData(
+        game_state=GameState(id=1, sim_date=date(2025, 8, 1), start_sim_date=date(2025, 7, 1), current_season_id=1),
+        seasons=[season], continents=[continent], regions=[region], countries=[spain],
+        local_regions=[galicia], cities=[city], nationalities=[nationality], player_profiles=profiles,
+    )
+
+
+def test_game_snapshot_round_trip(tmp_path):
+    path = tmp_path / "save.snap"
+    data = _game()
+    write_game_snapshot(path, data, chunk_rows=32)
+
+    with GameSnapshot(path) as snapshot:
+        loaded = snapshot.load()
+        assert snapshot.sim_date == date(2025, 8, 1)
+
+    assert loaded.game_state.sim_date == data.game_state.sim_date
+    assert loaded.seasons[0].default_transfer_window_1 == data.seasons[0].default_transfer_window_1
+    assert loaded.countries[0].regions[0].name == "European Union"
+    assert loaded.cities[0].latitude == pytest.approx(42.24)
+    assert loaded.nationalities[0].entity is loaded.countries[0]
+    assert loaded.nationalities[0].federation_rules == data.nationalities[0].federation_rules
+    assert [p.skills for p in loaded.player_profiles] == [p.skills for p in data.player_profiles]
+    assert loaded.player_profiles[0].positions == data.player_profiles[0].positions
+
+
+def test_game_snapshot_columns_are_lazy(tmp_path):
+    path = tmp_path / "save.snap"
+    write_game_snapshot(path, _game(), chunk_rows=32)
+
+    with GameSnapshot(path) as snapshot:
+        table = snapshot.table("player_profile")
+        passing = table.column("passing")
+        assert table.chunk_count == 4
+        assert set(key[0] for key in table._cache) == {"passing"}
+        assert passing.mean() == pytest.approx(np.mean([i % 20 + 1 for i in range(1, 101)]))
+
+
+def test_snapshot_requires_paused_game(tmp_path):
+    data = _game()
+    data.game_state.is_simulation_running = True
+    with pytest.raises(ValueError):
+        write_game_snapshot(tmp_path / "save.snap", data)
+    assert not (tmp_path / "save.snap").exists()
@@ -0,0 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from champyons.core.application.services.season_forecast import ForecastProblem, SeasonForecaster
+from champyons.core.domain.entities.matches import Fixture, Match
+from champyons.core.domain.services.fixtures import round_robin_pattern
+from champyons.core.domain.services.standings import GroupStandings
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+TEAMS = [10, 20, 30, 40]
+
+
+def _problem(played_matches=(), strengths=None):
+    standings = GroupStandings(TEAMS)
+    standings.apply_many(played_matches)
+    fixtures = [Fixture(home_team_id=TEAMS[h], away_team_id=TEAMS[a]) for h, a in round_robin_pattern(4).reshape(-1, 2).tolist()]
+    played = {(m.home_team_id, m.away_team_id) for m in played_matches}
+    remaining = [f for f in fixtures if (f.home_team_id, f.away_team_id) not in played]
+    return ForecastProblem.from_standings(standings, remaining, strengths or {})
+
+
+def test_probabilities_sum_to_one_and_favour_stronger_team():
+    strengths = {10: TeamStrength(18, 18), 20: TeamStrength(8, 8), 30: TeamStrength(8, 8), 40: TeamStrength(8, 8)}
+    forecast = SeasonForecaster(max_simulations=20_000, min_simulations=20_000).forecast(_problem(strengths=strengths))
+
+    assert np.allclose(forecast.probabilities.sum(axis=0), 1)
+    assert np.allclose(forecast.probabilities.sum(axis=1), 1)
+    assert forecast.most_likely_positions(10, count=1) == [1]
+    assert forecast.expected_position(10) < forecast.expected_position(20)
+
+
+def test_finished_season_is_certain():
+    matches = [Match(home_team_id=TEAMS[h], away_team_id=TEAMS[a], home_goals=int(h < a), away_goals=0) for h, a in round_robin_pattern(4).reshape(-1, 2).tolist()]
+    forecast = SeasonForecaster(batch_size=100, max_simulations=1_000, min_simulations=100).forecast(_problem(matches))
+
+    assert forecast.converged
+    assert forecast.position_probabilities(10) == {1: 1.0}
+
+
+def test_results_only_depend_on_seed():
+    problem = _problem()
+    forecaster = SeasonForecaster(workers=2, batch_size=500, max_simulations=4_000, min_simulations=4_000, seed=5)
+
+    sequential = SeasonForecaster(batch_size=500, max_simulations=4_000, min_simulations=4_000, seed=5).forecast(problem)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = forecaster.forecast(problem, executor=pool)
+
+    assert np.array_equal(sequential.probabilities, parallel.probabilities)
+
+
+def test_early_stop_does_not_depend_on_workers():
+    problem = _problem()
+    settings = dict(batch_size=250, max_simulations=40_000, min_simulations=1_000, tolerance=0.02, check_every=2, seed=3)
+
+    sequential = SeasonForecaster(workers=1, **settings).forecast(problem)
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        two = SeasonForecaster(workers=2, **settings).forecast(problem, executor=pool)
+        three = SeasonForecaster(workers=3, **settings).forecast(problem, executor=pool)
+
+    assert sequential.converged and sequential.simulations < settings["max_simulations"]
+    for parallel in (two, three):
+        assert parallel.simulations == sequential.simulations
+        assert np.array_equal(parallel.probabilities, sequential.probabilities)
@@ -0,0 +1,54 @@
+from datetime import date
+
+from champyons.core.application.services.sharded_simulation import ShardedSimulation, plan_shards
+from champyons.core.application.services.simulation_scheduler import SimulationScheduler
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+
+DAY = date(2025, 8, 16)
+
+
+def _world():
+    """ Three nations (editions 1-3) with 4 domestic fixtures each, plus a continental cup (edition 10) """
+    fixtures, nationality_by_edition = [], {10: None}
+    for nation in range(1, 4):
+        nationality_by_edition[nation] = nation
+        teams = [nation * 100 + i for i in range(8)]
+        fixtures += [Fixture(id=nation * 10 + i, edition_id=nation, home_team_id=teams[2 * i], away_team_id=teams[2 * i + 1], match_date=DAY) for i in range(4)]
+    fixtures.append(Fixture(id=99, edition_id=10, home_team_id=100, away_team_id=300, match_date=DAY))
+    strengths = {t: TeamStrength(attack=10 + t % 7, defense=10 - t % 5) for f in fixtures for t in (f.home_team_id, f.away_team_id)}
+    return fixtures, nationality_by_edition, strengths
+
+
+def _scores(result):
+    return [(m.fixture_id, m.home_goals, m.away_goals, [(e.minute, e.team_id) for e in m.events]) for m in result.matches]
+
+
+def test_plan_shards_balances_load():
+    shards = plan_shards({1: 10, 2: 8, 3: 5, 4: 4, 5: 1}, 2)
+    assert sorted(sum({1: 10, 2: 8, 3: 5, 4: 4, 5: 1}[n] for n in s) for s in shards) == [14, 14]
+    assert plan_shards({1: 3}, 4) == [[1]]
+
+
+def test_results_do_not_depend_on_workers():
+    fixtures, nationality_by_edition, strengths = _world()
+    inline = ShardedSimulation(nationality_by_edition, strengths, seed=7).simulate_day(DAY, fixtures)
+    with ShardedSimulation(nationality_by_edition, strengths, workers=2, seed=7) as simulation:
+        sharded = simulation.simulate_day(DAY, fixtures)
+
+    assert _scores(inline) == _scores(sharded)
+    assert list(sharded.matches_by_nation) == [1, 2, 3]
+    assert [m.fixture_id for m in sharded.cross_nation_matches] == [99]
+
+
+def test_serialized_phases_run_after_merge_from_scheduler():
+    fixtures, nationality_by_edition, strengths = _world()
+    scheduler = SimulationScheduler(GameState(sim_date=date(2025, 8, 1), is_simulation_running=True))
+    seen = []
+    simulation = ShardedSimulation(nationality_by_edition, strengths)
+    simulation.register_serialized(lambda result: seen.append((result.day, len(result.matches))))
+    simulation.attach(scheduler, fixtures)
+
+    scheduler.advance_days(30)
+    assert seen == [(DAY, 13)]
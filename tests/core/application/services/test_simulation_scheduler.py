@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+from champyons.core.application.services.simulation_scheduler import SimulationScheduler
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.enums.simulation import SimulationEventType
+
+
+@pytest.fixture
+def scheduler():
+    state = GameState(sim_date=date(2025, 7, 1), start_sim_date=date(2025, 7, 1))
+    state.start()
+    return SimulationScheduler(state)
+
+
+def test_tick_jumps_to_next_event_date(scheduler):
+    scheduler.schedule(date(2026, 5, 31), SimulationEventType.SEASON_END)
+    scheduler.schedule(date(2025, 9, 1), SimulationEventType.TRANSFER_WINDOW_CLOSE, window="summer")
+
+    report = scheduler.tick()
+
+    assert report.date == date(2025, 9, 1)
+    assert report.days_advanced == 62
+    assert scheduler.game_state.sim_date == date(2025, 9, 1)
+    assert [e.payload["window"] for e in report.events] == ["summer"]
+
+
+def test_same_day_events_run_by_phase_and_handlers_can_schedule(scheduler):
+    processed = []
+    day = date(2025, 8, 15)
+
+    def on_matchday(event, sched):
+        processed.append(event.type)
+        sched.schedule(day, SimulationEventType.SEASON_END)
+
+    scheduler.register(SimulationEventType.MATCHDAY, on_matchday)
+    scheduler.register(SimulationEventType.SEASON_END, lambda event, sched: processed.append(event.type))
+    scheduler.register(SimulationEventType.CONTRACT_EXPIRY, lambda event, sched: processed.append(event.type))
+    scheduler.schedule(day, SimulationEventType.MATCHDAY)
+    scheduler.schedule(day, SimulationEventType.CONTRACT_EXPIRY)
+
+    report = scheduler.tick()
+
+    assert processed == [SimulationEventType.CONTRACT_EXPIRY, SimulationEventType.MATCHDAY, SimulationEventType.SEASON_END]
+    assert set(report.phase_timings) == set(processed)
+    assert len(scheduler) == 0
+
+
+def test_advance_to_skips_idle_days_and_cancelled_events(scheduler):
+    kept = scheduler.schedule(date(2025, 8, 1), SimulationEventType.TRANSFER_WINDOW_OPEN)
+    cancelled = scheduler.schedule(date(2025, 8, 2), SimulationEventType.MATCHDAY)
+    scheduler.schedule(date(2026, 1, 1), SimulationEventType.MATCHDAY)
+    scheduler.cancel(cancelled)
+
+    reports = scheduler.advance_to(date(2025, 12, 31))
+
+    assert [r.events for r in reports] == [[kept]]
+    assert scheduler.game_state.sim_date == date(2025, 12, 31)
+    assert scheduler.next_event_date == date(2026, 1, 1)
+
+
+def test_cannot_schedule_in_the_past(scheduler):
+    with pytest.raises(ValueError):
+        scheduler.schedule(date(2025, 6, 30), SimulationEventType.MATCHDAY)
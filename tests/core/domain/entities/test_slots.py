@@ -0,0 +1,48 @@
+import weakref
+from dataclasses import replace
+
+import pytest
+
+from champyons.core.domain.entities.geography import City, Continent, Country, LocalRegion, Nationality, Region
+from champyons.core.domain.entities.people.player_profile import PlayerProfile
+
+
+def _entities():
+    spain = Country(id=1, name="Spain", code="ESP")
+    return [
+        City(id=1, name="Madrid", country_id=1),
+        spain,
+        LocalRegion(id=1, name="Community of Madrid", country_id=1),
+        Region(id=1, name="Iberia"),
+        Continent(id=1, code="EU", name="Europe"),
+        Nationality(id=1, entity_id=1, entity=spain),
+        PlayerProfile(id=1, person_id=1),
+    ]
+
+
+@pytest.mark.parametrize("entity", _entities(), ids=lambda e: type(e).__name__)
+def test_entities_are_slotted_and_weak_referenceable(entity):
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.not_a_field = 1
+    assert weakref.ref(entity)() is entity
+
+
+def test_dirty_tracking_on_slotted_entity():
+    city = City(id=1, name="Madrid", country_id=1)
+    modified = []
+    city.mark_clean(modified.append)
+    assert not city.is_dirty
+
+    city.altitude = 650
+    city.latitude = 40.4
+
+    assert city.dirty_fields == {"altitude", "latitude"}
+    assert modified == [city]
+
+
+def test_tracking_state_is_not_part_of_equality():
+    city = City(id=1, name="Madrid", country_id=1)
+    copy = replace(city)
+    city.mark_clean()
+    assert city == copy
@@ -0,0 +1,32 @@
+import numpy as np
+
+from champyons.core.domain.services.columnar import NO_ID, ColumnarRows, ColumnSpec
+
+
+def _rows(capacity=2):
+    return ColumnarRows({"value": ColumnSpec(np.float32, (2,)), "tag": ColumnSpec(np.int64, fill=NO_ID)}, capacity)
+
+
+def test_rows_grow_and_keep_values():
+    rows = _rows()
+    for entity_id in range(10, 15):
+        row = rows.row_for(entity_id)
+        rows.value[row] = entity_id
+    assert len(rows) == 5 and len(rows.ids) == 8
+    assert rows.value[rows.rows[14]].tolist() == [14, 14]
+    assert rows.tag[:rows.size].tolist() == [NO_ID] * 5
+    assert rows.live_mask().all()
+
+
+def test_removed_rows_are_recycled():
+    rows = _rows()
+    for entity_id in (1, 2, 3):
+        rows.row_for(entity_id)
+    freed = rows.rows[2]
+    rows.remove(2)
+    assert 2 not in rows and rows.ids[freed] == NO_ID
+    assert rows.live_mask().tolist() == [True, False, True]
+
+    assert rows.row_for(4) == freed and rows.size == 3
+    assert rows.row_for(4) == freed # existing ids keep their row
+    assert rows.live_mask().all()
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.services.distances import CityDistances, haversine_matrix
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint, haversine_km
+
+POINTS = {
+    1: GeoPoint(40.4168, -3.7038),   # Madrid
+    2: GeoPoint(41.3874, 2.1686),    # Barcelona
+    3: GeoPoint(37.3891, -5.9845),   # Sevilla
+    4: GeoPoint(43.2630, -2.9350),   # Bilbao
+    5: GeoPoint(28.1235, -15.4363),  # Las Palmas
+}
+
+
+def test_vectorized_haversine_matches_scalar():
+    rng = np.random.default_rng(3)
+    lat, lon = rng.uniform(-90, 90, 50), rng.uniform(-180, 180, 50)
+    matrix = haversine_matrix(lat, lon, lat, lon)
+    assert matrix.shape == (50, 50)
+    assert np.allclose(np.diag(matrix), 0)
+    for i, j in [(0, 1), (7, 42), (30, 3)]:
+        assert matrix[i, j] == pytest.approx(haversine_km(lat[i], lon[i], lat[j], lon[j]))
+
+
+def test_dense_matrix_is_cached_per_group():
+    distances = CityDistances(POINTS)
+    league = distances.matrix([4, 1, 2, 3])
+    assert league is distances.matrix([1, 2, 3, 4])
+    assert league[1, 2] == pytest.approx(POINTS[1].distance_km(POINTS[2]))
+    assert league[2, 1] == league[1, 2] and 5 not in league
+    with pytest.raises(ValueError):
+        distances.matrix([1, 99])
+
+
+def test_sparse_cache_and_persistence_rows():
+    distances = CityDistances(POINTS)
+    values = distances.distances([(1, 2), (2, 1), (5, 3)])
+    assert values[0] == values[1] == pytest.approx(POINTS[1].distance_km(POINTS[2]))
+    rows = distances.drain_new()
+    assert sorted((a, b) for a, b, _ in rows) == [(1, 2), (3, 5)]
+    assert distances.drain_new() == []
+
+    restored = CityDistances(POINTS)
+    restored.preload(rows)
+    assert restored.distance(3, 5) == pytest.approx(values[2])
+    assert restored.drain_new() == []
+
+
+def test_update_city_evicts_its_pairs_and_matrices():
+    distances = CityDistances(POINTS)
+    madrid_league, other_league = distances.matrix([1, 2, 3]), distances.matrix([2, 4])
+    distances.preload([(1, 5, 1700.0), (2, 4, 470.0)])
+    distances.distances([(1, 3)])
+
+    toledo = GeoPoint(39.8628, -4.0273)
+    distances.update_city(1, toledo)
+
+    assert distances.matrix([1, 2, 3]) is not madrid_league
+    assert distances.matrix([1, 2, 3])[1, 2] == pytest.approx(toledo.distance_km(POINTS[2]))
+    assert distances.matrix([2, 4]) is other_league
+    assert distances.distance(1, 5) == pytest.approx(toledo.distance_km(POINTS[5]))
+    assert distances.distance(2, 4) == 470.0
+    assert [(a, b) for a, b, _ in distances.drain_new()] == [(1, 5)] # the stale (1, 3) is not saved
+
+    distances.update_city(6, GeoPoint(36.7213, -4.4214)) # Malaga, new
+    assert distances.distance(6, 3) == pytest.approx(haversine_km(36.7213, -4.4214, 37.3891, -5.9845))
+    distances.update_city(6, None)
+    assert 6 not in distances
+    with pytest.raises(ValueError):
+        distances.distance(6, 3)
+
+
+def test_travel_km_per_fixture():
+    distances = CityDistances(POINTS)
+    fixtures = [
+        Fixture(home_team_id=10, away_team_id=20),
+        Fixture(home_team_id=30, away_team_id=10),
+        Fixture(home_team_id=10, away_team_id=99),
+    ]
+    travel = distances.travel_km(fixtures, {10: 1, 20: 2, 30: 5})
+    assert travel[0] == pytest.approx(POINTS[1].distance_km(POINTS[2]))
+    assert travel[1] == pytest.approx(POINTS[1].distance_km(POINTS[5]))
+    assert np.isnan(travel[2])
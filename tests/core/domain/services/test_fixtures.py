@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+
+from champyons.core.domain.entities.competitions import CompetitionEdition, CompetitionStage, CompetitionTemplate
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.enums.competition import StageFormat
+from champyons.core.domain.services.fixtures import FixtureGenerator, knockout_pairings, round_robin_pattern
+from champyons.core.domain.value_objects.football.stage_base import StageRulesBase
+
+SEASON = Season(start_date=date(2025, 7, 1), end_date=date(2026, 6, 30))
+
+
+def _edition(stage: CompetitionStage, teams: int) -> CompetitionEdition:
+    return CompetitionEdition(
+        id=1,
+        template=CompetitionTemplate(name="Test", stages=[stage]),
+        season=SEASON,
+        team_ids=list(range(100, 100 + teams)),
+    )
+
+
+@pytest.mark.parametrize("teams", [2, 5, 18, 20])
+def test_round_robin_pattern_is_complete(teams):
+    pattern = round_robin_pattern(teams, legs=2)
+    matches = [tuple(match) for match in pattern.reshape(-1, 2).tolist()]
+
+    assert len(set(matches)) == teams * (teams - 1)
+    assert all(len(set(team for match in rnd.tolist() for team in match)) == 2 * (teams // 2) for rnd in pattern)
+
+
+@pytest.mark.parametrize("legs", [1, 2, 4])
+@pytest.mark.parametrize("teams", [4, 5, 18, 20])
+def test_round_robin_has_at_most_one_break_per_leg(teams, legs):
+    venues = {team: [] for team in range(teams)}
+    for home, away in round_robin_pattern(teams, legs).reshape(-1, 2).tolist():
+        venues[home].append("H")
+        venues[away].append("A")
+    breaks = {team: sum(a == b for a, b in zip(v, v[1:])) for team, v in venues.items()}
+
+    assert max(breaks.values()) <= legs
+
+
+def test_league_fixtures_are_dated_on_weekends_within_season():
+    stage = CompetitionStage(name="League", format=StageFormat.ROUND_ROBIN, start_day=30, end_day=320)
+    edition = _edition(stage, 20)
+
+    fixtures = FixtureGenerator().generate_edition(edition)
+    dates = sorted({f.match_date for f in fixtures})
+
+    assert len(fixtures) == 380
+    assert len(dates) == 38
+    assert all(d.weekday() == 5 for d in dates)
+    assert dates[0] >= date(2025, 7, 31) and dates[-1] <= date(2026, 5, 17)
+
+
+def test_group_stage_draws_one_team_per_pot():
+    stage = CompetitionStage(format=StageFormat.GROUPS, rules=StageRulesBase(legs=2, group_count=8))
+    edition = _edition(stage, 32)
+
+    fixtures = FixtureGenerator().generate_edition(edition)
+
+    assert [len(g.team_ids) for g in edition.groups] == [4] * 8
+    assert edition.groups[0].team_ids == [100, 115, 116, 131]
+    assert len(fixtures) == 8 * 12
+
+
+def test_group_fixtures_carry_their_group_id():
+    stage = CompetitionStage(format=StageFormat.GROUPS, rules=StageRulesBase(legs=2, group_count=4))
+    edition = _edition(stage, 16)
+
+    fixtures = FixtureGenerator(first_group_id=11).generate_edition(edition)
+
+    assert [g.id for g in edition.groups] == [11, 12, 13, 14]
+    for group in edition.groups:
+        teams = {team for f in fixtures if f.group_id == group.id for team in (f.home_team_id, f.away_team_id)}
+        assert teams == set(group.team_ids)
+    assert sum(f.group_id == edition.groups[0].id for f in fixtures) == 12
+
+
+def test_knockout_gives_byes_to_best_seeds():
+    stage = CompetitionStage(format=StageFormat.KNOCKOUT, rules=StageRulesBase(legs=2))
+    edition = _edition(stage, 6)
+    generator = FixtureGenerator()
+
+    first_round = generator.generate_edition(edition)
+    semis = generator.next_knockout_round(edition, stage, 2, [100, 103, 101, 102])
+
+    assert knockout_pairings(6) == ((0, None), (3, 4), (1, None), (2, 5))
+    assert [(f.leg, f.home_team_id, f.away_team_id) for f in first_round] == [(1, 104, 103), (1, 105, 102), (2, 103, 104), (2, 102, 105)]
+    assert max(f.match_date for f in first_round) < min(f.match_date for f in semis)
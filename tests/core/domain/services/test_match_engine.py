@@ -0,0 +1,45 @@
+import numpy as np
+
+from champyons.core.domain.entities.matches import Fixture
+from champyons.core.domain.enums.match import MatchEventType
+from champyons.core.domain.services.match_engine import MatchEngine
+from champyons.core.domain.value_objects.football.team_strength import TeamStrength
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+FIXTURES = [Fixture(id=i, home_team_id=2 * i + 1, away_team_id=2 * i + 2) for i in range(200)]
+
+
+def test_same_seed_gives_same_matches():
+    engine = MatchEngine()
+
+    first = engine.simulate(FIXTURES, {}, rng=42)
+    second = engine.simulate(FIXTURES, {}, rng=42)
+
+    assert first == second
+
+
+def test_events_match_scores_and_are_sorted():
+    for match in MatchEngine().simulate(FIXTURES, {}, rng=7):
+        goals = [e for e in match.events if e.type == MatchEventType.GOAL]
+        assert sum(e.team_id == match.home_team_id for e in goals) == match.home_goals
+        assert sum(e.team_id == match.away_team_id for e in goals) == match.away_goals
+        assert len(match.events) == len(goals)
+        assert [e.minute for e in match.events] == sorted(e.minute for e in match.events)
+
+
+def test_stronger_teams_score_more():
+    engine = MatchEngine()
+    n = 20_000
+
+    scores = engine.simulate_scores(np.full(n, 16.0), np.full(n, 16.0), np.full(n, 8.0), np.full(n, 8.0), rng=1)
+
+    assert scores.home_goals.mean() > 2 * scores.away_goals.mean()
+    assert (scores.home_shots >= scores.home_goals).all()
+
+
+def test_team_strength_from_lineup():
+    lineup = [PlayerSkills(shooting=20, passing=20, dribbling=20, stamina=0, strength=0)] * 11
+
+    strength = TeamStrength.from_lineup(lineup)
+
+    assert strength.attack > strength.defense
@@ -0,0 +1,115 @@
+import random
+from collections import Counter
+
+import pytest
+
+from champyons.core.domain.entities.geography import City, Country, LocalRegion, Region
+from champyons.core.domain.enums.geography import GeographyType as G
+from champyons.core.domain.services.player import PlayerGenerator
+from champyons.core.domain.services.population import PopulationRollups
+
+
+@pytest.fixture()
+def world():
+    iberia = Region(id=1, name="Iberia")
+    countries = [
+        Country(id=1, code="ES", name="Spain", continent_id=1, regions=[iberia]),
+        Country(id=2, code="GB", name="United Kingdom", continent_id=1),
+        Country(id=3, code="GB-ENG", name="England", parent_id=2),
+    ]
+    local_regions = [
+        LocalRegion(id=1, name="Andalusia", country_id=1),
+        LocalRegion(id=2, name="Sevilla", country_id=1, parent_local_region_id=1),
+    ]
+    cities = [
+        City(id=1, name="Sevilla", country_id=1, local_region_id=2),
+        City(id=2, name="Cordoba", country_id=1, local_region_id=1),
+        City(id=3, name="Madrid", country_id=1),
+        City(id=4, name="London", country_id=3),
+    ]
+    for city, population in zip(cities, [700_000, 300_000, 3_000_000, 9_000_000]):
+        city.update_population(population)
+    return countries, local_regions, cities
+
+
+def test_totals_roll_up_the_hierarchy(world):
+    countries, local_regions, cities = world
+    rollups = PopulationRollups.from_entities(*world)
+    sevilla, cordoba, madrid, london = (c.population for c in cities)
+    assert rollups.total(G.LOCAL_REGION, 2) == sevilla
+    assert rollups.total(G.LOCAL_REGION, 1) == sevilla + cordoba
+    assert rollups.total(G.COUNTRY, 1) == rollups.total(G.REGION, 1) == sevilla + cordoba + madrid
+    assert rollups.total(G.COUNTRY, 2) == rollups.total(G.COUNTRY, 3) == london
+    assert rollups.total(G.CONTINENT, 1) == sum(c.population for c in cities)
+    assert rollups.totals(G.LOCAL_REGION) == {1: sevilla + cordoba, 2: sevilla}
+
+
+def test_population_changes_and_moves_are_incremental(world):
+    countries, local_regions, cities = world
+    rollups = PopulationRollups.from_entities(*world)
+    sampler = rollups.sampler(G.LOCAL_REGION, 1)
+    assert rollups.sampler(G.LOCAL_REGION, 1) is sampler
+
+    sevilla, cordoba, madrid, _ = cities
+    cordoba.update_population(2_000_000)
+    assert rollups.total(G.LOCAL_REGION, 1) == sevilla.population + cordoba.population
+    assert rollups.sampler(G.LOCAL_REGION, 1) is not sampler
+
+    madrid.move_to(1, local_region_id=1)
+    assert rollups.total(G.LOCAL_REGION, 1) == sevilla.population + cordoba.population + madrid.population
+    assert rollups.total(G.COUNTRY, 1) == sevilla.population + cordoba.population + madrid.population
+
+    rollups.untrack(madrid.id)
+    madrid.update_population(10)
+    assert rollups.total(G.COUNTRY, 1) == sevilla.population + cordoba.population
+
+
+def test_direct_assignments_reach_the_rollups(world):
+    countries, local_regions, cities = world
+    rollups = PopulationRollups.from_entities(*world)
+    sevilla, cordoba, madrid, london = cities
+
+    cordoba.population_range = madrid.population_range
+    assert rollups.total(G.LOCAL_REGION, 1) == sevilla.population + madrid.population
+    london.country_id = 1
+    assert rollups.total(G.COUNTRY, 2) == 0
+    sevilla.local_region_id = None
+    assert rollups.total(G.LOCAL_REGION, 2) == 0
+    assert rollups.total(G.COUNTRY, 1) == sum(c.population for c in cities)
+
+
+def test_readded_hierarchy_refreshes_tracked_cities(world):
+    countries, local_regions, cities = world
+    rollups = PopulationRollups.from_entities(*world)
+    spain, uk, england = countries
+    sevilla, cordoba, madrid, london = cities
+
+    spain.regions.clear()
+    spain.parent_id = 2
+    rollups.add_country(spain)
+    assert rollups.total(G.REGION, 1) == 0
+    assert rollups.total(G.COUNTRY, 2) == london.population + sevilla.population + cordoba.population + madrid.population
+
+    andalusia, province = local_regions
+    province.parent_local_region_id = None
+    rollups.add_local_region(province)
+    assert rollups.total(G.LOCAL_REGION, 1) == cordoba.population
+
+
+def test_sampler_draws_by_population(world):
+    rollups = PopulationRollups.from_entities(*world)
+    sampler = rollups.sampler(G.COUNTRY, 1)
+    rng = random.Random(5)
+    draws = Counter(sampler.draw(rng) for _ in range(20_000))
+    shares = {city_id: draws[city_id] / 20_000 for city_id in sampler.city_ids}
+    for city_id, share in shares.items():
+        assert share == pytest.approx(rollups.city(city_id).population / sampler.total, abs=0.02)
+    with pytest.raises(ValueError):
+        rollups.sampler(G.COUNTRY, 99).draw(rng)
+
+
+def test_player_generator_draws_from_the_rollups(world):
+    countries, _, _ = world
+    rollups = PopulationRollups.from_entities(*world)
+    generator = PlayerGenerator(rollups=rollups, rng=random.Random(1))
+    assert generator._select_city_by_population(countries[1]).name == "London"
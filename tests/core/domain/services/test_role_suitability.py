@@ -0,0 +1,60 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from champyons.core.domain.enums.player_roles import PositionAttackingRoles, PositionDefendingRoles
+from champyons.core.domain.services.role_suitability import (
+    RoleSuitabilityCache,
+    get_role_weight_table,
+    skills_matrix,
+)
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+
+def test_role_weight_table_covers_every_role():
+    table = get_role_weight_table()
+
+    assert len(table.roles) == len(PositionAttackingRoles) + len(PositionDefendingRoles)
+    assert np.allclose(table.weights.sum(axis=1), 1.0)
+
+
+def test_role_score_matches_position_weighted_total():
+    skills = PlayerSkills(shooting=18, passing=12, dribbling=15, stamina=9, strength=7)
+    table = get_role_weight_table()
+
+    scores = table.score(skills_matrix([skills]))[0]
+
+    assert scores[table.index_of(PositionAttackingRoles.ST_POACHER)] == pytest.approx(skills.weighted_total("ST"))
+    assert scores[table.index_of(PositionDefendingRoles.CB_STOPPING)] == pytest.approx(skills.weighted_total("CB"))
+
+
+def test_roles_of_unweighted_positions_are_uniform():
+    table = get_role_weight_table()
+    uniform = np.full(len(table.skill_names), 1 / len(table.skill_names))
+
+    for role in (PositionAttackingRoles.GK, PositionAttackingRoles.FB, PositionDefendingRoles.WB, PositionDefendingRoles.DM):
+        assert np.allclose(table.weights[table.index_of(role)], uniform)
+    assert not np.allclose(table.weights[table.index_of(PositionAttackingRoles.ST_POACHER)], uniform)
+
+
+def test_suitability_cache_recomputes_after_skill_change():
+    cache = RoleSuitabilityCache()
+    skills = PlayerSkills(shooting=5)
+    striker = cache.table.index_of(PositionAttackingRoles.ST_POACHER)
+
+    before = cache.get(1, skills)[striker]
+    skills = replace(skills, shooting=20)
+    after = cache.get(1, skills)[striker]
+
+    assert after > before
+    assert len(cache) == 1
+
+
+def test_suitability_cache_best_roles():
+    cache = RoleSuitabilityCache()
+    skills = PlayerSkills(shooting=20, dribbling=20, stamina=1, strength=1)
+
+    best = cache.best_roles(7, skills, roles=[PositionAttackingRoles.ST_POACHER, PositionAttackingRoles.CB], k=1)
+
+    assert best[0][0] == PositionAttackingRoles.ST_POACHER
@@ -0,0 +1,73 @@
+from datetime import date
+
+import pytest
+
+from champyons.core.domain.services.scouting import ScoutingEntry, ScoutingIndex, ScoutingQuery
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+TODAY = date(2025, 7, 1)
+
+
+def _entry(profile_id, country_id=1, positions=("LB",), born=date(2005, 1, 1), **skills):
+    return ScoutingEntry(
+        profile_id=profile_id,
+        skills=PlayerSkills(**skills),
+        positions=PositionSet.from_positions(positions),
+        date_of_birth=born,
+        country_id=country_id,
+    )
+
+
+@pytest.fixture
+def index():
+    index = ScoutingIndex({1: 10, 2: 10, 3: 20})
+    index.upsert_many([
+        _entry(1, passing=15, stamina=15),
+        _entry(2, passing=18, stamina=18),
+        _entry(3, positions=("ST",), shooting=20),
+        _entry(4, born=date(1995, 1, 1), passing=20, stamina=20),
+        _entry(5, country_id=3, passing=19, stamina=19),
+    ])
+    return index
+
+
+def test_query_filters_region_position_and_age(index):
+    query = ScoutingQuery.for_position("LB", region_ids=frozenset({10}), max_age=22, k=10, reference_date=TODAY)
+
+    assert [r.profile_id for r in index.query(query)] == [2, 1]
+
+
+def test_query_returns_top_k_across_regions(index):
+    query = ScoutingQuery.for_position("LB", k=2, reference_date=TODAY)
+
+    assert [r.profile_id for r in index.query(query)] == [4, 5]
+
+
+def test_upsert_moves_profile_and_remove_drops_it(index):
+    index.upsert(_entry(1, country_id=3, passing=20, stamina=20))
+    index.remove(5)
+    query = ScoutingQuery.for_position("LB", region_ids=frozenset({20}), reference_date=TODAY)
+
+    assert [r.profile_id for r in index.query(query)] == [1]
+    assert len(index) == 4
+
+
+def test_partition_grows_and_reuses_removed_rows():
+    index = ScoutingIndex({1: 10})
+    index.upsert_many(_entry(i, passing=i % 20) for i in range(200))
+    for i in range(100):
+        index.remove(i)
+    index.upsert_many(_entry(i, passing=1) for i in range(1000, 1050))
+
+    results = index.query(ScoutingQuery(min_skills={"passing": 19}, k=100, reference_date=TODAY))
+
+    assert len(index) == 150
+    assert sorted(r.profile_id for r in results) == [119, 139, 159, 179, 199]
+
+
+def test_positions_without_declared_weights_rank_by_equal_weights():
+    query = ScoutingQuery.for_position("LB")
+
+    assert query.weights == {}
+    assert len(set(query.weight_vector())) == 1
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from champyons.core.domain.services.similarity import BruteForceSimilarityIndex, IVFSimilarityIndex
+from champyons.core.domain.value_objects.player.player_positions import PositionSet
+from champyons.core.domain.value_objects.player.player_skills import PlayerSkills
+
+STRIKER = PositionSet.from_positions(["ST"])
+CENTER_BACK = PositionSet.from_positions(["CB"])
+
+
+def _players(n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(0, 20, size=(n, 5))
+    return [
+        (i, PlayerSkills(*row), STRIKER if i % 2 else CENTER_BACK)
+        for i, row in enumerate(values)
+    ]
+
+
+def test_brute_force_matches_naive_distances():
+    players = _players(300)
+    index = BruteForceSimilarityIndex()
+    for player in players:
+        index.upsert(*player)
+
+    target = PlayerSkills(12, 8, 15, 10, 5)
+    expected = sorted(
+        players,
+        key=lambda p: sum((getattr(p[1], name) - getattr(target, name)) ** 2 for name in ("shooting", "passing", "dribbling", "stamina", "strength"))
+    )[:5]
+
+    assert [m.profile_id for m in index.search(target, k=5)] == [p[0] for p in expected]
+
+
+def test_similar_to_excludes_player_and_filters_positions():
+    index = BruteForceSimilarityIndex()
+    for player in _players(100):
+        index.upsert(*player)
+    index.remove(3)
+
+    matches = index.similar_to(1, k=10, positions=STRIKER)
+
+    assert len(matches) == 10
+    assert all(m.profile_id % 2 == 1 for m in matches)
+    assert {1, 3}.isdisjoint(m.profile_id for m in matches)
+    assert matches == sorted(matches, key=lambda m: m.distance)
+
+
+def test_ivf_probing_every_list_is_exact():
+    players = _players(500)
+    brute = BruteForceSimilarityIndex()
+    for player in players:
+        brute.upsert(*player)
+    ivf = IVFSimilarityIndex.from_players(players, n_lists=16, nprobe=16)
+
+    for profile_id in (0, 7, 250):
+        assert ivf.similar_to(profile_id, k=8) == brute.similar_to(profile_id, k=8)
+
+
+def test_ivf_supports_incremental_inserts_and_deletes():
+    ivf = IVFSimilarityIndex.from_players(_players(200), n_lists=8, nprobe=8)
+    ivf.upsert(1000, PlayerSkills(20, 20, 20, 20, 20), STRIKER)
+    ivf.remove(0)
+
+    assert ivf.search(PlayerSkills(20, 20, 20, 20, 20), k=1)[0].profile_id == 1000
+    assert 0 not in ivf
+    assert len(ivf) == 200
+
+
+def test_ivf_requires_training_before_insert():
+    with pytest.raises(ValueError):
+        IVFSimilarityIndex().upsert(1, PlayerSkills(), STRIKER)
@@ -0,0 +1,55 @@
+from champyons.core.domain.entities.matches import Fixture, Match
+from champyons.core.domain.enums.competition import Tiebreaker
+from champyons.core.domain.services.fixtures import round_robin_pattern
+from champyons.core.domain.services.match_engine import MatchEngine
+from champyons.core.domain.services.standings import GroupStandings
+from champyons.core.domain.value_objects.football.competition_rules import CompetitionRules
+
+
+def _match(home, away, home_goals, away_goals):
+    return Match(home_team_id=home, away_team_id=away, home_goals=home_goals, away_goals=away_goals)
+
+
+def test_incremental_table_matches_full_recomputation():
+    teams = list(range(1, 21))
+    fixtures = [Fixture(home_team_id=teams[h], away_team_id=teams[a]) for h, a in round_robin_pattern(20).reshape(-1, 2).tolist()]
+    matches = MatchEngine().simulate(fixtures, {}, rng=3, with_events=False)
+    rules = CompetitionRules(tiebreakers=(Tiebreaker.GOAL_DIFFERENCE, Tiebreaker.GOALS_FOR))
+
+    standings = GroupStandings(teams, rules)
+    standings.apply_many(matches)
+
+    expected = sorted(
+        teams,
+        key=lambda t: (
+            -sum(3 if (m.home_team_id == t and m.home_goals > m.away_goals) or (m.away_team_id == t and m.away_goals > m.home_goals) else 1 if m.is_draw and t in (m.home_team_id, m.away_team_id) else 0 for m in matches),
+            -sum((m.home_goals - m.away_goals) if m.home_team_id == t else (m.away_goals - m.home_goals) if m.away_team_id == t else 0 for m in matches),
+            -sum(m.home_goals if m.home_team_id == t else m.away_goals if m.away_team_id == t else 0 for m in matches),
+            t,
+        ),
+    )
+    assert [row.team_id for row in standings.table()] == expected
+    assert all(row.played == 38 for row in standings.table())
+
+
+def test_head_to_head_breaks_ties_on_points():
+    standings = GroupStandings([1, 2, 3], CompetitionRules(tiebreakers=(Tiebreaker.HEAD_TO_HEAD_POINTS, Tiebreaker.GOAL_DIFFERENCE)))
+    standings.apply_many([_match(1, 2, 0, 5), _match(2, 3, 0, 1), _match(3, 1, 0, 1)])
+
+    # All on 3 points: 1 beat 3, 3 beat 2, 2 beat 1 -> head to head level, goal difference decides
+    assert [row.team_id for row in standings.table()] == [2, 3, 1]
+
+    standings.apply(_match(1, 2, 1, 0))
+    assert standings.position(1) == 1
+
+
+def test_snapshots_keep_past_tables():
+    standings = GroupStandings([1, 2])
+    standings.apply(_match(1, 2, 2, 0))
+    first = standings.snapshot(1)
+    standings.apply(_match(2, 1, 3, 0))
+    second = standings.snapshot(2)
+
+    assert first.position(1) == 1 and first.rows[0].points == 3
+    assert second.position(2) == 1
+    assert standings.history[1] is first
@@ -0,0 +1,52 @@
+from datetime import date, datetime, timedelta, UTC
+
+import pytest
+
+from champyons.core.application.services.simulation_scheduler import SimulationScheduler
+from champyons.core.domain.entities.game.game_state import GameState
+from champyons.core.domain.entities.game.season import Season
+from champyons.core.domain.enums.simulation import SimulationEventType
+from champyons.core.domain.services.transfer_calendar import TransferWindowCalendar
+from champyons.core.domain.value_objects.football.federation_rules import FederationRules
+from champyons.core.domain.value_objects.game.transfer_window import TransferWindow
+
+
+@pytest.fixture
+def calendar():
+    season = Season(
+        start_date=date(2025, 7, 1),
+        end_date=date(2026, 6, 30),
+        default_transfer_window_1=TransferWindow(date(2025, 8, 1), date(2025, 8, 15)),
+    )
+    return TransferWindowCalendar.for_season(season, {
+        1: FederationRules.default(),
+        2: FederationRules(window_1_start_month=7, window_1_start_day=15, window_1_duration_days=30, time_offset=2),
+        3: None,
+    })
+
+
+def test_open_nationalities_matches_transfer_windows(calendar):
+    moments = [datetime(2025, 6, 30, tzinfo=UTC) + timedelta(hours=h) for h in range(0, 24 * 250, 7)]
+    for moment in moments:
+        expected = {n for n, ws in calendar.windows.items() if any(w.check_transfer_market_open(moment) for w in ws)}
+        assert calendar.open_nationalities(moment) == expected, moment
+
+
+def test_windows_are_open_intervals(calendar):
+    start = FederationRules.default().get_transfer_window(2025, 1).start_datetime
+
+    assert not calendar.is_open(1, start)
+    assert calendar.is_open(1, start + timedelta(seconds=1))
+    assert calendar.next_change(start) == datetime(2025, 7, 14, 22, tzinfo=UTC)
+
+
+def test_schedule_events_groups_nationalities(calendar):
+    state = GameState(sim_date=date(2025, 7, 10))
+    scheduler = SimulationScheduler(state)
+
+    assert calendar.schedule_events(scheduler) == 7
+
+    state.start()
+    report = scheduler.tick()
+    assert report.date == date(2025, 7, 15)
+    assert [(e.type, e.payload["nationality_ids"]) for e in report.events] == [(SimulationEventType.TRANSFER_WINDOW_OPEN, (2,))]
@@ -0,0 +1,30 @@
+import pytest
+
+from champyons.core.domain.value_objects.geography.coordinates import GeoPoint, haversine_km
+
+MADRID = GeoPoint(40.4168, -3.7038)
+BARCELONA = GeoPoint(41.3874, 2.1686)
+
+
+def test_haversine_distance():
+    assert MADRID.distance_km(BARCELONA) == pytest.approx(505, abs=2)
+    assert haversine_km(0, 0, 0, 180) == pytest.approx(20015, abs=1)
+    assert MADRID.distance_km(MADRID) == 0
+
+
+def test_invalid_points():
+    with pytest.raises(ValueError):
+        GeoPoint(91, 0)
+    with pytest.raises(ValueError):
+        GeoPoint(0, -181)
+
+
+def test_bounding_boxes():
+    [(min_lat, max_lat, min_lon, max_lon)] = MADRID.bounding_boxes(600)
+    assert min_lat <= BARCELONA.latitude <= max_lat and min_lon <= BARCELONA.longitude <= max_lon
+    # crossing the antimeridian splits the box in two
+    fiji = GeoPoint(-17.7, 179.5)
+    boxes = fiji.bounding_boxes(200)
+    assert len(boxes) == 2 and {box[3] for box in boxes} >= {180.0}
+    # close to a pole every longitude is inside
+    assert GeoPoint(89.5, 10).bounding_boxes(100) == [(pytest.approx(88.6, abs=0.1), 90.0, -180.0, 180.0)]
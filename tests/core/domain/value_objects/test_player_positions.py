@@ -0,0 +1,39 @@
+import pytest
+
+from champyons.core.domain.enums.player_positions import Position
+from champyons.core.domain.value_objects.player.player_positions import (
+    PlayerPositionList,
+    PositionSet,
+)
+
+
+def test_position_set_membership_and_set_operations():
+    fullbacks = PositionSet.from_positions([Position.LB, "RB"])
+    left_side = PositionSet.from_positions([Position.LB, Position.LWB, Position.LM])
+
+    assert Position.LB in fullbacks
+    assert fullbacks.can_play("RB")
+    assert not fullbacks.can_play(Position.ST)
+    assert len(fullbacks) == 2
+
+    assert (fullbacks & left_side).to_codes() == ["LB"]
+    assert (fullbacks | left_side) == PositionSet.from_positions(["LB", "RB", "LWB", "LM"])
+    assert (left_side - fullbacks).to_codes() == ["LWB", "LM"]
+    assert fullbacks.intersects(left_side)
+    assert PositionSet.from_positions(["LB"]).issubset(fullbacks)
+
+
+def test_position_set_rejects_invalid_mask():
+    with pytest.raises(ValueError):
+        PositionSet(-1)
+
+
+def test_player_position_list_deduplicates_and_drops_center_sides():
+    player_positions = PlayerPositionList([Position.ST, Position.LST, Position.ST, Position.LW])
+
+    assert player_positions.positions == (Position.ST, Position.LW)
+    assert Position.LW in player_positions
+    assert Position.LST not in player_positions
+    assert player_positions.position_set == PositionSet.from_positions(["ST", "LW"])
+    with pytest.raises(AttributeError):
+        player_positions.positions.append(Position.GK) # immutable, cannot drift from position_set